@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark for columnar and memory-mapped storage.
+
+Compares write time, read time (load plus one full pass over the values)
+and file size of the CSV/JSON paths used by main.py against the NPY,
+NPZ and Parquet column stores and the float32 memmap array store.
+
+Usage:
+    python benchmarks/bench_array_store.py [--rows 1000000] [--layouts 1000]
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.utils.array_store import (PYARROW_AVAILABLE, MemmapArrayStore, load_columnar,
+                                   save_columnar)
+
+
+def size_mb(path):
+    """Size of a file or directory in MB."""
+    path = Path(path)
+    files = path.rglob('*') if path.is_dir() else [path]
+    return sum(f.stat().st_size for f in files if f.is_file()) / 2 ** 20
+
+
+def timed(func):
+    """Return (result, seconds) for a single call."""
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def report(name, write_s, read_s, path):
+    """Print one benchmark row."""
+    print(f"   {name:<22} write {write_s:7.3f} s   read {read_s:7.3f} s   "
+          f"{size_mb(path):8.1f} MB")
+
+
+def bench_time_series(tmp_dir, n_rows):
+    """Wind time series: CSV vs columnar formats."""
+    rng = np.random.default_rng(42)
+    frame = pd.DataFrame({
+        'timestamp': np.arange(n_rows, dtype=np.int64) * 600,
+        'wind_speed': 8.0 * rng.weibull(2.0, n_rows),
+        'wind_direction': rng.uniform(0, 360, n_rows),
+    })
+
+    print(f"\n📈 Time series ({n_rows:,} rows)")
+    path = tmp_dir / 'wind.csv'
+    _, write_s = timed(lambda: frame.to_csv(path, index=False))
+    _, read_s = timed(lambda: pd.read_csv(path)['wind_speed'].sum())
+    report('CSV (pandas)', write_s, read_s, path)
+
+    formats = [('npy', 'wind_npy'), ('npz', 'wind.npz')]
+    if PYARROW_AVAILABLE:
+        formats.append(('parquet', 'wind.parquet'))
+    for file_format, name in formats:
+        path = tmp_dir / name
+        _, write_s = timed(lambda: save_columnar(frame, path, file_format))
+        _, read_s = timed(lambda: float(load_columnar(path)['wind_speed'].sum()))
+        report(file_format.upper(), write_s, read_s, path)
+
+
+def bench_layouts(tmp_dir, n_layouts, n_turbines):
+    """Layout populations: JSON vs memmap array store."""
+    rng = np.random.default_rng(42)
+    population = rng.uniform(0, 2000, size=(n_layouts, n_turbines, 2))
+
+    print(f"\n🗺️  Layout population ({n_layouts} x {n_turbines} turbines)")
+    path = tmp_dir / 'population.json'
+
+    def write_json():
+        with open(path, 'w') as f:
+            json.dump(population.tolist(), f)
+
+    def read_json():
+        with open(path) as f:
+            return np.asarray(json.load(f)).sum()
+
+    _, write_s = timed(write_json)
+    _, read_s = timed(read_json)
+    report('JSON', write_s, read_s, path)
+
+    store = MemmapArrayStore(tmp_dir / 'store')
+    _, write_s = timed(lambda: store.save('population', population))
+    _, read_s = timed(lambda: float(store.load('population').sum()))
+    report('memmap float32', write_s, read_s, store.path('population'))
+
+
+def main():
+    """Run the storage benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--layouts', type=int, default=1000)
+    parser.add_argument('--turbines', type=int, default=200)
+    args = parser.parse_args()
+
+    print("⏱️  Storage format benchmark")
+    print("=" * 72)
+    if not PYARROW_AVAILABLE:
+        print("   (pyarrow not installed, skipping Parquet)")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        bench_time_series(Path(tmp_dir), args.rows)
+        bench_layouts(Path(tmp_dir), args.layouts, args.turbines)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Benchmark of gradient-based layout refinement against the GA.
+
+Runs the GA on a seeded problem, then refines both a regular grid and the
+GA result with SLSQP and L-BFGS-B using analytic gradients. Every row
+reports layout evaluations, wall time and the AEP of the final layout under
+the reference Jensen model.
+
+Usage:
+    python benchmarks/bench_gradient_optimizer.py [--turbines 25] [--generations 100]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.models.gradient_optimizer import GradientLayoutOptimizer
+from src.models.optimizer import GeneticLayoutOptimizer, grid_layout
+from bench_wake_models import make_wind_rose
+
+
+def report(name, evaluations, runtime_s, aep, ideal):
+    """Print one benchmark row."""
+    print(f"   {name:<24} {evaluations:8d} evals  {runtime_s:7.2f} s  "
+          f"{aep:9.0f} MWh/yr  ({aep / ideal:6.1%} of wake-free)")
+
+
+def main():
+    """Run the gradient optimizer benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--turbines', type=int, default=25)
+    parser.add_argument('--generations', type=int, default=100)
+    parser.add_argument('--population', type=int, default=50)
+    args = parser.parse_args()
+
+    farm = {'farm_width': 2000, 'farm_height': 2000, 'min_turbine_distance': 300}
+    wind_rose = make_wind_rose()
+
+    print(f"⏱️  Gradient vs GA benchmark: {args.turbines} turbines")
+    print("=" * 78)
+
+    ga = GeneticLayoutOptimizer(farm, {'population_size': args.population, 'cache_size': 0})
+    ideal = ga.wake_model.ideal_aep(args.turbines, wind_rose)
+    ga_result = ga.optimize(wind_rose, n_turbines=args.turbines, generations=args.generations)
+    report(f"GA ({args.generations} gen)", ga_result['evaluations'], ga_result['runtime_s'],
+           ga_result['best_aep_mwh'], ideal)
+
+    grid = grid_layout(args.turbines, farm['farm_width'], farm['farm_height'])
+    report("Grid", 1, 0.0, float(ga.wake_model.calculate_aep(grid, wind_rose)), ideal)
+
+    for method in ('SLSQP', 'L-BFGS-B'):
+        refiner = GradientLayoutOptimizer(farm, {'method': method}, ga.wake_model)
+        for start_name, start in (('grid', grid), ('GA', ga_result['best_positions'])):
+            result = refiner.optimize(wind_rose, start)
+            total_evals = result['evaluations'] + (ga_result['evaluations']
+                                                   if start_name == 'GA' else 0)
+            total_time = result['runtime_s'] + (ga_result['runtime_s']
+                                                if start_name == 'GA' else 0.0)
+            report(f"{method} from {start_name}", total_evals, total_time,
+                   result['best_aep_mwh'], ideal)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark of incremental delta-AEP evaluation for single-turbine moves.
+
+Proposes random single-turbine moves (half committed, half rolled back)
+with IncrementalAEPEvaluator and reports moves per second for 50, 200
+and 500 turbines, against re-scoring the whole moved layout with
+JensenWakeModel.calculate_aep.
+
+Usage:
+    python benchmarks/bench_incremental_aep.py [--moves 2000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.models.incremental_aep import IncrementalAEPEvaluator
+from src.models.wake_models import JensenWakeModel
+from bench_wake_models import make_wind_rose
+
+
+TURBINE_SPACING = 300.0  # metres per turbine on a square farm
+
+
+def bench_incremental(evaluator, moves, rng):
+    """Return incremental moves/s."""
+    start = time.perf_counter()
+    for index, position in moves:
+        evaluator.move(index, position)
+        if rng.random() < 0.5:
+            evaluator.commit()
+        else:
+            evaluator.rollback()
+    return len(moves) / (time.perf_counter() - start)
+
+
+def bench_full(model, positions, wind_rose, moves):
+    """Return moves/s when every move re-scores the whole layout."""
+    positions = positions.copy()
+    start = time.perf_counter()
+    for index, position in moves:
+        candidate = positions.copy()
+        candidate[index] = position
+        model.calculate_aep(candidate, wind_rose)
+    return len(moves) / (time.perf_counter() - start)
+
+
+def main():
+    """Run the incremental AEP benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--moves', type=int, default=2000)
+    args = parser.parse_args()
+
+    wind_rose = make_wind_rose()
+    model = JensenWakeModel()
+
+    print(f"⏱️  Incremental delta-AEP benchmark: {args.moves} random single-turbine moves")
+    print("=" * 78)
+
+    for n_turbines in (50, 200, 500):
+        rng = np.random.default_rng(42)
+        size = TURBINE_SPACING * np.sqrt(n_turbines)
+        positions = rng.uniform(0.0, size, size=(n_turbines, 2))
+        moves = [(rng.integers(n_turbines), rng.uniform(0.0, size, 2))
+                 for _ in range(args.moves)]
+
+        start = time.perf_counter()
+        evaluator = IncrementalAEPEvaluator(positions, wind_rose, wake_model=model)
+        setup = time.perf_counter() - start
+        incremental = bench_incremental(evaluator, moves, rng)
+        n_full = max(20, args.moves // (n_turbines // 10))
+        full = bench_full(model, positions, wind_rose, moves[:n_full])
+
+        exact = model.calculate_aep(evaluator.positions, wind_rose, method='exact')
+        print(f"   {n_turbines:4d} turbines: {incremental:9,.0f} moves/s incremental  "
+              f"{full:7,.0f} moves/s full  ({incremental / full:5.1f}x, "
+              f"setup {setup:.2f} s, drift {abs(evaluator.aep / exact - 1):.1e})")
+
+
+if __name__ == '__main__':
+    main()
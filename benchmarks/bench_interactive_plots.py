@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark of interactive HTML size against wind record length.
+
+For growing record lengths, compares a plain Plotly figure holding every
+sample (SVG ``Scatter`` time series, raw-sample histogram and wind rose)
+against the decimated WebGL figure from
+``src.visualization.webgl_plots``. Reports figure build plus HTML
+serialization time and the HTML size (plotly.js is loaded from the CDN in
+both cases, so the size is the data payload). The full figure is skipped
+above ``--full-limit`` samples.
+
+Usage:
+    python benchmarks/bench_interactive_plots.py [--max-rows 10000000] [--max-points 5000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.data.wind_stream import generate_time_series_chunks
+from src.visualization.webgl_plots import create_decimated_wind_analysis
+
+
+def full_figure(wind_speeds, wind_directions):
+    """Undecimated figure writing every sample into the HTML."""
+    fig = make_subplots(rows=2, cols=2, specs=[[{'colspan': 2}, None], [{}, {'type': 'polar'}]])
+    fig.add_trace(go.Scatter(y=wind_speeds, mode='lines'), row=1, col=1)
+    fig.add_trace(go.Histogram(x=wind_speeds), row=2, col=1)
+    fig.add_trace(go.Barpolar(r=wind_speeds, theta=wind_directions), row=2, col=2)
+    return fig
+
+
+def measure(build):
+    """Return (HTML size in MB, seconds) for building and serializing a figure."""
+    start = time.perf_counter()
+    html = build().to_html(include_plotlyjs='cdn', full_html=True)
+    return len(html.encode()) / 2 ** 20, time.perf_counter() - start
+
+
+def main():
+    """Run the interactive plot size benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--max-rows', type=int, default=10_000_000)
+    parser.add_argument('--max-points', type=int, default=5000)
+    parser.add_argument('--full-limit', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print("⏱️  Interactive plot size benchmark")
+    print("=" * 78)
+    print(f"   {'samples':>11}   {'full HTML':>20}   {'decimated HTML':>20}   {'reduction':>9}")
+
+    n_rows = 10_000
+    while n_rows <= args.max_rows:
+        speeds, directions = next(generate_time_series_chunks(n_rows, chunk_size=n_rows,
+                                                              random_state=42))
+        dec_mb, dec_s = measure(lambda: create_decimated_wind_analysis(
+            speeds, directions, max_points=args.max_points))
+
+        if n_rows <= args.full_limit:
+            full_mb, full_s = measure(lambda: full_figure(speeds, directions))
+            full = f"{full_mb:8.2f} MB {full_s:6.2f} s"
+            reduction = f"{full_mb / dec_mb:8.0f}x"
+        else:
+            full, reduction = f"{'(skipped)':>20}", f"{'-':>9}"
+
+        print(f"   {n_rows:>11,d}   {full}   {dec_mb:8.2f} MB {dec_s:6.2f} s   {reduction}")
+        n_rows *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the genetic-algorithm layout optimizer.
+
+Runs the same seeded optimization serially and with increasing process
+pool sizes, reporting wall time, speedup against one worker, and whether
+the parallel result matches the serial one exactly.
+
+Usage:
+    python benchmarks/bench_optimizer.py [--turbines 50] [--generations 10]
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.models.optimizer import GeneticLayoutOptimizer
+from bench_wake_models import make_wind_rose
+
+
+def worker_counts(max_workers):
+    """Powers of two up to ``max_workers`` (always including it)."""
+    counts = [1]
+    while counts[-1] * 2 <= max_workers:
+        counts.append(counts[-1] * 2)
+    if counts[-1] != max_workers:
+        counts.append(max_workers)
+    return counts
+
+
+def main():
+    """Run the optimizer scaling benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--turbines', type=int, default=50)
+    parser.add_argument('--generations', type=int, default=10)
+    parser.add_argument('--population', type=int, default=200)
+    parser.add_argument('--max-workers', type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    print(f"⏱️  GA optimizer benchmark: {args.turbines} turbines, "
+          f"population {args.population}, {args.generations} generations")
+    print("=" * 60)
+
+    wind_rose = make_wind_rose()
+    reference = None
+    serial_time = None
+
+    for n_workers in worker_counts(args.max_workers):
+        optimizer = GeneticLayoutOptimizer(
+            {'farm_width': 4000, 'farm_height': 4000},
+            {'population_size': args.population, 'n_workers': n_workers})
+        result = optimizer.optimize(wind_rose, n_turbines=args.turbines,
+                                    generations=args.generations)
+
+        if reference is None:
+            reference, serial_time = result, result['runtime_s']
+        identical = np.array_equal(reference['best_positions'], result['best_positions'])
+
+        print(f"   {n_workers:3d} workers: {result['runtime_s']:7.2f} s  "
+              f"speedup {serial_time / result['runtime_s']:5.2f}x  "
+              f"{result['evaluations'] / result['runtime_s']:8.1f} layouts/s  "
+              f"identical={identical}")
+
+
+if __name__ == "__main__":
+    main()
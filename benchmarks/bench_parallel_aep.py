@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark of direction-sector parallel AEP for one large layout.
+
+Evaluates a single Poisson-disk layout (1,000 turbines by default) with
+16 and 72 direction sectors on 1 to 32 worker processes and reports the
+time per evaluation, the speedup and parallel efficiency relative to one
+worker, and whether the AEP is bit-identical to the one-worker result.
+Pool start-up is timed separately and worker counts are capped at the
+number of sectors; counts above the number of CPUs oversubscribe the
+machine and are marked with '*'.
+
+Usage:
+    python benchmarks/bench_parallel_aep.py [--turbines 1000] [--sectors 16 72] [--workers 1 2 4 8 16 32]
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.models.layout_sampling import PoissonDiskLayoutSampler
+from src.models.parallel_aep import SectorParallelAEP
+from src.models.power_calculations import weibull_wind_rose
+from src.models.wake_models import JensenWakeModel
+
+
+MIN_DISTANCE = 300.0  # m, config.yaml min_turbine_distance
+
+
+def wind_rose(n_sectors):
+    """Weibull rose with a south-westerly prevailing direction."""
+    centres = np.arange(n_sectors) * 360.0 / n_sectors
+    frequencies = 1.0 + 0.8 * np.cos(np.radians(centres - 225.0))
+    return weibull_wind_rose(np.full(n_sectors, 2.0), np.full(n_sectors, 8.0), frequencies)
+
+
+def main():
+    """Run the sector-parallel AEP benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--turbines', type=int, default=1000)
+    parser.add_argument('--sectors', type=int, nargs='+', default=[16, 72])
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    # Half of Poisson-disk packing density, so the layout is always feasible
+    side = MIN_DISTANCE * np.sqrt(args.turbines / 0.35)
+    layout = PoissonDiskLayoutSampler({'farm_width': side, 'farm_height': side,
+                                       'min_turbine_distance': MIN_DISTANCE}
+                                      ).sample(args.turbines, rng)
+    wake_model = JensenWakeModel()
+    n_cpus = os.cpu_count() or 1
+
+    print(f"⏱️  Sector-parallel AEP benchmark: {args.turbines} turbines, "
+          f"{side / 1000:.1f} km farm, {n_cpus} CPUs")
+    print("=" * 84)
+
+    for n_sectors in args.sectors:
+        rose = wind_rose(n_sectors)
+        start = time.perf_counter()
+        reference = wake_model.calculate_aep(layout, rose)
+        print(f"   {n_sectors} sectors  (JensenWakeModel.calculate_aep "
+              f"{time.perf_counter() - start:.3f} s, {reference:,.0f} MWh/yr)")
+
+        baseline = None
+        # Workers are capped at the sector count; skip repeats of the cap
+        for n_workers in sorted({min(n, n_sectors) for n in args.workers}):
+            start = time.perf_counter()
+            with SectorParallelAEP(rose, wake_model, n_workers=n_workers) as evaluator:
+                aep = evaluator.calculate_aep(layout)
+                startup = time.perf_counter() - start
+                times = []
+                for _ in range(args.repeats):
+                    start = time.perf_counter()
+                    evaluator.calculate_aep(layout)
+                    times.append(time.perf_counter() - start)
+            elapsed = float(np.median(times))
+            if baseline is None:
+                baseline = (elapsed, aep)
+            speedup = baseline[0] / elapsed
+            flag = '*' if n_workers > n_cpus else ' '
+            print(f"      {n_workers:3d} workers{flag}  {elapsed:7.3f} s/eval  "
+                  f"speedup {speedup:5.2f}x  efficiency {speedup / n_workers:5.0%}  "
+                  f"first call {startup:6.3f} s  identical {aep == baseline[1]}")
+
+
+if __name__ == '__main__':
+    main()
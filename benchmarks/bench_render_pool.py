@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Benchmark for parallel figure rendering.
+
+Renders the six static figures of main.py (at the configured print DPI)
+serially in-process and through FigureRenderPool with growing worker
+counts, and measures how long the caller is blocked when a prebuilt
+figure is handed to the async save queue instead of saved inline.
+
+Usage:
+    python benchmarks/bench_render_pool.py [--dpi 300] [--workers 1 2 4]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.models.uncertainty import QuantileSketch, exceedance_table
+from src.visualization.panels import FIGURES, build_figure, compute_panel_data
+from src.visualization.render_pool import FigureRenderPool
+
+
+def demo_panels(n_samples=87_600, n_turbines=30, generations=50):
+    """Panel data shaped like a main.py run."""
+    rng = np.random.default_rng(42)
+    wind_speeds = 8.0 * rng.weibull(2.0, n_samples)
+    wind_directions = np.mod(rng.normal(270.0, 45.0, n_samples), 360.0)
+    best = np.cumsum(rng.uniform(0, 100, generations)) + 5e5
+    optimization_data = {
+        'comparison': {'methods': ['Random', 'Grid', 'Genetic Algorithm'],
+                       'power_outputs': [60.0, 65.0, 68.0],
+                       'efficiencies': [0.86, 0.93, 0.97]},
+        'history': {'generation': list(range(generations)), 'best_fitness': best,
+                    'mean_fitness': best - 2e3, 'std_fitness': np.full(generations, 500.0)},
+    }
+    positions = rng.uniform(0, 2000, size=(n_turbines, 2))
+    exceedance = exceedance_table(QuantileSketch().update(rng.normal(1.5e5, 8e3, 2000)))
+    return compute_panel_data(wind_speeds, wind_directions, positions, optimization_data,
+                              exceedance=exceedance)
+
+
+def render_all(panels, config, out_dir, n_workers):
+    """Render every figure and return the wall time."""
+    start = time.perf_counter()
+    with FigureRenderPool(config, n_workers=n_workers) as pool:
+        for name in FIGURES:
+            pool.render(name, panels, Path(out_dir) / f"{name}.png")
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the rendering benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--dpi', type=int, default=300)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    args = parser.parse_args()
+    config = {'dpi': args.dpi, 'figure_size': [12, 8]}
+
+    print("⏱️  Figure rendering benchmark")
+    print("=" * 60)
+    panels = demo_panels()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        serial = render_all(panels, config, tmp_dir, n_workers=0)
+        print(f"   serial (in-process):  {serial:6.2f} s for {len(FIGURES)} figures")
+        for n_workers in args.workers:
+            elapsed = render_all(panels, config, tmp_dir, n_workers)
+            print(f"   {n_workers:2d} worker(s):          {elapsed:6.2f} s "
+                  f"({serial / elapsed:4.2f}x)")
+
+        fig = build_figure('dashboard', panels, config)
+        start = time.perf_counter()
+        fig.savefig(Path(tmp_dir) / 'inline.png', dpi=args.dpi, bbox_inches='tight')
+        inline = time.perf_counter() - start
+        plt.close(fig)
+
+        with FigureRenderPool(config, n_workers=1) as pool:
+            fig = build_figure('dashboard', panels, config)
+            start = time.perf_counter()
+            pool.save_async(fig, Path(tmp_dir) / 'async.png')
+            blocked = time.perf_counter() - start
+        print(f"   dashboard save: inline {inline:.2f} s, async queue blocks caller "
+              f"{blocked:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the vectorized placement RL environment.
+
+Steps 64 and 256 parallel environments with a random valid policy and
+reports environment steps per second on the CPU. For reference it also
+times the naive reward, re-scoring the whole layout with
+JensenWakeModel.calculate_aep after every placement, in a single env.
+
+Usage:
+    python benchmarks/bench_rl_environment.py [--steps 200] [--turbines 50]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.models.rl_environment import VectorizedPlacementEnv
+from bench_wake_models import make_wind_rose
+
+
+def bench_envs(n_envs, wind_rose, n_turbines, n_steps):
+    """Return env-steps/s and completed episodes for ``n_envs`` envs."""
+    env = VectorizedPlacementEnv(n_envs, wind_rose, rl_config={'n_turbines': n_turbines})
+    env.reset(seed=0)
+    episodes = 0
+    start = time.perf_counter()
+    for _ in range(n_steps):
+        _, _, terminated, truncated, _ = env.step(env.sample_actions())
+        episodes += int(np.count_nonzero(terminated | truncated))
+    elapsed = time.perf_counter() - start
+    return n_envs * n_steps / elapsed, episodes
+
+
+def bench_naive(wind_rose, n_turbines, n_episodes=3):
+    """Return steps/s when every reward re-scores the full layout."""
+    env = VectorizedPlacementEnv(1, wind_rose, rl_config={'n_turbines': n_turbines})
+    env.reset(seed=0)
+    steps = 0
+    start = time.perf_counter()
+    for _ in range(n_episodes * n_turbines):
+        env.step(env.sample_actions())
+        positions = env.positions[0, :env.counts[0]]
+        if len(positions):
+            env.wake_model.calculate_aep(positions, wind_rose)
+        steps += 1
+    return steps / (time.perf_counter() - start)
+
+
+def main():
+    """Run the RL environment benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--steps', type=int, default=200)
+    parser.add_argument('--turbines', type=int, default=50)
+    args = parser.parse_args()
+
+    wind_rose = make_wind_rose()
+
+    print(f"⏱️  Vectorized placement env benchmark: {args.turbines} turbines per "
+          f"episode, {args.steps} batched steps")
+    print("=" * 72)
+
+    naive = bench_naive(wind_rose, args.turbines)
+    print(f"   {'naive full re-score (1 env)':<30} {naive:10,.0f} steps/s")
+    for n_envs in (64, 256):
+        rate, episodes = bench_envs(n_envs, wind_rose, args.turbines, args.steps)
+        print(f"   {f'{n_envs} envs, incremental':<30} {rate:10,.0f} steps/s  "
+              f"({rate / naive:5.1f}x, {episodes} episodes)")
+
+
+if __name__ == '__main__':
+    main()
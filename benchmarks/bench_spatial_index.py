@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark for neighbour-index pruning on large farms.
+
+Compares the exact all-pairs AEP path with the pruned wake-cone path and
+the KD-tree spacing check with a brute-force distance matrix for 300 to
+1,000+ turbines at roughly 5D spacing.
+
+Usage:
+    python benchmarks/bench_spatial_index.py
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.models.spatial_index import NeighbourIndex
+from src.models.wake_models import JensenWakeModel
+from bench_wake_models import make_wind_rose
+
+
+TURBINE_COUNTS = [300, 1000, 2000]
+SPACING = 450.0  # metres between neighbouring turbines on average
+MIN_DISTANCE = 300.0
+
+
+def make_layout(n_turbines, random_state=42):
+    """Jittered grid layout at roughly ``SPACING`` metres."""
+    rng = np.random.default_rng(random_state)
+    side = int(np.ceil(np.sqrt(n_turbines)))
+    grid = np.stack(np.meshgrid(np.arange(side), np.arange(side)), -1).reshape(-1, 2)
+    positions = grid[:n_turbines] * SPACING
+    return positions + rng.uniform(-100.0, 100.0, positions.shape)
+
+
+def timed(func, *args, **kwargs):
+    """Return (result, seconds) for a single call."""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    """Run the spatial index benchmark."""
+    print("⏱️  Neighbour-index pruning benchmark")
+    print("=" * 72)
+
+    model = JensenWakeModel()
+    wind_rose = make_wind_rose()
+    print(f"   Deficit tolerance {model.deficit_tolerance:g} "
+          f"-> wakes truncated at {model.truncation_distance:.0f} m")
+    print(f"   {'N':>5} {'exact AEP s':>12} {'pruned AEP s':>13} {'rel. error':>11}"
+          f" {'brute spacing s':>16} {'KD spacing s':>13}")
+
+    for n_turbines in TURBINE_COUNTS:
+        layout = make_layout(n_turbines)
+
+        exact, t_exact = timed(model.calculate_aep, layout, wind_rose, method='exact')
+        pruned, t_pruned = timed(model.calculate_aep, layout, wind_rose, method='pruned')
+
+        def brute_spacing():
+            distances = np.linalg.norm(layout[:, None] - layout[None], axis=-1)
+            return np.argwhere(np.triu(distances < MIN_DISTANCE, k=1))
+
+        brute, t_brute = timed(brute_spacing)
+        indexed, t_indexed = timed(lambda: NeighbourIndex(layout).close_pairs(MIN_DISTANCE))
+        assert len(brute) == len(indexed)
+
+        print(f"   {n_turbines:5d} {t_exact:12.3f} {t_pruned:13.3f} "
+              f"{abs(pruned - exact) / exact:11.2e} {t_brute:16.4f} {t_indexed:13.4f}")
+
+
+if __name__ == "__main__":
+    main()
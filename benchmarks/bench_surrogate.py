@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark of surrogate pre-screening in the GA on a large farm.
+
+Runs the same seeded GA with and without surrogate screening on a
+200-turbine case and reports exact AEP evaluations, the fraction of exact
+evaluations saved, wall time, the best AEP found, and the out-of-sample
+surrogate error (MAE, MAPE and Spearman rank correlation against the exact
+scores it was later trained on).
+
+Usage:
+    python benchmarks/bench_surrogate.py [--turbines 200] [--generations 30]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.models.optimizer import GeneticLayoutOptimizer
+from bench_wake_models import make_wind_rose
+
+
+def main():
+    """Run the surrogate screening benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--turbines', type=int, default=200)
+    parser.add_argument('--generations', type=int, default=30)
+    parser.add_argument('--population', type=int, default=50)
+    parser.add_argument('--fraction', type=float, default=0.25)
+    args = parser.parse_args()
+
+    farm = {'farm_width': 6000, 'farm_height': 6000, 'min_turbine_distance': 300}
+    wind_rose = make_wind_rose()
+
+    print(f"⏱️  Surrogate screening benchmark: {args.turbines} turbines, "
+          f"population {args.population}, {args.generations} generations")
+    print("=" * 78)
+
+    baseline = None
+    for model in (None, 'ridge', 'gradient_boosting'):
+        ml_config = {'population_size': args.population, 'cache_size': 0,
+                     'surrogate_screening': model is not None,
+                     'surrogate_model': model or 'ridge',
+                     'surrogate_fraction': args.fraction}
+        optimizer = GeneticLayoutOptimizer(farm, ml_config)
+        result = optimizer.optimize(wind_rose, n_turbines=args.turbines,
+                                    generations=args.generations)
+        baseline = baseline or result
+
+        print(f"   {model or 'exact only':<18} {result['evaluations']:6d} exact evals  "
+              f"{result['runtime_s']:7.2f} s  best {result['best_aep_mwh']:9.0f} MWh/yr "
+              f"({result['best_aep_mwh'] / baseline['best_aep_mwh'] - 1:+.2%})")
+        surrogate = result['surrogate']
+        if surrogate:
+            print(f"      saved {surrogate['fraction_saved']:.1%} of exact evaluations, "
+                  f"MAE {surrogate['mae_mwh']:.0f} MWh/yr ({surrogate['mape']:.2%}), "
+                  f"rank correlation {surrogate['rank_correlation']:.3f} "
+                  f"over {surrogate['n_predictions']} predictions")
+
+
+if __name__ == "__main__":
+    main()
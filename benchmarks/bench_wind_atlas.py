@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark of multi-site wind roses from the memory-mapped wind atlas.
+
+Builds a synthetic atlas with smoothly varying per-sector Weibull
+parameters, then derives wind roses for many candidate sites three ways:
+regenerating an hourly time series per site and binning it (the
+single-site WindDataProcessor route), one interpolated atlas query per
+site, and a single bulk atlas query for all sites.
+
+Usage:
+    python benchmarks/bench_wind_atlas.py [--grid 500] [--sites 10000] [--sectors 12]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.data.wind_atlas import WindAtlas
+from src.models.power_calculations import bin_wind_rose
+
+
+def build_atlas(directory, grid, n_sectors, spacing=1000.0, block=100):
+    """Fill a grid x grid atlas with a smooth synthetic wind climate."""
+    atlas = WindAtlas.create(directory, (grid, grid), spacing=(spacing, spacing),
+                             n_sectors=n_sectors)
+    directions = np.radians(np.arange(n_sectors) * 360.0 / n_sectors)
+    for row in range(0, grid, block):
+        for col in range(0, grid, block):
+            r = np.arange(row, min(row + block, grid))[:, None, None] / grid
+            c = np.arange(col, min(col + block, grid))[None, :, None] / grid
+            weibull_c = 7.0 + 2.0 * np.sin(3 * r) * np.cos(2 * c) + 0.5 * np.cos(directions)
+            weibull_k = 2.0 + 0.3 * r - 0.2 * c
+            # Westerly prevailing wind veering with position
+            freq = np.exp(np.cos(directions - np.radians(270.0) - 0.5 * r))
+            atlas.write(row, col, weibull_k, weibull_c, freq)
+    atlas.flush()
+    return WindAtlas(directory)
+
+
+def main():
+    """Run the wind atlas benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--grid', type=int, default=500)
+    parser.add_argument('--sites', type=int, default=10_000)
+    parser.add_argument('--sectors', type=int, default=12)
+    parser.add_argument('--hours', type=int, default=8760)
+    args = parser.parse_args()
+
+    print(f"⏱️  Wind atlas benchmark: {args.grid}x{args.grid} cells, "
+          f"{args.sectors} sectors, {args.sites} sites")
+    print("=" * 72)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        atlas = build_atlas(tmp, args.grid, args.sectors)
+        size_mb = sum(p.stat().st_size for p in Path(tmp).glob('*.npy')) / 2 ** 20
+        print(f"   build atlas                {time.perf_counter() - start:8.2f} s  "
+              f"({size_mb:.0f} MB on disk)")
+
+        rng = np.random.default_rng(0)
+        extent = (args.grid - 1) * atlas.spacing[0]
+        x, y = rng.uniform(0, extent, (2, args.sites))
+
+        # Per-site regeneration is slow; time a subset and extrapolate
+        n_regen = min(args.sites, 200)
+        start = time.perf_counter()
+        for i in range(n_regen):
+            speeds, directions = atlas.sample_time_series(x[i], y[i], args.hours, random_state=i)
+            bin_wind_rose(speeds, directions, args.sectors, max_speed=30.0)
+        regen = (time.perf_counter() - start) / n_regen * args.sites
+
+        n_single = min(args.sites, 2000)
+        start = time.perf_counter()
+        for i in range(n_single):
+            atlas.wind_rose(x[i], y[i])
+        single = (time.perf_counter() - start) / n_single * args.sites
+
+        start = time.perf_counter()
+        roses = atlas.wind_roses(x, y)
+        bulk = time.perf_counter() - start
+
+        for name, elapsed in (('regenerate + bin per site', regen),
+                              ('atlas query per site', single),
+                              ('bulk atlas query', bulk)):
+            print(f"   {name:<26} {elapsed:8.3f} s  {args.sites / elapsed:12,.0f} sites/s  "
+                  f"({regen / elapsed:7.1f}x)")
+
+        mass = roses['frequencies'].sum(axis=(1, 2))
+        print(f"   rose probability mass      {mass.min():.4f} .. {mass.max():.4f}")
+        del atlas
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the streaming wind time-series pipeline.
+
+Writes a synthetic multi-year 10-minute record (10 million rows by
+default) to CSV chunk by chunk, then summarizes it with the streaming
+pipeline, reporting throughput and peak traced memory for several record
+lengths to show that memory stays flat.
+
+Usage:
+    python benchmarks/bench_wind_stream.py [--rows 10000000] [--chunk-size 1000000]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.data.wind_stream import generate_time_series_chunks, iter_wind_csv, summarize_wind_stream
+
+
+def write_csv(path, n_rows, chunk_size, random_state=42):
+    """Write a synthetic wind CSV without holding the record in memory."""
+    chunks = generate_time_series_chunks(n_rows, chunk_size, random_state=random_state)
+    for i, (speeds, directions) in enumerate(chunks):
+        frame = pd.DataFrame({'wind_speed': speeds, 'wind_direction': directions})
+        frame.to_csv(path, mode='w' if i == 0 else 'a', header=(i == 0),
+                     index=False, float_format='%.3f')
+
+
+def bench_stream(path, chunk_size):
+    """Return (summary, seconds, peak traced MB) for one streaming pass."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    summary = summarize_wind_stream(iter_wind_csv(path, chunk_size=chunk_size))
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return summary, elapsed, peak / 2 ** 20
+
+
+def main():
+    """Run the streaming pipeline benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, default=10_000_000)
+    parser.add_argument('--chunk-size', type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    print("⏱️  Streaming wind pipeline benchmark")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for n_rows in sorted({args.rows // 10, args.rows}):
+            path = Path(tmp_dir) / f"wind_{n_rows}.csv"
+            start = time.perf_counter()
+            write_csv(path, n_rows, args.chunk_size)
+            write_time = time.perf_counter() - start
+
+            summary, elapsed, peak_mb = bench_stream(path, args.chunk_size)
+            weibull = summary['weibull_parameters']
+            print(f"   {n_rows:>11,d} rows ({path.stat().st_size / 2 ** 20:7.1f} MB): "
+                  f"write {write_time:6.1f} s, stream {elapsed:6.1f} s "
+                  f"({n_rows / elapsed / 1e6:5.2f} M rows/s), peak {peak_mb:6.1f} MB")
+            print(f"      mean {summary['wind_speed_analysis']['mean']:.3f} m/s, "
+                  f"Weibull k={weibull['k']:.3f} c={weibull['c']:.3f}, "
+                  f"CF {summary['capacity_factor']:.3f}")
+
+
+if __name__ == "__main__":
+    main()
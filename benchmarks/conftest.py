@@ -0,0 +1,54 @@
+"""
+Shared fixtures for the pytest-benchmark regression suite.
+
+Every input is built from fixed seeds once per session, so benchmark
+results are comparable between runs and against saved baselines.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.data.frequency_table import WindFrequencyTable
+from src.data.wind_stream import generate_time_series_chunks
+
+
+RANDOM_STATE = 42
+
+
+@pytest.fixture
+def run(benchmark):
+    """
+    Benchmark ``func(*args, **kwargs)`` over a fixed number of rounds.
+
+    Fixed rounds (instead of pytest-benchmark's time-based calibration)
+    keep the suite's duration bounded when it runs with the smoke tests
+    and give every saved baseline the same sample size.
+    """
+    def measure(func, *args, rounds: int = 5, **kwargs):
+        return benchmark.pedantic(func, args=args, kwargs=kwargs, rounds=rounds,
+                                  iterations=1, warmup_rounds=1)
+    return measure
+
+
+@pytest.fixture(scope='session')
+def wind_record():
+    """Seeded one-year hourly record (speeds, directions) at the config defaults."""
+    chunks = list(generate_time_series_chunks(8760, random_state=RANDOM_STATE))
+    return np.concatenate([c[0] for c in chunks]), np.concatenate([c[1] for c in chunks])
+
+
+@pytest.fixture(scope='session')
+def wind_table(wind_record):
+    """Frequency table of :func:`wind_record`."""
+    return WindFrequencyTable.from_chunks([wind_record])
+
+
+@pytest.fixture(scope='session')
+def wind_rose(wind_table):
+    """Binned 16-sector wind rose of :func:`wind_record`."""
+    return wind_table.to_wind_rose()
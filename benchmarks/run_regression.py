@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Save or check performance baselines of the pytest-benchmark suite.
+
+``save`` runs benchmarks/test_performance.py and stores the results as a
+JSON baseline under benchmarks/baselines/<machine>/NNNN_<name>.json.
+``compare`` runs the suite again and fails (non-zero exit) when any
+benchmark's median is more than ``--threshold`` percent slower than the
+latest baseline of that name. Baselines are per machine and Python
+version, so compare on the machine that saved them.
+
+Usage:
+    python benchmarks/run_regression.py save [--name baseline]
+    python benchmarks/run_regression.py compare [--name baseline] [--threshold 15] [-k wind]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.utils import get_machine_id
+
+
+BENCHMARK_DIR = Path(__file__).resolve().parent
+SUITE = BENCHMARK_DIR / 'test_performance.py'
+BASELINE_DIR = BENCHMARK_DIR / 'baselines'
+
+
+def latest_baseline(name: str, storage: Path = BASELINE_DIR) -> Path:
+    """Most recent saved baseline called ``name`` for this machine."""
+    candidates = sorted((storage / get_machine_id()).glob(f'[0-9][0-9][0-9][0-9]_{name}.json'))
+    if not candidates:
+        raise FileNotFoundError(f"No '{name}' baseline for {get_machine_id()} in {storage}; "
+                                f"run 'python benchmarks/run_regression.py save "
+                                f"--name {name}' first")
+    return candidates[-1]
+
+
+def main():
+    """Run the regression suite in save or compare mode."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('mode', choices=['save', 'compare'])
+    parser.add_argument('--name', default='baseline', help="baseline name")
+    parser.add_argument('--threshold', type=int, default=15,
+                        help="allowed slowdown of the median (percent)")
+    parser.add_argument('--storage', type=Path, default=BASELINE_DIR)
+    parser.add_argument('-k', dest='keyword', help="only run benchmarks matching this expression")
+    args = parser.parse_args()
+
+    pytest_args = [str(SUITE), '-q', '--benchmark-only',
+                   f'--benchmark-storage=file://{args.storage}',
+                   '--benchmark-columns=min,median,max,rounds',
+                   '--benchmark-sort=fullname']
+    if args.keyword:
+        pytest_args += ['-k', args.keyword]
+
+    if args.mode == 'save':
+        print(f"⏱️  Saving '{args.name}' performance baseline")
+        pytest_args.append(f'--benchmark-save={args.name}')
+    else:
+        try:
+            baseline = latest_baseline(args.name, args.storage)
+        except FileNotFoundError as e:
+            print(f"❌ {e}")
+            sys.exit(2)
+        print(f"⏱️  Comparing against {baseline.relative_to(args.storage)} "
+              f"(fail above +{args.threshold}% median)")
+        pytest_args += [f'--benchmark-compare={baseline}',
+                        f'--benchmark-compare-fail=median:{args.threshold}%']
+    print("=" * 72)
+
+    sys.exit(pytest.main(pytest_args))
+
+
+if __name__ == '__main__':
+    main()
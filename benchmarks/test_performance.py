@@ -0,0 +1,214 @@
+"""
+Performance regression suite (pytest-benchmark).
+
+Times the pipeline paths at several sizes with fixed seeds: wind series
+generation and summary, grid and Poisson-disk layout generation, layout
+scoring, file save/load and every static and interactive figure. A plain
+``pytest`` run executes the suite like the other tests; save and compare
+baselines with ``benchmarks/run_regression.py``.
+"""
+
+import io
+
+import numpy as np
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+from src.data.frequency_table import WindFrequencyTable
+from src.data.wind_stream import generate_time_series_chunks, summarize_wind_stream
+from src.models.incremental_aep import IncrementalAEPEvaluator
+from src.models.layout_sampling import PoissonDiskLayoutSampler
+from src.models.optimizer import grid_layout, layout_fitness
+from src.models.power_calculations import DEFAULT_TURBINE_CONFIG
+from src.models.wake_models import JensenWakeModel
+from src.utils.array_store import MemmapArrayStore, load_columnar, save_columnar
+from conftest import RANDOM_STATE
+
+
+FARM_SIZE = 2000.0  # m, config.yaml farm_width/farm_height
+MIN_DISTANCE = 300.0  # m, config.yaml min_turbine_distance
+RECORD_SIZES = [1_000, 8_760, 100_000]
+TURBINE_COUNTS = [1, 12, 50]
+SAMPLED_COUNTS = [1, 12, 25]  # 50 exceeds Poisson-disk packing of the 2 km farm
+PANEL_FIGURES = ['wind_data_analysis', 'turbine_layout', 'performance_comparison',
+                 'wind_rose', 'optimization_results', 'aep_exceedance', 'dashboard']
+
+
+def generate_record(n_points):
+    """Materialize a seeded synthetic record."""
+    chunks = list(generate_time_series_chunks(n_points, random_state=RANDOM_STATE))
+    return np.concatenate([c[0] for c in chunks]), np.concatenate([c[1] for c in chunks])
+
+
+def random_layouts(n_layouts, n_turbines):
+    """Seeded uniform random layouts of shape (L, N, 2)."""
+    rng = np.random.default_rng(RANDOM_STATE)
+    return rng.uniform(0.0, FARM_SIZE, (n_layouts, n_turbines, 2))
+
+
+# Wind data -----------------------------------------------------------------
+
+@pytest.mark.parametrize('n_points', RECORD_SIZES)
+def test_generate_wind_series(run, n_points):
+    speeds, _ = run(generate_record, n_points)
+    assert len(speeds) == n_points
+
+
+@pytest.mark.parametrize('n_points', RECORD_SIZES)
+def test_wind_summary(run, n_points):
+    record = generate_record(n_points)
+
+    def summarize():
+        return WindFrequencyTable.from_chunks([record]).summary(DEFAULT_TURBINE_CONFIG)
+
+    summary = run(summarize)
+    assert 0.0 < summary['capacity_factor'] < 1.0
+
+
+def test_streaming_summary(run):
+    summary = run(lambda: summarize_wind_stream(
+        generate_time_series_chunks(1_000_000, chunk_size=100_000, random_state=RANDOM_STATE)),
+        rounds=3)
+    assert summary['n_samples'] == 1_000_000
+
+
+# Layouts and scoring -------------------------------------------------------
+
+@pytest.mark.parametrize('n_turbines', TURBINE_COUNTS)
+def test_grid_layout(run, n_turbines):
+    positions = run(grid_layout, n_turbines, FARM_SIZE, FARM_SIZE, rounds=20)
+    assert positions.shape == (n_turbines, 2)
+
+
+@pytest.mark.parametrize('n_turbines', SAMPLED_COUNTS)
+def test_poisson_disk_population(run, n_turbines):
+    sampler = PoissonDiskLayoutSampler({'farm_width': FARM_SIZE, 'farm_height': FARM_SIZE,
+                                        'min_turbine_distance': MIN_DISTANCE})
+    population = run(lambda: sampler.sample_population(
+        50, n_turbines, np.random.default_rng(RANDOM_STATE)))
+    assert population.shape == (50, n_turbines, 2)
+
+
+@pytest.mark.parametrize('n_turbines', TURBINE_COUNTS)
+def test_layout_aep(run, wind_rose, n_turbines):
+    model = JensenWakeModel()
+    positions = grid_layout(n_turbines, FARM_SIZE, FARM_SIZE)
+    aep = run(model.calculate_aep, positions, wind_rose, rounds=10)
+    assert 0.0 < aep <= model.ideal_aep(n_turbines, wind_rose) + 1e-6
+
+
+@pytest.mark.parametrize('n_turbines', TURBINE_COUNTS)
+def test_population_fitness(run, wind_rose, n_turbines):
+    model = JensenWakeModel()
+    population = random_layouts(50, n_turbines)
+    fitness = run(layout_fitness, population, model, wind_rose, MIN_DISTANCE, 1000.0)
+    assert fitness.shape == (50,)
+
+
+def test_incremental_move(run, wind_rose):
+    evaluator = IncrementalAEPEvaluator(grid_layout(50, FARM_SIZE, FARM_SIZE), wind_rose)
+    moves = np.random.default_rng(RANDOM_STATE).uniform(0.0, FARM_SIZE, (100, 2))
+
+    def propose_moves():
+        return [evaluator.move(i % 50, position) for i, position in enumerate(moves)]
+
+    assert len(run(propose_moves)) == len(moves)
+
+
+# File save / load ----------------------------------------------------------
+
+@pytest.mark.parametrize('file_format', ['npy', 'npz', 'parquet'])
+def test_columnar_roundtrip(run, tmp_path, file_format):
+    if file_format == 'parquet':
+        pytest.importorskip('pyarrow')
+    speeds, directions = generate_record(100_000)
+    target = tmp_path / ('wind' if file_format == 'npy' else f'wind.{file_format}')
+
+    def roundtrip():
+        save_columnar({'wind_speed': speeds, 'wind_direction': directions}, target, file_format)
+        return {name: np.asarray(values).sum() for name, values in load_columnar(target).items()}
+
+    totals = run(roundtrip)
+    assert np.isclose(totals['wind_speed'], speeds.sum())
+
+
+def test_memmap_population_roundtrip(run, tmp_path):
+    store = MemmapArrayStore(tmp_path)
+    population = random_layouts(1000, 50)
+
+    def roundtrip():
+        store.save('population', population)
+        return float(store.load('population')[:, :, 0].sum())
+
+    assert np.isclose(run(roundtrip), population[:, :, 0].sum(), rtol=1e-5)
+
+
+def test_frequency_table_roundtrip(run, tmp_path, wind_table):
+    path = tmp_path / 'table.npz'
+    table = run(lambda: WindFrequencyTable.load(wind_table.save(path)))
+    assert table.n_samples == wind_table.n_samples
+
+
+# Visualization -------------------------------------------------------------
+
+@pytest.fixture(scope='module')
+def panels(wind_record, wind_table):
+    """Panel data for every static figure, including the exceedance panel."""
+    from src.models.uncertainty import QuantileSketch, exceedance_table
+    from src.visualization.panels import compute_panel_data
+
+    rng = np.random.default_rng(RANDOM_STATE)
+    optimization_data = {
+        'comparison': {'methods': ['Grid', 'GA', 'GA + Gradient'],
+                       'power_outputs': [20.0, 22.0, 22.5], 'efficiencies': [0.9, 0.95, 0.96]},
+        'history': {'generation': list(range(100)),
+                    'best_fitness': np.linspace(1.0, 2.0, 100).tolist(),
+                    'mean_fitness': np.linspace(0.5, 1.8, 100).tolist(),
+                    'std_fitness': [0.1] * 100},
+    }
+    exceedance = exceedance_table(QuantileSketch().update(rng.normal(5e4, 3e3, 2000)))
+    return compute_panel_data(*wind_record, grid_layout(12, FARM_SIZE, FARM_SIZE),
+                              optimization_data, wind_table=wind_table,
+                              exceedance=exceedance)
+
+
+@pytest.mark.parametrize('n_points', RECORD_SIZES)
+def test_panel_data(run, n_points):
+    from src.visualization.panels import compute_panel_data
+
+    speeds, directions = generate_record(n_points)
+    panels = run(compute_panel_data, speeds, directions, grid_layout(12, FARM_SIZE, FARM_SIZE))
+    assert len(panels['time_series']['y']) <= 5000
+
+
+@pytest.mark.parametrize('name', PANEL_FIGURES)
+def test_render_figure(run, panels, name):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    from src.visualization.panels import build_figure
+
+    config = {'dpi': 100, 'figure_size': [12, 8]}
+
+    def render():
+        fig = build_figure(name, panels, config, title=name)
+        buffer = io.BytesIO()
+        fig.savefig(buffer, format='png', dpi=config['dpi'])
+        plt.close(fig)
+        return buffer.tell()
+
+    assert run(render, rounds=3) > 0
+
+
+@pytest.mark.parametrize('n_points', RECORD_SIZES)
+def test_interactive_figure(run, n_points):
+    pytest.importorskip('plotly')
+    from src.visualization.webgl_plots import create_decimated_wind_analysis
+
+    speeds, directions = generate_record(n_points)
+
+    def render():
+        return len(create_decimated_wind_analysis(speeds, directions).to_json())
+
+    assert run(render, rounds=3) > 0
@@ -8,6 +8,7 @@ including data generation, analysis, optimization, and visualization.
 
 import sys
 import os
+import argparse
 import logging
 from pathlib import Path
 
@@ -16,11 +17,28 @@ sys.path.append(str(Path(__file__).parent / 'src'))
 
 from src.utils.config_loader import ConfigLoader
 from src.utils.file_utils import FileUtils
+from src.utils.array_store import save_columnar
+from src.utils.profiling import StageProfiler
 from src.data.wind_data import WindDataProcessor
 from src.data.data_generator import DataGenerator
-from src.visualization.basic_plots import WindFarmVisualizer
-from src.visualization.interactive_plots import InteractiveVisualizer
-from src.visualization.wind_analysis import WindDataVisualizer
+from src.data.frequency_table import load_or_build_frequency_table
+from src.models.optimizer import GeneticLayoutOptimizer
+from src.models.gradient_optimizer import GradientLayoutOptimizer
+from src.models.uncertainty import MonteCarloAEPAnalysis
+
+# The visualizer modules pull in matplotlib, seaborn, plotly and pandas;
+# they are imported lazily in create_visualizations() so headless runs
+# (--no-plots, batch and optimization workers) never pay that cost.
+PLOT_FILES = [
+    "results/plots/wind_data_analysis.png",
+    "results/plots/turbine_layout.png",
+    "results/plots/performance_comparison.png",
+    "results/plots/wind_rose.png",
+    "results/plots/optimization_results.png",
+    "results/plots/interactive_analysis.html",
+    "results/plots/dashboard.png",
+]
+EXCEEDANCE_PLOT = "results/plots/aep_exceedance.png"
 
 
 def print_banner():
@@ -39,8 +57,92 @@ def print_banner():
     print(banner)
 
 
-def main():
+def create_visualizations(viz_config, file_utils, wind_speeds, wind_directions,
+                          turbine_positions, optimization_data, wind_table=None,
+                          exceedance=None, profiler=None):
+    """Import the plotting stack, then create and save all figures."""
+    profiler = profiler or StageProfiler()
+    from src.visualization.interactive_plots import InteractiveVisualizer
+    from src.visualization.panels import compute_panel_data
+    from src.visualization.render_pool import FigureRenderPool
+    from src.visualization.webgl_plots import create_decimated_wind_analysis
+    
+    # Aggregate once; every static figure (and the dashboard) draws from
+    # these panels instead of re-binning the raw record
+    plotly_config = viz_config.get('plotly', {})
+    max_points = plotly_config.get('max_points', 5000)
+    with profiler.stage("panel_data"):
+        panels = compute_panel_data(
+            wind_speeds, wind_directions, turbine_positions, optimization_data,
+            wind_table=wind_table, max_points=max_points, exceedance=exceedance
+        )
+    
+    # 1-5, 7. Static figures render and encode in worker processes while
+    # the interactive figure is built here; when profiling, each worker
+    # reports how long its figure took
+    static_figures = [
+        ("wind_data_analysis", "Wind Data Analysis - Prototype"),
+        ("turbine_layout", "Wind Farm Layout - Prototype"),
+        ("performance_comparison", "Performance Comparison - Prototype"),
+        ("wind_rose", "Wind Rose - Prototype"),
+        ("optimization_results", "Optimization Results - Prototype"),
+        ("dashboard", "Wind Farm Dashboard - Prototype"),
+    ]
+    if exceedance is not None:
+        static_figures.append(("aep_exceedance", "AEP Exceedance (P50/P90) - Prototype"))
+    with FigureRenderPool(viz_config, n_workers=viz_config.get('render_workers'),
+                          timed=profiler.enabled) as pool:
+        for name, title in static_figures:
+            pool.render(name, panels, f"results/plots/{name}.png", title=title)
+        
+        # 6. Interactive visualization (decimated WebGL traces for long records
+        # so the HTML size stays bounded)
+        with profiler.stage("interactive_analysis"):
+            if len(wind_speeds) > max_points:
+                fig6 = create_decimated_wind_analysis(
+                    wind_speeds, wind_directions, wind_table=wind_table,
+                    max_points=max_points,
+                    method=plotly_config.get('decimation', 'minmax_lttb'),
+                    config=viz_config,
+                    title="Interactive Wind Analysis - Prototype"
+                )
+            else:
+                fig6 = InteractiveVisualizer(viz_config).create_interactive_wind_analysis(
+                    wind_speeds, wind_directions,
+                    title="Interactive Wind Analysis - Prototype"
+                )
+            file_utils.save_interactive_plot(fig6, "results/plots/interactive_analysis.html")
+    
+    for name, timing in pool.timings.items():
+        profiler.record(name, worker=pool.n_workers > 0, **timing)
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="AI Wind Farm Optimizer Prototype")
+    parser.add_argument(
+        '--resume', action='store_true',
+        help="resume the layout optimization from the last checkpoint"
+    )
+    parser.add_argument(
+        '--no-plots', '--headless', dest='no_plots', action='store_true',
+        help="skip visualizer setup and plotting entirely"
+    )
+    parser.add_argument(
+        '--profile', action='store_true',
+        help="time every pipeline stage and save a JSON timing report"
+    )
+    parser.add_argument(
+        '--cprofile', action='store_true',
+        help="dump cProfile stats for every top-level stage (implies --profile)"
+    )
+    return parser.parse_args()
+
+
+def main(args=None):
     """Main application function."""
+    args = args or argparse.Namespace(resume=False, no_plots=False,
+                                      profile=False, cprofile=False)
     print_banner()
     
     # Initialize components
@@ -52,145 +154,185 @@ def main():
         print("❌ Configuration validation failed")
         return
     
-    # Initialize utilities
-    file_utils = FileUtils()
-    
-    # Initialize data processors
-    wind_processor = WindDataProcessor(config_loader.get_wind_data_config())
-    data_generator = DataGenerator(config_loader.get_wind_farm_config())
-    
-    # Initialize visualizers
-    viz_config = config_loader.get_visualization_config()
-    basic_viz = WindFarmVisualizer(viz_config)
-    interactive_viz = InteractiveVisualizer(viz_config)
-    wind_viz = WindDataVisualizer(viz_config)
+    # Stage timing (a no-op unless enabled in config.yaml or with --profile;
+    # --cprofile dumps are written by the stage profiler, so it implies --profile)
+    profiling_config = dict(config_loader.get('profiling', {}) or {})
+    cprofile = getattr(args, 'cprofile', False)
+    if cprofile:
+        profiling_config['cprofile'] = True
+    profiler = StageProfiler(profiling_config,
+                             enabled=True if getattr(args, 'profile', False) or cprofile
+                             else None)
+    
+    with profiler.stage("initialize"):
+        # Initialize utilities
+        file_utils = FileUtils()
+        
+        # Initialize data processors
+        wind_processor = WindDataProcessor(config_loader.get_wind_data_config())
+        data_generator = DataGenerator(config_loader.get_wind_farm_config())
     
     print("✅ Components initialized successfully")
     
     # Generate sample data
     print("\n📊 Generating sample data...")
     
-    # Generate wind data
-    wind_speeds, wind_directions = wind_processor.generate_time_series_data(
-        n_points=1000, random_state=42
-    )
-    
-    # Generate turbine positions
-    turbine_positions = data_generator.generate_turbine_positions(
-        n_turbines=12, method='optimized', random_state=42
-    )
-    
-    # Generate optimization data
-    optimization_data = data_generator.generate_sample_optimization_data(
-        n_scenarios=5, random_state=42
-    )
+    with profiler.stage("generate_data"):
+        # Generate wind data
+        wind_speeds, wind_directions = wind_processor.generate_time_series_data(
+            n_points=1000, random_state=42
+        )
+        
+        # Generate turbine positions
+        turbine_positions = data_generator.generate_turbine_positions(
+            n_turbines=12, method='optimized', random_state=42
+        )
     
     print(f"✅ Generated {len(wind_speeds)} wind data points")
     print(f"✅ Generated {len(turbine_positions)} turbine positions")
+    
+    # Build (or reuse the cached) joint speed x direction frequency table;
+    # the summary and the AEP engine read this instead of the raw samples
+    with profiler.stage("frequency_table"):
+        wind_table = load_or_build_frequency_table(
+            (wind_speeds, wind_directions),
+            cache_dir=config_loader.get('paths.cache', 'data/cache/'),
+            direction_bins=config_loader.get('wind_data.direction_bins', 16)
+        )
+    
+    # Run layout optimization
+    print("\n🧬 Running genetic algorithm layout optimization...")
+    
+    wind_rose = wind_table.to_wind_rose()
+    with profiler.stage("genetic_optimization"):
+        optimizer = GeneticLayoutOptimizer(
+            config_loader.get_wind_farm_config(), config_loader.get('ml')
+        )
+        ga_result = optimizer.optimize(
+            wind_rose, n_turbines=len(turbine_positions), resume=args.resume
+        )
+    
+    print(f"✅ Best layout AEP: {ga_result['best_aep_mwh']:.0f} MWh/yr "
+          f"({ga_result['evaluations']} evaluations in {ga_result['runtime_s']:.1f} s)")
+    cache_stats = ga_result['cache']
+    print(f"   Fitness cache: {cache_stats['hit_rate']:.1%} hit rate, "
+          f"~{cache_stats['time_saved_s']:.1f} s saved")
+    
+    # Polish the GA layout with analytic-gradient refinement
+    baselines = {'Optimized Placement': turbine_positions}
+    gradient_config = config_loader.get('ml.gradient', {}) or {}
+    if gradient_config.get('enabled', True):
+        with profiler.stage("gradient_refinement"):
+            refiner = GradientLayoutOptimizer(
+                config_loader.get_wind_farm_config(), gradient_config, optimizer.wake_model
+            )
+            refined = refiner.optimize(wind_rose, ga_result['best_positions'])
+        baselines['GA + Gradient Refinement'] = refined['best_positions']
+        print(f"✅ Gradient refinement ({refined['method']}): "
+              f"{refined['best_aep_mwh']:.0f} MWh/yr "
+              f"({refined['evaluations']} evaluations in {refined['runtime_s']:.1f} s"
+              f"{'' if refined['accepted'] else ', no improvement'})")
+    
+    optimization_data = optimizer.to_optimization_data(
+        ga_result, wind_rose, baselines=baselines
+    )
     print(f"✅ Generated {len(optimization_data['scenarios'])} optimization scenarios")
     
     # Analyze wind data
     print("\n📈 Analyzing wind data...")
     
-    wind_summary = wind_processor.get_wind_data_summary(wind_speeds, wind_directions)
+    with profiler.stage("wind_summary"):
+        wind_summary = wind_table.summary(config_loader.get_wind_farm_config())
     
     print(f"   Mean wind speed: {wind_summary['wind_speed_analysis']['mean']:.2f} m/s")
     print(f"   Power density: {wind_summary['power_density_w_m2']:.0f} W/m²")
     print(f"   Capacity factor: {wind_summary['capacity_factor']:.3f}")
     
-    # Create visualizations
-    print("\n🎨 Creating visualizations...")
+    # Monte-Carlo P50/P90 energy for the final layout
+    exceedance = None
+    uncertainty_config = config_loader.get('uncertainty', {}) or {}
+    if uncertainty_config.get('enabled', False):
+        print("\n🎲 Running Monte-Carlo AEP uncertainty analysis...")
+        weibull = wind_summary['weibull_parameters']
+        with profiler.stage("uncertainty"):
+            analysis = MonteCarloAEPAnalysis(
+                wind_table.sector_frequencies(), weibull['k'], weibull['c'],
+                directions=wind_table.directions,
+                config=config_loader.get_wind_farm_config(),
+                uncertainty_config=uncertainty_config, wake_model=optimizer.wake_model
+            )
+            final_positions = baselines.get('GA + Gradient Refinement',
+                                            ga_result['best_positions'])
+            uncertainty = analysis.run(final_positions)
+        optimization_data['uncertainty'] = uncertainty
+        exceedance = uncertainty['exceedance']
+        levels = ", ".join(f"{label} {aep:.0f}"
+                           for label, aep in zip(exceedance['labels'], exceedance['aep_mwh']))
+        print(f"✅ {uncertainty['n_samples']} samples: {levels} MWh/yr")
     
-    # 1. Wind data analysis
-    fig1 = basic_viz.plot_wind_data(
-        wind_speeds, wind_directions, 
-        title="Wind Data Analysis - Prototype"
-    )
-    file_utils.save_plot(fig1, "results/plots/wind_data_analysis.png")
-    
-    # 2. Turbine layout
-    fig2 = basic_viz.plot_turbine_layout(
-        turbine_positions, 
-        title="Wind Farm Layout - Prototype"
-    )
-    file_utils.save_plot(fig2, "results/plots/turbine_layout.png")
-    
-    # 3. Performance comparison
-    comparison = optimization_data['comparison']
-    fig3 = basic_viz.plot_performance_comparison(
-        comparison['methods'], 
-        comparison['power_outputs'],
-        title="Performance Comparison - Prototype"
-    )
-    file_utils.save_plot(fig3, "results/plots/performance_comparison.png")
-    
-    # 4. Wind rose
-    fig4 = wind_viz.plot_wind_rose(
-        wind_speeds, wind_directions,
-        title="Wind Rose - Prototype"
-    )
-    file_utils.save_plot(fig4, "results/plots/wind_rose.png")
-    
-    # 5. Optimization results
-    fig5 = basic_viz.plot_optimization_results(
-        optimization_data,
-        title="Optimization Results - Prototype"
-    )
-    file_utils.save_plot(fig5, "results/plots/optimization_results.png")
-    
-    # 6. Interactive visualization
-    fig6 = interactive_viz.create_interactive_wind_analysis(
-        wind_speeds, wind_directions,
-        title="Interactive Wind Analysis - Prototype"
-    )
-    file_utils.save_interactive_plot(fig6, "results/plots/interactive_analysis.html")
-    
-    # 7. Dashboard
-    fig7 = basic_viz.create_summary_dashboard(
-        wind_speeds, wind_directions, turbine_positions, optimization_data,
-        title="Wind Farm Dashboard - Prototype"
-    )
-    file_utils.save_plot(fig7, "results/plots/dashboard.png")
-    
-    print("✅ All visualizations created successfully")
+    # Create visualizations
+    if args.no_plots:
+        print("\n🎨 Headless mode: skipping visualizations")
+    else:
+        print("\n🎨 Creating visualizations...")
+        with profiler.stage("visualizations"):
+            create_visualizations(
+                config_loader.get_visualization_config(), file_utils,
+                wind_speeds, wind_directions, turbine_positions, optimization_data,
+                wind_table, exceedance, profiler
+            )
+        print("✅ All visualizations created successfully")
     
     # Save results
     print("\n💾 Saving results...")
     
-    # Save wind data
-    wind_data_df = wind_processor.create_wind_data_dataframe(
-        wind_speeds, wind_directions
-    )
-    file_utils.save_data(wind_data_df, "data/wind_data.csv", "csv")
-    
-    # Save optimization results
-    file_utils.save_results(optimization_data, "optimization_results")
-    
-    # Save turbine positions
-    file_utils.save_data(turbine_positions, "data/turbine_positions.json", "json")
+    with profiler.stage("save_results"):
+        # Save wind data
+        with profiler.stage("wind_data_csv"):
+            wind_data_df = wind_processor.create_wind_data_dataframe(
+                wind_speeds, wind_directions
+            )
+            file_utils.save_data(wind_data_df, "data/wind_data.csv", "csv")
+        with profiler.stage("wind_data_npy"):
+            save_columnar(wind_data_df, "data/wind_data_npy", "npy")
+        
+        # Save optimization results
+        with profiler.stage("optimization_json"):
+            file_utils.save_results(optimization_data, "optimization_results")
+        
+        # Save turbine positions
+        with profiler.stage("turbine_positions_json"):
+            file_utils.save_data(turbine_positions, "data/turbine_positions.json", "json")
     
     print("✅ Results saved successfully")
     
+    # Timing report, written next to the optimization results
+    timing_report = None
+    if profiler.enabled:
+        timing_report = profiler.save(config_loader.get('paths.results', 'results/'))
+        print("\n⏱️  Stage timings:")
+        print(profiler.format_table())
+    
     # Print summary
     print("\n📋 Summary:")
     print("=" * 50)
     print(f"   Wind data points: {len(wind_speeds)}")
     print(f"   Turbine positions: {len(turbine_positions)}")
     print(f"   Optimization scenarios: {len(optimization_data['scenarios'])}")
-    print(f"   Generated plots: 7")
-    print(f"   Saved files: 4")
+    plot_files = PLOT_FILES + ([EXCEEDANCE_PLOT] if exceedance is not None else [])
+    print(f"   Generated plots: {0 if args.no_plots else len(plot_files)}")
+    print(f"   Saved files: 5")
     
     print("\n📁 Generated files:")
-    print("   - results/plots/wind_data_analysis.png")
-    print("   - results/plots/turbine_layout.png")
-    print("   - results/plots/performance_comparison.png")
-    print("   - results/plots/wind_rose.png")
-    print("   - results/plots/optimization_results.png")
-    print("   - results/plots/interactive_analysis.html")
-    print("   - results/plots/dashboard.png")
+    if not args.no_plots:
+        for plot_file in plot_files:
+            print(f"   - {plot_file}")
     print("   - data/wind_data.csv")
+    print("   - data/wind_data_npy/ (memory-mappable columns)")
     print("   - data/turbine_positions.json")
     print("   - results/optimization_results_*.json")
+    if timing_report is not None:
+        print(f"   - {timing_report}")
     
     print("\n🎯 Next steps:")
     print("   1. Explore the generated plots in results/plots/")
@@ -204,7 +346,7 @@ def main():
 
 if __name__ == "__main__":
     try:
-        main()
+        main(parse_args())
     except KeyboardInterrupt:
         print("\n⚠️  Application interrupted by user")
     except Exception as e:
@@ -0,0 +1,5 @@
+"""
+AI Wind Farm Optimizer Prototype.
+
+Top-level package for models, data handling, visualization and utilities.
+"""
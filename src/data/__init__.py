@@ -0,0 +1,31 @@
+"""
+Wind data management for the AI Wind Farm Optimizer.
+"""
+
+from .wind_stream import (
+    StreamingWindStats,
+    iter_wind_arrays,
+    iter_wind_csv,
+    generate_time_series_chunks,
+    summarize_wind_stream,
+    fit_weibull_histogram,
+)
+from .frequency_table import (
+    WindFrequencyTable,
+    dataset_fingerprint,
+    load_or_build_frequency_table,
+)
+from .wind_atlas import WindAtlas
+
+__all__ = [
+    'StreamingWindStats',
+    'iter_wind_arrays',
+    'iter_wind_csv',
+    'generate_time_series_chunks',
+    'summarize_wind_stream',
+    'fit_weibull_histogram',
+    'WindFrequencyTable',
+    'dataset_fingerprint',
+    'load_or_build_frequency_table',
+    'WindAtlas',
+]
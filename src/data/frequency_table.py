@@ -0,0 +1,260 @@
+"""
+Joint wind speed x direction frequency tables for the AI Wind Farm Optimizer.
+
+The table is built in one (streamed) pass over the raw samples and cached
+on disk under a fingerprint of the input data plus the binning config.
+Summaries, wind roses, Weibull fits and AEP engines all read the table, so
+repeated analysis runs on the same site skip the raw pass entirely.
+"""
+
+import hashlib
+import json
+import numpy as np
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+from ..models.power_calculations import PowerCurve
+from .wind_stream import (WindChunk, fit_weibull_histogram,
+                          iter_wind_arrays, iter_wind_csv)
+
+
+FINGERPRINT_BLOCK_SIZE = 1 << 20  # bytes hashed per read
+
+
+class WindFrequencyTable:
+    """
+    Joint direction x speed histogram of a wind record.
+
+    Direction sectors are centred on their nominal direction; speed bins
+    have a fixed ``speed_resolution`` starting at 0 m/s.
+    """
+
+    def __init__(self, counts, speed_resolution: float = 0.1,
+                 fingerprint: Optional[str] = None):
+        """
+        Initialize the table.
+
+        Args:
+            counts: Integer sample counts of shape (direction_bins, speed_bins)
+            speed_resolution: Width of each speed bin (m/s)
+            fingerprint: Dataset fingerprint the table was built from
+        """
+        self.counts = np.asarray(counts, dtype=np.int64)
+        self.speed_resolution = float(speed_resolution)
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def from_chunks(cls, chunks: Iterable[WindChunk], direction_bins: int = 16,
+                    speed_resolution: float = 0.1, max_speed: float = 50.0,
+                    fingerprint: Optional[str] = None) -> 'WindFrequencyTable':
+        """
+        Build a table from a stream of (speeds, directions) chunks.
+
+        Args:
+            chunks: Iterable of chunks, e.g. from :func:`iter_wind_csv`
+            direction_bins: Number of direction sectors
+            speed_resolution: Width of each speed bin (m/s)
+            max_speed: Upper edge of the last speed bin (m/s)
+            fingerprint: Dataset fingerprint to record on the table
+
+        Returns:
+            The populated frequency table
+        """
+        n_speed = int(np.ceil(max_speed / speed_resolution))
+        sector_width = 360.0 / direction_bins
+        counts = np.zeros(direction_bins * n_speed, dtype=np.int64)
+
+        for wind_speeds, wind_directions in chunks:
+            directions = np.mod(np.asarray(wind_directions, dtype=float), 360.0)
+            dir_idx = np.floor((directions + sector_width / 2) / sector_width).astype(np.int64)
+            speed_idx = np.clip((np.asarray(wind_speeds, dtype=float) / speed_resolution)
+                                .astype(np.int64), 0, n_speed - 1)
+            counts += np.bincount((dir_idx % direction_bins) * n_speed + speed_idx,
+                                  minlength=counts.size)
+
+        return cls(counts.reshape(direction_bins, n_speed), speed_resolution, fingerprint)
+
+    @property
+    def n_samples(self) -> int:
+        """Total number of samples in the table."""
+        return int(self.counts.sum())
+
+    @property
+    def directions(self) -> np.ndarray:
+        """Sector centre directions (degrees)."""
+        return np.arange(self.counts.shape[0]) * 360.0 / self.counts.shape[0]
+
+    @property
+    def speed_centres(self) -> np.ndarray:
+        """Speed bin centres (m/s)."""
+        return (np.arange(self.counts.shape[1]) + 0.5) * self.speed_resolution
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        """Joint probabilities of shape (direction_bins, speed_bins)."""
+        return self.counts / max(self.n_samples, 1)
+
+    def sector_frequencies(self) -> np.ndarray:
+        """Probability of each direction sector."""
+        return self.frequencies.sum(axis=1)
+
+    def speed_histogram(self) -> np.ndarray:
+        """Sample counts per speed bin over all directions."""
+        return self.counts.sum(axis=0)
+
+    def to_wind_rose(self, speed_bin_width: float = 1.0) -> Dict[str, np.ndarray]:
+        """
+        Aggregate the table into a wind rose for the AEP engines.
+
+        Args:
+            speed_bin_width: Speed bin width of the wind rose, a multiple of
+                ``speed_resolution`` (m/s)
+
+        Returns:
+            Dictionary in the format of :func:`bin_wind_rose`
+        """
+        factor = max(1, int(round(speed_bin_width / self.speed_resolution)))
+        n_bins = int(np.ceil(self.counts.shape[1] / factor))
+        padded = np.zeros((self.counts.shape[0], n_bins * factor), dtype=np.int64)
+        padded[:, :self.counts.shape[1]] = self.counts
+        grouped = padded.reshape(self.counts.shape[0], n_bins, factor).sum(axis=2)
+
+        # Trim trailing empty speed bins
+        occupied = np.flatnonzero(grouped.sum(axis=0))
+        n_keep = occupied[-1] + 1 if occupied.size else 1
+        width = factor * self.speed_resolution
+        return {
+            'directions': self.directions,
+            'speeds': (np.arange(n_keep) + 0.5) * width,
+            'frequencies': grouped[:, :n_keep] / max(self.n_samples, 1),
+        }
+
+    def summary(self, turbine_config: Optional[Dict] = None,
+                air_density: Optional[float] = None) -> Dict:
+        """
+        Summarize the record in the format of ``get_wind_data_summary``.
+
+        Statistics are computed from bin centres, so they carry a
+        discretization error of order ``speed_resolution``.
+
+        Args:
+            turbine_config: Turbine parameters (``wind_farm`` section of config.yaml)
+            air_density: Air density for the power density and power curve
+                (kg/m³; defaults to the turbine config's ``air_density``)
+
+        Returns:
+            Dictionary with speed statistics, Weibull parameters, direction
+            statistics, power density and capacity factor
+        """
+        if self.n_samples == 0:
+            raise ValueError("Frequency table is empty")
+
+        curve = PowerCurve.from_config(turbine_config, air_density=air_density)
+        centres = self.speed_centres
+        histogram = self.speed_histogram()
+        probs = histogram / self.n_samples
+        mean = float((probs * centres).sum())
+        occupied = np.flatnonzero(histogram)
+        cumulative = np.cumsum(histogram)
+
+        sectors = self.sector_frequencies()
+        theta = np.radians(self.directions)
+        mean_sin, mean_cos = (sectors * np.sin(theta)).sum(), (sectors * np.cos(theta)).sum()
+
+        return {
+            'n_samples': self.n_samples,
+            'wind_speed_analysis': {
+                'mean': mean,
+                'std': float(np.sqrt((probs * (centres - mean) ** 2).sum())),
+                'min': float(occupied[0] * self.speed_resolution),
+                'max': float((occupied[-1] + 1) * self.speed_resolution),
+                'median': float(centres[np.searchsorted(cumulative, 0.5 * self.n_samples)]),
+            },
+            'weibull_parameters': fit_weibull_histogram(centres, histogram),
+            'wind_direction_analysis': {
+                'mean_direction': float(np.degrees(np.arctan2(mean_sin, mean_cos)) % 360.0),
+                'directional_consistency': float(np.hypot(mean_sin, mean_cos)),
+                'dominant_direction': float(self.directions[np.argmax(sectors)]),
+                'sector_frequencies': sectors.tolist(),
+            },
+            'power_density_w_m2': float(0.5 * curve.air_density * (probs * centres ** 3).sum()),
+            'capacity_factor': curve.capacity_factor(centres, weights=probs),
+        }
+
+    def save(self, path) -> Path:
+        """Save the table as a compressed NPZ file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(path, counts=self.counts, speed_resolution=self.speed_resolution,
+                            fingerprint=np.array(self.fingerprint or ''))
+        return path
+
+    @classmethod
+    def load(cls, path) -> 'WindFrequencyTable':
+        """Load a table saved by :meth:`save`."""
+        with np.load(path) as data:
+            return cls(data['counts'], float(data['speed_resolution']),
+                       str(data['fingerprint']) or None)
+
+
+def dataset_fingerprint(source, config: Optional[Dict] = None) -> str:
+    """
+    Content hash of a wind dataset plus the table configuration.
+
+    Args:
+        source: Path to a wind data file, or a (speeds, directions) tuple of arrays
+        config: Binning configuration that affects the table
+
+    Returns:
+        Hex digest identifying the dataset/config combination
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(json.dumps(config or {}, sort_keys=True, default=str).encode())
+
+    if isinstance(source, (str, Path)):
+        with open(source, 'rb') as f:
+            for block in iter(lambda: f.read(FINGERPRINT_BLOCK_SIZE), b''):
+                digest.update(block)
+    else:
+        for array in source:
+            array = np.ascontiguousarray(array, dtype=np.float64)
+            digest.update(str(array.shape).encode())
+            digest.update(memoryview(array).cast('B'))
+    return digest.hexdigest()
+
+
+def load_or_build_frequency_table(source: Union[str, Path, tuple], cache_dir='data/cache',
+                                  direction_bins: int = 16, speed_resolution: float = 0.1,
+                                  max_speed: float = 50.0,
+                                  chunk_size: int = 1_000_000) -> WindFrequencyTable:
+    """
+    Return the cached frequency table for a dataset, building it if needed.
+
+    Args:
+        source: Path to a wind CSV file, or a (speeds, directions) tuple of arrays
+        cache_dir: Directory holding cached tables (None disables caching)
+        direction_bins: Number of direction sectors
+        speed_resolution: Width of each speed bin (m/s)
+        max_speed: Upper edge of the last speed bin (m/s)
+        chunk_size: Samples per chunk for the raw pass
+
+    Returns:
+        The frequency table
+    """
+    config = {'direction_bins': direction_bins, 'speed_resolution': speed_resolution,
+              'max_speed': max_speed}
+    fingerprint = dataset_fingerprint(source, config)
+    cache_path = Path(cache_dir) / f"wind_table_{fingerprint}.npz" if cache_dir else None
+
+    if cache_path is not None and cache_path.exists():
+        return WindFrequencyTable.load(cache_path)
+
+    if isinstance(source, (str, Path)):
+        chunks = iter_wind_csv(source, chunk_size=chunk_size)
+    else:
+        chunks = iter_wind_arrays(*source, chunk_size=chunk_size)
+    table = WindFrequencyTable.from_chunks(chunks, fingerprint=fingerprint, **config)
+
+    if cache_path is not None:
+        table.save(cache_path)
+    return table
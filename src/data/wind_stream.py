@@ -0,0 +1,296 @@
+"""
+Streaming wind time-series ingestion for the AI Wind Farm Optimizer.
+
+Multi-year hourly or 10-minute SCADA/mast records are read in fixed-size
+chunks and reduced into mergeable statistics, so memory stays flat no
+matter how long the record is. The resulting summary mirrors the keys of
+``WindDataProcessor.get_wind_data_summary``.
+"""
+
+import numpy as np
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from scipy.optimize import brentq
+
+from ..models.power_calculations import DEFAULT_TURBINE_CONFIG, PowerCurve
+
+WindChunk = Tuple[np.ndarray, np.ndarray]
+
+WEIBULL_K_BOUNDS = (0.01, 100.0)  # shape search range of the histogram fit
+
+
+def iter_wind_arrays(wind_speeds, wind_directions,
+                     chunk_size: int = 1_000_000) -> Iterator[WindChunk]:
+    """
+    Yield (speeds, directions) chunks from in-memory or memory-mapped arrays.
+
+    Args:
+        wind_speeds: Wind speed samples (m/s)
+        wind_directions: Wind direction samples (degrees)
+        chunk_size: Samples per chunk
+
+    Yields:
+        Tuples of speed and direction views of at most ``chunk_size`` samples
+    """
+    for start in range(0, len(wind_speeds), chunk_size):
+        yield (np.asarray(wind_speeds[start:start + chunk_size], dtype=float),
+               np.asarray(wind_directions[start:start + chunk_size], dtype=float))
+
+
+def iter_wind_csv(path, chunk_size: int = 1_000_000, speed_column: str = 'wind_speed',
+                  direction_column: str = 'wind_direction') -> Iterator[WindChunk]:
+    """
+    Yield (speeds, directions) chunks from a wind CSV file.
+
+    Only the two required columns are parsed, and rows with missing values
+    are dropped chunk by chunk.
+
+    Args:
+        path: CSV file path (as written by ``FileUtils.save_data``)
+        chunk_size: Rows per chunk
+        speed_column: Name of the wind speed column
+        direction_column: Name of the wind direction column
+
+    Yields:
+        Tuples of speed and direction arrays
+    """
+    import pandas as pd  # deferred: only the CSV path needs pandas
+
+    reader = pd.read_csv(path, usecols=[speed_column, direction_column],
+                         dtype={speed_column: 'float64', direction_column: 'float64'},
+                         chunksize=chunk_size)
+    for frame in reader:
+        frame = frame.dropna()
+        yield frame[speed_column].to_numpy(), frame[direction_column].to_numpy()
+
+
+def generate_time_series_chunks(n_points: int, chunk_size: int = 1_000_000,
+                                weibull_k: float = 2.0, weibull_c: float = 8.0,
+                                dominant_direction: float = 270.0, direction_spread: float = 45.0,
+                                random_state: Optional[int] = None) -> Iterator[WindChunk]:
+    """
+    Generate a synthetic Weibull/dominant-direction series chunk by chunk.
+
+    Args:
+        n_points: Total number of samples
+        chunk_size: Samples per chunk
+        weibull_k: Weibull shape parameter
+        weibull_c: Weibull scale parameter (m/s)
+        dominant_direction: Mean wind direction (degrees)
+        direction_spread: Standard deviation of the direction (degrees)
+        random_state: Seed for reproducible output
+
+    Yields:
+        Tuples of speed and direction arrays
+    """
+    rng = np.random.default_rng(random_state)
+    for start in range(0, n_points, chunk_size):
+        size = min(chunk_size, n_points - start)
+        speeds = weibull_c * rng.weibull(weibull_k, size)
+        directions = np.mod(rng.normal(dominant_direction, direction_spread, size), 360.0)
+        yield speeds, directions
+
+
+def fit_weibull_histogram(speed_centres, counts) -> Dict[str, float]:
+    """
+    Maximum-likelihood Weibull fit on binned wind speeds.
+
+    Samples that (nearly) all fall in one bin are narrower than any
+    Weibull the bins can resolve; the fit then returns the largest shape
+    in ``WEIBULL_K_BOUNDS`` with the matching scale instead of failing.
+
+    Args:
+        speed_centres: Speed bin centres (m/s)
+        counts: Number of samples in each bin
+
+    Returns:
+        Dictionary with shape ``k`` and scale ``c`` (m/s), NaN when empty
+    """
+    centres = np.asarray(speed_centres, dtype=float)
+    weights = np.asarray(counts, dtype=float)
+    mask = (weights > 0) & (centres > 0)
+    centres, weights = centres[mask], weights[mask]
+    if weights.sum() == 0:
+        return {'k': np.nan, 'c': np.nan}
+
+    log_u = np.log(centres)
+    mean_log = np.average(log_u, weights=weights)
+    # Powers relative to the largest speed stay finite for large k
+    shift = log_u.max()
+
+    def score(k):
+        powered = weights * np.exp(k * (log_u - shift))
+        return (powered * log_u).sum() / powered.sum() - 1.0 / k - mean_log
+
+    # score rises monotonically in k, from -inf towards max(log u) - mean_log
+    low, high = WEIBULL_K_BOUNDS
+    k = brentq(score, low, high) if score(high) > 0 else high
+    mean_power = np.average(np.exp(k * (log_u - shift)), weights=weights)
+    c = np.exp(shift + np.log(mean_power) / k)
+    return {'k': float(k), 'c': float(c)}
+
+
+class StreamingWindStats:
+    """
+    Mergeable streaming statistics for wind speed and direction.
+
+    Tracks exact moments (Chan/Welford), extremes, mean cubed speed and
+    mean turbine power, plus a fine speed histogram used for the median
+    and a binned maximum-likelihood Weibull fit. Two instances built over
+    disjoint parts of a record can be merged into the statistics of the
+    whole record.
+    """
+
+    def __init__(self, turbine_config: Optional[Dict] = None, direction_bins: int = 16,
+                 speed_resolution: float = 0.1, max_speed: float = 50.0,
+                 air_density: Optional[float] = None):
+        """
+        Initialize empty statistics.
+
+        Args:
+            turbine_config: Turbine parameters (``wind_farm`` section of config.yaml)
+            direction_bins: Number of direction sectors
+            speed_resolution: Histogram bin width (m/s)
+            max_speed: Upper edge of the speed histogram (m/s)
+            air_density: Air density for the power density and power curve
+                (kg/m³; defaults to the turbine config's ``air_density``)
+        """
+        self.turbine_config = {**DEFAULT_TURBINE_CONFIG, **(turbine_config or {})}
+        self.direction_bins = int(direction_bins)
+        self.speed_resolution = float(speed_resolution)
+        self.max_speed = float(max_speed)
+        self.power_curve = PowerCurve.from_config(self.turbine_config, air_density=air_density)
+        self.air_density = self.power_curve.air_density
+
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+        self.sum_cubed = 0.0
+        self.sum_power = 0.0
+        self.sum_sin = 0.0
+        self.sum_cos = 0.0
+        n_speed = int(np.ceil(max_speed / speed_resolution))
+        self.speed_histogram = np.zeros(n_speed, dtype=np.int64)
+        self.direction_counts = np.zeros(self.direction_bins, dtype=np.int64)
+
+    def update(self, wind_speeds, wind_directions) -> 'StreamingWindStats':
+        """Fold one chunk of samples into the statistics."""
+        speeds = np.asarray(wind_speeds, dtype=float)
+        directions = np.mod(np.asarray(wind_directions, dtype=float), 360.0)
+        if speeds.size == 0:
+            return self
+
+        chunk = StreamingWindStats(self.turbine_config, self.direction_bins,
+                                   self.speed_resolution, self.max_speed, self.air_density)
+        chunk.count = speeds.size
+        chunk.mean = float(speeds.mean())
+        chunk.m2 = float(((speeds - chunk.mean) ** 2).sum())
+        chunk.minimum = float(speeds.min())
+        chunk.maximum = float(speeds.max())
+        chunk.sum_cubed = float((speeds ** 3).sum())
+        chunk.sum_power = float(self.power_curve(speeds).sum())
+
+        theta = np.radians(directions)
+        chunk.sum_sin = float(np.sin(theta).sum())
+        chunk.sum_cos = float(np.cos(theta).sum())
+
+        n_speed = len(self.speed_histogram)
+        speed_idx = np.clip((speeds / self.speed_resolution).astype(np.int64), 0, n_speed - 1)
+        chunk.speed_histogram = np.bincount(speed_idx, minlength=n_speed)
+
+        sector_width = 360.0 / self.direction_bins
+        dir_idx = np.floor((directions + sector_width / 2) / sector_width).astype(np.int64)
+        chunk.direction_counts = np.bincount(dir_idx % self.direction_bins,
+                                             minlength=self.direction_bins)
+
+        return self.merge(chunk)
+
+    def merge(self, other: 'StreamingWindStats') -> 'StreamingWindStats':
+        """Combine another instance's statistics into this one in place."""
+        if (other.direction_bins != self.direction_bins
+                or len(other.speed_histogram) != len(self.speed_histogram)):
+            raise ValueError("Cannot merge statistics with different binning")
+        if other.count == 0:
+            return self
+
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        self.sum_cubed += other.sum_cubed
+        self.sum_power += other.sum_power
+        self.sum_sin += other.sum_sin
+        self.sum_cos += other.sum_cos
+        self.speed_histogram += other.speed_histogram
+        self.direction_counts += other.direction_counts
+        return self
+
+    def fit_weibull(self) -> Dict[str, float]:
+        """Maximum-likelihood Weibull fit on the speed histogram."""
+        centres = (np.arange(len(self.speed_histogram)) + 0.5) * self.speed_resolution
+        return fit_weibull_histogram(centres, self.speed_histogram)
+
+    def quantile(self, q: float) -> float:
+        """Approximate speed quantile from the histogram (m/s)."""
+        cumulative = np.cumsum(self.speed_histogram)
+        idx = int(np.searchsorted(cumulative, q * cumulative[-1]))
+        return (idx + 0.5) * self.speed_resolution
+
+    def summary(self) -> Dict:
+        """
+        Summarize the record in the format of ``get_wind_data_summary``.
+
+        Returns:
+            Dictionary with speed statistics, Weibull parameters, direction
+            statistics, power density and capacity factor
+        """
+        if self.count == 0:
+            raise ValueError("No wind samples have been processed")
+
+        mean_direction = np.degrees(np.arctan2(self.sum_sin, self.sum_cos)) % 360.0
+        resultant = np.hypot(self.sum_sin, self.sum_cos) / self.count
+        sector_width = 360.0 / self.direction_bins
+
+        return {
+            'n_samples': self.count,
+            'wind_speed_analysis': {
+                'mean': self.mean,
+                'std': float(np.sqrt(self.m2 / self.count)),
+                'min': self.minimum,
+                'max': self.maximum,
+                'median': self.quantile(0.5),
+            },
+            'weibull_parameters': self.fit_weibull(),
+            'wind_direction_analysis': {
+                'mean_direction': float(mean_direction),
+                'directional_consistency': float(resultant),
+                'dominant_direction': float(np.argmax(self.direction_counts) * sector_width),
+                'sector_frequencies': (self.direction_counts / self.count).tolist(),
+            },
+            'power_density_w_m2': 0.5 * self.air_density * self.sum_cubed / self.count,
+            'capacity_factor': self.sum_power / (self.count * self.power_curve.rated_power),
+        }
+
+
+def summarize_wind_stream(chunks: Iterable[WindChunk], turbine_config: Optional[Dict] = None,
+                          direction_bins: int = 16, **kwargs) -> Dict:
+    """
+    Reduce a stream of (speeds, directions) chunks into a wind summary.
+
+    Args:
+        chunks: Iterable of chunks, e.g. from :func:`iter_wind_csv`
+        turbine_config: Turbine parameters (``wind_farm`` section of config.yaml)
+        direction_bins: Number of direction sectors
+        **kwargs: Extra arguments for :class:`StreamingWindStats`
+
+    Returns:
+        Summary dictionary from :meth:`StreamingWindStats.summary`
+    """
+    stats = StreamingWindStats(turbine_config, direction_bins=direction_bins, **kwargs)
+    for wind_speeds, wind_directions in chunks:
+        stats.update(wind_speeds, wind_directions)
+    return stats.summary()
@@ -0,0 +1,55 @@
+"""
+Physics and optimization models for the AI Wind Farm Optimizer.
+"""
+
+from .power_calculations import PowerCurve, power_curve, bin_wind_rose, weibull_wind_rose
+from .wake_models import JensenWakeModel
+from .spatial_index import NeighbourIndex, wake_truncation_distance
+from .fitness_cache import FitnessCache
+from .checkpoint import save_checkpoint, load_checkpoint
+from .layout_sampling import (InfeasibleLayoutError, PoissonDiskLayoutSampler, exclusion_distance,
+                              points_in_polygons)
+from .optimizer import (GeneticLayoutOptimizer, layout_fitness, spacing_penalty, exclusion_penalty,
+                        grid_layout)
+from .surrogate import SurrogateFitnessModel, layout_features
+from .gradient_optimizer import (GaussianWakeModel, GradientLayoutOptimizer, spacing_constraints,
+                                 exclusion_constraints)
+from .rl_environment import VectorizedPlacementEnv
+from .incremental_aep import IncrementalAEPEvaluator
+from .parallel_aep import SectorParallelAEP, sector_aep
+from .uncertainty import MonteCarloAEPAnalysis, QuantileSketch, exceedance_table
+
+__all__ = [
+    'PowerCurve',
+    'power_curve',
+    'bin_wind_rose',
+    'weibull_wind_rose',
+    'JensenWakeModel',
+    'NeighbourIndex',
+    'wake_truncation_distance',
+    'FitnessCache',
+    'save_checkpoint',
+    'load_checkpoint',
+    'PoissonDiskLayoutSampler',
+    'points_in_polygons',
+    'exclusion_distance',
+    'InfeasibleLayoutError',
+    'GeneticLayoutOptimizer',
+    'layout_fitness',
+    'spacing_penalty',
+    'exclusion_penalty',
+    'grid_layout',
+    'SurrogateFitnessModel',
+    'layout_features',
+    'GaussianWakeModel',
+    'GradientLayoutOptimizer',
+    'spacing_constraints',
+    'exclusion_constraints',
+    'VectorizedPlacementEnv',
+    'IncrementalAEPEvaluator',
+    'SectorParallelAEP',
+    'sector_aep',
+    'MonteCarloAEPAnalysis',
+    'QuantileSketch',
+    'exceedance_table',
+]
@@ -0,0 +1,64 @@
+"""
+Checkpointing for long optimization runs.
+
+Checkpoints are binary pickles of the optimizer state (population,
+fitness, RNG state, best-so-far, history and cache). They are written
+atomically, so a job killed mid-write still leaves the previous
+checkpoint intact. Unpickling can execute arbitrary code, so only load
+checkpoints this tool wrote on a trusted machine; they are run outputs
+(results/ is not tracked) and must never be shipped with the repository.
+"""
+
+import os
+import pickle
+from pathlib import Path
+from typing import Dict, Optional
+
+CHECKPOINT_VERSION = 2
+
+
+def save_checkpoint(state: Dict, path) -> Path:
+    """
+    Atomically write an optimizer checkpoint.
+
+    Args:
+        state: Optimizer state dictionary
+        path: Destination file path
+
+    Returns:
+        Path of the written checkpoint
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+
+    with open(tmp_path, 'wb') as f:
+        pickle.dump({'version': CHECKPOINT_VERSION, **state}, f,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_checkpoint(path) -> Optional[Dict]:
+    """
+    Load an optimizer checkpoint.
+
+    The file is unpickled, so it must come from a trusted source.
+
+    Args:
+        path: Checkpoint file path
+
+    Returns:
+        State dictionary, or None if no checkpoint exists
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+
+    with open(path, 'rb') as f:
+        state = pickle.load(f)
+    if state.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version in {path}: {state.get('version')}")
+    return state
@@ -0,0 +1,105 @@
+"""
+Fitness caching for layout optimizers.
+
+This module provides a size-bounded LRU cache keyed by a quantized,
+order-independent layout hash so elites and repeated children are not
+re-scored by the wake model.
+"""
+
+import hashlib
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+
+
+class FitnessCache:
+    """
+    Bounded LRU cache mapping layout hashes to fitness values.
+
+    Positions are rounded to ``quantization`` metres and turbines are
+    sorted before hashing, so relabelled or numerically identical layouts
+    share one entry.
+    """
+
+    def __init__(self, max_entries: int = 100000, quantization: float = 0.01):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached layouts (0 disables caching)
+            quantization: Position resolution used for hashing (m)
+        """
+        self.max_entries = int(max_entries)
+        self.quantization = float(quantization)
+        self.entries: 'OrderedDict[bytes, float]' = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def layout_keys(self, population) -> List[bytes]:
+        """Hash each layout of an (L, N, 2) population."""
+        quantized = np.round(np.asarray(population, dtype=float) / self.quantization)
+        quantized = quantized.astype(np.int64)
+        keys = []
+        for layout in quantized:
+            ordered = layout[np.lexsort((layout[:, 1], layout[:, 0]))]
+            keys.append(hashlib.blake2b(ordered.tobytes(), digest_size=16).digest())
+        return keys
+
+    def lookup(self, keys: List[bytes]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Fetch cached fitness values.
+
+        Args:
+            keys: Layout keys from :meth:`layout_keys`
+
+        Returns:
+            Tuple of fitness values (NaN where missing) and a boolean miss mask
+        """
+        values = np.full(len(keys), np.nan)
+        for i, key in enumerate(keys):
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                values[i] = self.entries[key]
+        missing = np.isnan(values)
+        self.hits += int((~missing).sum())
+        self.misses += int(missing.sum())
+        return values, missing
+
+    def store(self, keys: List[bytes], values):
+        """Insert fitness values, evicting the least recently used entries."""
+        if self.max_entries <= 0:
+            return
+        for key, value in zip(keys, values):
+            self.entries[key] = float(value)
+            self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+    def stats(self, seconds_per_evaluation: float = 0.0) -> Dict[str, float]:
+        """
+        Summarize cache effectiveness.
+
+        Args:
+            seconds_per_evaluation: Average cost of one exact evaluation
+
+        Returns:
+            Dictionary with hits, misses, hit rate, size and estimated time saved
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self.entries),
+            'time_saved_s': self.hits * seconds_per_evaluation,
+        }
+
+    def state_dict(self) -> Dict:
+        """Serializable cache contents and counters for checkpoints."""
+        return {'entries': list(self.entries.items()), 'hits': self.hits, 'misses': self.misses}
+
+    def load_state_dict(self, state: Dict):
+        """Restore contents and counters saved by :meth:`state_dict`."""
+        self.entries = OrderedDict(state['entries'])
+        self.hits = state['hits']
+        self.misses = state['misses']
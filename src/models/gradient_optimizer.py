@@ -0,0 +1,416 @@
+"""
+Gradient-based layout refinement for the AI Wind Farm Optimizer.
+
+The Jensen top-hat wake is piecewise constant in the turbine positions, so
+its AEP has no useful gradient. :class:`GaussianWakeModel` replaces the
+top hat with a Gaussian profile carrying the same centreline deficit and
+the same integrated deficit, and a smooth downwind gate, which makes AEP
+differentiable in every turbine coordinate. :class:`GradientLayoutOptimizer`
+feeds the analytic gradient and vectorized spacing and exclusion zone
+constraint Jacobians to SciPy's SLSQP (or L-BFGS-B with a quadratic
+penalty) to polish a starting layout, e.g. a GA result, into a nearby local optimum.
+"""
+
+import time
+import numpy as np
+from typing import Dict, Optional, Tuple
+from scipy.optimize import minimize
+
+from .layout_sampling import exclusion_distance, validate_exclusion_zones
+from .optimizer import DEFAULT_FARM_CONFIG, spacing_penalty
+from .power_calculations import HOURS_PER_YEAR
+from .wake_models import JensenWakeModel
+
+
+DEFAULT_GRADIENT_CONFIG = {
+    'method': 'SLSQP',
+    'max_iterations': 200,
+    'tolerance': 1e-6,
+    'penalty_weight': 100.0,  # L-BFGS-B only, per unit squared spacing/zone violation
+    'penalty_margin': 1.0,  # L-BFGS-B only, metres added to the penalized spacing/clearance
+    'feasibility_tolerance': 1e-3,  # metres of spacing/zone violation accepted in the result
+}
+
+
+def _sigmoid(x) -> np.ndarray:
+    """Numerically stable logistic function."""
+    return 0.5 * (1.0 + np.tanh(0.5 * np.asarray(x, dtype=float)))
+
+
+class GaussianWakeModel:
+    """
+    Smooth Gaussian wake with analytic AEP gradients.
+
+    A turbine at downwind distance x and crosswind offset y from a source
+    sees the deficit ``a (R/Rw)^2 exp(-y^2/Rw^2)`` with ``Rw = R + k x``:
+    the centreline deficit of the Jensen model and the same deficit
+    integrated over the wake cross-section. ``x`` is replaced by a
+    softplus and the wake is switched on by a sigmoid of width
+    ``smoothing``, and the power curve's corners are rounded, so AEP is
+    smooth everywhere. Deficits combine by root-sum-square and
+    positions/directions follow :class:`JensenWakeModel`.
+    """
+
+    def __init__(self, config: Optional[Dict] = None, wake_decay: float = 0.075,
+                 thrust_coefficient: float = 0.8, smoothing: Optional[float] = None,
+                 power_sharpness: float = 50.0, cut_out_width: float = 0.25):
+        """
+        Initialize the wake model.
+
+        Args:
+            config: Wind farm configuration (``wind_farm`` section of config.yaml)
+            wake_decay: Wake expansion coefficient k
+            thrust_coefficient: Rotor thrust coefficient Ct
+            smoothing: Length scale of the downwind gate (m), one rotor
+                radius by default
+            power_sharpness: Sharpness of the smoothed power-curve clamp
+            cut_out_width: Width of the smoothed cut-out roll-off (m/s)
+        """
+        self.config = {**DEFAULT_FARM_CONFIG, **(config or {})}
+        self.rotor_radius = self.config['turbine_diameter'] / 2.0
+        self.wake_decay = wake_decay
+        self.thrust_coefficient = thrust_coefficient
+        self.smoothing = smoothing or self.rotor_radius
+        self.initial_deficit = 1.0 - np.sqrt(1.0 - thrust_coefficient)
+        self.power_sharpness = power_sharpness
+        self.cut_out_width = cut_out_width
+
+    def _power(self, wind_speeds) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Smoothed power curve (kW) and its slope (kW per m/s).
+
+        The cubic ramp is clamped to [0, 1] with a softplus clamp and the
+        cut-out is a logistic roll-off, so the AEP stays differentiable
+        when wakes move a bin across rated or cut-out speed.
+        """
+        config = self.config
+        u = np.asarray(wind_speeds, dtype=float)
+        span = config['rated_speed'] ** 3 - config['cut_in_speed'] ** 3
+        ramp = (u ** 3 - config['cut_in_speed'] ** 3) / span
+        sharpness = self.power_sharpness
+        clamped = (np.logaddexp(0.0, sharpness * ramp)
+                   - np.logaddexp(0.0, sharpness * (ramp - 1.0))) / sharpness
+        d_clamped = (_sigmoid(sharpness * ramp) - _sigmoid(sharpness * (ramp - 1.0))) \
+            * 3.0 * u ** 2 / span
+
+        width = self.cut_out_width
+        cut_out = _sigmoid((config['cut_out_speed'] - u) / width)
+        d_cut_out = -cut_out * (1.0 - cut_out) / width
+
+        power = config['rated_power'] * clamped * cut_out
+        slope = config['rated_power'] * (d_clamped * cut_out + clamped * d_cut_out)
+        return power, slope
+
+    def _pair_geometry(self, positions, directions):
+        """Downwind/crosswind offsets of receiver i from source j, shape (D, N, N)."""
+        theta = np.radians(np.asarray(directions, dtype=float))[:, None, None]
+        sin_t, cos_t = np.sin(theta), np.cos(theta)
+        dx = positions[:, None, 0] - positions[None, :, 0]
+        dy = positions[:, None, 1] - positions[None, :, 1]
+        downwind = -(dx * sin_t + dy * cos_t)
+        crosswind = dx * cos_t - dy * sin_t
+        return downwind, crosswind, sin_t, cos_t
+
+    def pairwise_deficits(self, positions, directions, return_partials: bool = False):
+        """
+        Single-wake deficits and, optionally, their partial derivatives.
+
+        Args:
+            positions: Turbine positions of shape (N, 2)
+            directions: Wind directions in degrees, shape (D,)
+            return_partials: Also return d(deficit)/d(downwind) and
+                d(deficit)/d(crosswind)
+
+        Returns:
+            Deficits of shape (D, N, N) (``[d, i, j]`` is the deficit at i
+            caused by j), plus the two partial arrays when requested
+        """
+        positions = np.asarray(positions, dtype=float)
+        downwind, crosswind, sin_t, cos_t = self._pair_geometry(positions, directions)
+
+        scaled = downwind / self.smoothing
+        gate = _sigmoid(scaled)
+        softplus = self.smoothing * np.logaddexp(0.0, scaled)
+        wake_radius = self.rotor_radius + self.wake_decay * softplus
+        ratio = crosswind ** 2 / wake_radius ** 2
+
+        deficit = (gate * self.initial_deficit * (self.rotor_radius / wake_radius) ** 2
+                   * np.exp(-ratio))
+        diagonal = np.arange(len(positions))
+        deficit[:, diagonal, diagonal] = 0.0
+        if not return_partials:
+            return deficit
+
+        # d/d(downwind): gate slope plus wake growth through Rw (dRw/dx = k * gate)
+        d_downwind = deficit * ((1.0 - gate) / self.smoothing
+                                + 2.0 * (ratio - 1.0) / wake_radius * self.wake_decay * gate)
+        d_crosswind = deficit * (-2.0 * crosswind / wake_radius ** 2)
+        return deficit, d_downwind, d_crosswind
+
+    def aep(self, positions, wind_rose: Dict[str, np.ndarray]) -> float:
+        """AEP (MWh/year) of one layout."""
+        return self.aep_and_gradient(positions, wind_rose, gradient=False)[0]
+
+    def aep_and_gradient(self, positions, wind_rose: Dict[str, np.ndarray],
+                         gradient: bool = True) -> Tuple[float, Optional[np.ndarray]]:
+        """
+        AEP of one layout and its gradient with respect to every coordinate.
+
+        Args:
+            positions: Turbine positions of shape (N, 2)
+            wind_rose: Binned wind rose (see :func:`bin_wind_rose`)
+            gradient: Compute the gradient as well
+
+        Returns:
+            Tuple of AEP (MWh/year) and the gradient of shape (N, 2) in
+            MWh/year per metre (None when ``gradient`` is False)
+        """
+        positions = np.asarray(positions, dtype=float)
+        directions = np.asarray(wind_rose['directions'], dtype=float)
+        speeds = np.asarray(wind_rose['speeds'], dtype=float)
+        frequencies = np.asarray(wind_rose['frequencies'], dtype=float)
+        scale = HOURS_PER_YEAR / 1000.0
+
+        if gradient:
+            deficit, d_down, d_cross = self.pairwise_deficits(positions, directions, True)
+        else:
+            deficit = self.pairwise_deficits(positions, directions)
+        combined = np.sqrt(np.einsum('dij,dij->di', deficit, deficit))
+
+        effective = speeds[None, :, None] * (1.0 - combined[:, None, :])  # (D, S, N)
+        power, slope = self._power(effective)
+        aep = float(np.einsum('dsn,ds->', power, frequencies) * scale)
+        if not gradient:
+            return aep, None
+
+        # Back-propagate: AEP -> combined deficit -> pair deficits -> offsets
+        d_combined = -scale * np.einsum('dsn,ds,s->dn', slope, frequencies, speeds)
+        weight = d_combined / np.where(combined > 0.0, combined, 1.0)
+        d_pair = weight[:, :, None] * deficit
+        _, _, sin_t, cos_t = self._pair_geometry(positions[:1], directions)
+        sin_t, cos_t = sin_t[:, :, 0], cos_t[:, :, 0]
+        d_down, d_cross = d_pair * d_down, d_pair * d_cross
+        d_dx = (-sin_t[:, :, None] * d_down + cos_t[:, :, None] * d_cross).sum(axis=0)
+        d_dy = (-cos_t[:, :, None] * d_down - sin_t[:, :, None] * d_cross).sum(axis=0)
+
+        # Offsets are receiver minus source: +1 for the receiver, -1 for the source
+        grad = np.column_stack([d_dx.sum(axis=1) - d_dx.sum(axis=0),
+                                d_dy.sum(axis=1) - d_dy.sum(axis=0)])
+        return aep, grad
+
+
+def spacing_constraints(positions, min_distance: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pairwise spacing constraints and their Jacobian.
+
+    Args:
+        positions: Turbine positions of shape (N, 2)
+        min_distance: Minimum allowed turbine distance (m)
+
+    Returns:
+        Tuple of constraint values ``|p_i - p_j|^2 / d_min^2 - 1`` (>= 0 when
+        feasible) for every pair i < j, shape (M,), and the Jacobian with
+        respect to the flattened positions, shape (M, 2N)
+    """
+    positions = np.asarray(positions, dtype=float)
+    n_turbines = len(positions)
+    i, j = np.triu_indices(n_turbines, k=1)
+    diff = positions[i] - positions[j]
+    values = np.einsum('mc,mc->m', diff, diff) / min_distance ** 2 - 1.0
+
+    rows = np.arange(len(i))
+    jacobian = np.zeros((len(i), n_turbines, 2))
+    slope = 2.0 * diff / min_distance ** 2
+    jacobian[rows, i] = slope
+    jacobian[rows, j] = -slope
+    return values, jacobian.reshape(len(i), 2 * n_turbines)
+
+
+def exclusion_constraints(positions, exclusion_zones, min_distance: float
+                          ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Exclusion zone constraints and their Jacobian.
+
+    Args:
+        positions: Turbine positions of shape (N, 2)
+        exclusion_zones: Polygons, each a sequence of (x, y) vertices
+        min_distance: Length scale of the constraint values (m)
+
+    Returns:
+        Tuple of each turbine's signed distance to the nearest zone
+        boundary divided by ``min_distance`` (>= 0 when outside every
+        zone), shape (N,), and the Jacobian with respect to the flattened
+        positions, shape (N, 2N)
+    """
+    positions = np.asarray(positions, dtype=float)
+    n_turbines = len(positions)
+    distance, gradient = exclusion_distance(positions, exclusion_zones, return_gradient=True)
+    jacobian = np.zeros((n_turbines, n_turbines, 2))
+    jacobian[np.arange(n_turbines), np.arange(n_turbines)] = gradient / min_distance
+    return distance / min_distance, jacobian.reshape(n_turbines, 2 * n_turbines)
+
+
+class GradientLayoutOptimizer:
+    """
+    Local layout refinement with analytic gradients.
+
+    Coordinates are optimized in units of the farm size, with the farm
+    rectangle as simple bounds. SLSQP handles the spacing and exclusion
+    zone constraints exactly; L-BFGS-B replaces them with a smooth
+    quadratic penalty. The
+    refined layout is re-scored with the reference (Jensen) wake model and
+    only accepted when it is feasible and beats the starting layout.
+    """
+
+    def __init__(self, config: Optional[Dict] = None, gradient_config: Optional[Dict] = None,
+                 wake_model: Optional[JensenWakeModel] = None):
+        """
+        Initialize the optimizer.
+
+        Args:
+            config: Wind farm configuration (``wind_farm`` section of config.yaml)
+            gradient_config: Solver settings (see ``DEFAULT_GRADIENT_CONFIG``)
+            wake_model: Reference wake model used to score the result
+        """
+        self.config = {**DEFAULT_FARM_CONFIG, **(config or {})}
+        self.gradient_config = {**DEFAULT_GRADIENT_CONFIG, **(gradient_config or {})}
+        if self.gradient_config['method'] not in ('SLSQP', 'L-BFGS-B'):
+            raise ValueError(f"Unknown gradient method: {self.gradient_config['method']}")
+        self.wake_model = wake_model or JensenWakeModel(self.config)
+        self.smooth_model = GaussianWakeModel(self.config, self.wake_model.wake_decay,
+                                              self.wake_model.thrust_coefficient)
+        self.bounds = np.array([self.config['farm_width'], self.config['farm_height']],
+                               dtype=float)
+        self.exclusion_zones = validate_exclusion_zones(self.config['exclusion_zones'])
+
+    def optimize(self, wind_rose: Dict[str, np.ndarray], initial_positions,
+                 verbose: bool = False) -> Dict:
+        """
+        Refine a layout to a nearby local optimum.
+
+        Args:
+            wind_rose: Binned wind rose
+            initial_positions: Starting positions of shape (N, 2), e.g.
+                ``DataGenerator.generate_turbine_positions`` or a GA result
+            verbose: Print progress every 10 iterations
+
+        Returns:
+            Dictionary with ``best_positions``, ``best_aep_mwh`` and
+            ``initial_aep_mwh`` (reference model), ``smooth_aep_mwh``,
+            ``accepted``, ``evaluations``, ``gradient_evaluations``,
+            ``iterations``, ``history``, solver ``message`` and ``runtime_s``;
+            ``evaluations`` counts every smooth-model AEP evaluation
+        """
+        start = time.perf_counter()
+        settings = self.gradient_config
+        initial = np.clip(np.asarray(initial_positions, dtype=float), 0.0, self.bounds)
+        n_turbines = len(initial)
+        min_distance = float(self.config['min_turbine_distance'])
+        ideal = self.wake_model.ideal_aep(n_turbines, wind_rose)
+        flat_scale = np.tile(self.bounds, n_turbines)
+        stats = {'evaluations': 0}
+        last = {'z': None, 'aep': None}
+        history = {'iteration': [], 'smooth_aep_mwh': []}
+
+        def to_positions(z):
+            return (z * flat_scale).reshape(n_turbines, 2)
+
+        def objective(z):
+            stats['evaluations'] += 1
+            aep, grad = self.smooth_model.aep_and_gradient(to_positions(z), wind_rose)
+            last['z'], last['aep'] = np.array(z), aep
+            value, grad = -aep / ideal, -grad.ravel() * flat_scale / ideal
+            if settings['method'] == 'L-BFGS-B':
+                # The penalty balances at a small violation, so aim slightly wide
+                g, jac = spacing_constraints(to_positions(z),
+                                             min_distance + settings['penalty_margin'])
+                if self.exclusion_zones:
+                    zone_g, zone_jac = exclusion_constraints(
+                        to_positions(z), self.exclusion_zones, min_distance)
+                    g = np.concatenate([g, zone_g - settings['penalty_margin'] / min_distance])
+                    jac = np.concatenate([jac, zone_jac])
+                violation = np.minimum(g, 0.0)
+                value += settings['penalty_weight'] * np.sum(violation ** 2)
+                grad += 2.0 * settings['penalty_weight'] * (violation @ jac) * flat_scale
+            return value, grad
+
+        def constraint(z):
+            return spacing_constraints(to_positions(z), min_distance)[0]
+
+        def constraint_jacobian(z):
+            return spacing_constraints(to_positions(z), min_distance)[1] * flat_scale
+
+        def zone_constraint(z):
+            return exclusion_constraints(to_positions(z), self.exclusion_zones, min_distance)[0]
+
+        def zone_constraint_jacobian(z):
+            return exclusion_constraints(to_positions(z), self.exclusion_zones,
+                                         min_distance)[1] * flat_scale
+
+        def smooth_aep(z):
+            # The solvers report iterates they have just evaluated; reuse that
+            # value and count any other evaluation
+            if last['z'] is not None and np.array_equal(z, last['z']):
+                return last['aep']
+            stats['evaluations'] += 1
+            return self.smooth_model.aep(to_positions(z), wind_rose)
+
+        def callback(z, *args):
+            aep = smooth_aep(z)
+            history['iteration'].append(len(history['iteration']) + 1)
+            history['smooth_aep_mwh'].append(aep)
+            if verbose and len(history['iteration']) % 10 == 0:
+                print(f"   Iteration {len(history['iteration'])}: {aep:.0f} MWh/yr (smooth)")
+
+        options = {'maxiter': settings['max_iterations']}
+        constraints = ()
+        if settings['method'] == 'SLSQP':
+            options['ftol'] = settings['tolerance']
+            if n_turbines > 1:
+                constraints += ({'type': 'ineq', 'fun': constraint, 'jac': constraint_jacobian},)
+            if self.exclusion_zones:
+                constraints += ({'type': 'ineq', 'fun': zone_constraint,
+                                 'jac': zone_constraint_jacobian},)
+        else:
+            options['ftol'] = settings['tolerance']
+            options['gtol'] = settings['tolerance']
+            # The spacing penalty makes the problem stiff near the bounds;
+            # allow a longer line search than the default 20 steps
+            options['maxls'] = 100
+
+        solution = minimize(objective, (initial / self.bounds).ravel(), jac=True,
+                            method=settings['method'], bounds=[(0.0, 1.0)] * (2 * n_turbines),
+                            constraints=constraints, options=options, callback=callback)
+
+        refined = np.clip(to_positions(solution.x), 0.0, self.bounds)
+        initial_aep = float(self.wake_model.calculate_aep(initial, wind_rose))
+        refined_aep = float(self.wake_model.calculate_aep(refined, wind_rose))
+        # Spacing penalty is a sum of (d_min - d) / d_min over violating pairs
+        violation_m = float(spacing_penalty(refined[None], min_distance)[0]) * min_distance
+        zone_violation_m = (float(np.clip(-exclusion_distance(refined, self.exclusion_zones),
+                                          0.0, None).sum())
+                            if self.exclusion_zones else 0.0)
+        accepted = (violation_m <= settings['feasibility_tolerance']
+                    and zone_violation_m <= settings['feasibility_tolerance']
+                    and refined_aep >= initial_aep)
+
+        return {
+            'best_positions': refined if accepted else initial,
+            'best_aep_mwh': refined_aep if accepted else initial_aep,
+            'initial_aep_mwh': initial_aep,
+            'refined_aep_mwh': refined_aep,
+            'smooth_aep_mwh': -float(solution.fun) * ideal if settings['method'] == 'SLSQP'
+            else smooth_aep(solution.x),
+            'accepted': bool(accepted),
+            'spacing_violation_m': violation_m,
+            'exclusion_violation_m': zone_violation_m,
+            'n_turbines': n_turbines,
+            'method': settings['method'],
+            'evaluations': stats['evaluations'],
+            'gradient_evaluations': int(getattr(solution, 'njev', stats['evaluations'])),
+            'iterations': int(solution.nit),
+            'success': bool(solution.success),
+            'message': str(solution.message),
+            'history': history,
+            'runtime_s': time.perf_counter() - start,
+        }
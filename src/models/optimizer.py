@@ -0,0 +1,562 @@
+"""
+Layout optimization algorithms for the AI Wind Farm Optimizer.
+
+This module implements a genetic algorithm driven by the ``ml`` section of
+config.yaml. The whole population is scored with one batched fitness call,
+optionally sharded across a process pool, and the run history is returned
+in the format consumed by the optimization plots. Long runs can checkpoint
+periodically, resume exactly where they stopped, and skip re-scoring
+layouts already held in a fitness cache.
+"""
+
+import time
+import warnings
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+from .checkpoint import load_checkpoint, save_checkpoint
+from .fitness_cache import FitnessCache
+from .layout_sampling import (DEFAULT_LAYOUT_CONFIG, InfeasibleLayoutError,
+                              PoissonDiskLayoutSampler, exclusion_distance,
+                              validate_exclusion_zones)
+from .power_calculations import DEFAULT_TURBINE_CONFIG, HOURS_PER_YEAR
+from .spatial_index import NeighbourIndex
+from .surrogate import SurrogateFitnessModel
+from .wake_models import JensenWakeModel
+
+
+DEFAULT_FARM_CONFIG = {
+    **DEFAULT_TURBINE_CONFIG,
+    **DEFAULT_LAYOUT_CONFIG,
+    'max_turbines': 50,
+}
+
+DEFAULT_ML_CONFIG = {
+    'random_state': 42,
+    'population_size': 50,
+    'generations': 100,
+    'mutation_rate': 0.1,
+    'crossover_rate': 0.8,
+    'elite_size': 2,
+    'tournament_size': 3,
+    'mutation_scale': 0.05,
+    'n_workers': 1,
+    'cache_size': 100000,
+    'cache_quantization': 0.01,
+    'checkpoint_interval': 10,
+    'checkpoint_path': None,
+    'surrogate_screening': False,
+    'surrogate_fraction': 0.25,
+    'surrogate_warmup': 100,
+    'surrogate_model': 'ridge',
+    'initial_population': 'poisson_disk',
+}
+
+# ml settings that leave the run's trajectory unchanged, so a resumed run
+# may differ in them from the checkpoint
+RESUMABLE_ML_KEYS = ('generations', 'n_workers', 'checkpoint_interval', 'checkpoint_path')
+
+
+def spacing_penalty(population, min_distance: float, index_threshold: int = 150) -> np.ndarray:
+    """
+    Sum of normalized spacing violations for each layout.
+
+    Each pair closer than ``min_distance`` contributes
+    ``(min_distance - distance) / min_distance``.
+
+    Args:
+        population: Turbine positions of shape (L, N, 2)
+        min_distance: Minimum allowed turbine distance (m)
+        index_threshold: Turbine count from which a KD-tree replaces the
+            all-pairs distance matrix
+
+    Returns:
+        Array of shape (L,) with zero for feasible layouts
+    """
+    population = np.asarray(population, dtype=float)
+    n_turbines = population.shape[1]
+
+    if n_turbines >= index_threshold:
+        penalty = np.empty(len(population))
+        for l, layout in enumerate(population):
+            violations = NeighbourIndex(layout).spacing_violations(min_distance)
+            penalty[l] = np.sum(1.0 - violations['distances'] / min_distance)
+        return penalty
+
+    diff = population[:, :, None, :] - population[:, None, :, :]
+    distances = np.sqrt(np.einsum('lijc,lijc->lij', diff, diff))
+    upper = np.triu(np.ones((n_turbines, n_turbines), dtype=bool), k=1)
+    violation = np.clip(1.0 - distances / min_distance, 0.0, None)
+    return (violation * upper).sum(axis=(1, 2))
+
+
+def exclusion_penalty(population, exclusion_zones: Sequence, min_distance: float) -> np.ndarray:
+    """
+    Sum of exclusion zone violations for each layout.
+
+    Each turbine inside a zone contributes ``1 + depth / min_distance``,
+    where ``depth`` is its distance to the zone boundary, so a turbine in
+    a zone costs at least as much as a fully overlapping turbine pair.
+
+    Args:
+        population: Turbine positions of shape (L, N, 2)
+        exclusion_zones: Polygons, each a sequence of (x, y) vertices
+        min_distance: Minimum allowed turbine distance (m), the depth scale
+
+    Returns:
+        Array of shape (L,) with zero for feasible layouts
+    """
+    population = np.asarray(population, dtype=float)
+    if not len(exclusion_zones):
+        return np.zeros(len(population))
+    depth = -exclusion_distance(population, exclusion_zones)
+    return np.where(depth > 0.0, 1.0 + depth / min_distance, 0.0).sum(axis=1)
+
+
+def layout_penalty(population, min_distance: float, exclusion_zones: Sequence = (),
+                   index_threshold: int = 150) -> np.ndarray:
+    """Spacing plus exclusion zone violations of each layout, shape (L,)."""
+    return (spacing_penalty(population, min_distance, index_threshold)
+            + exclusion_penalty(population, exclusion_zones, min_distance))
+
+
+def layout_fitness(population, wake_model: JensenWakeModel, wind_rose: Dict[str, np.ndarray],
+                   min_distance: float, penalty_weight: float,
+                   exclusion_zones: Sequence = ()) -> np.ndarray:
+    """
+    Penalized AEP fitness (MWh/year) for a batch of layouts.
+
+    Args:
+        population: Turbine positions of shape (L, N, 2)
+        wake_model: Wake model used for AEP
+        wind_rose: Binned wind rose
+        min_distance: Minimum allowed turbine distance (m)
+        penalty_weight: MWh/year subtracted per unit of spacing or
+            exclusion zone violation
+        exclusion_zones: Polygons no turbine may stand in
+
+    Returns:
+        Array of shape (L,) with fitness values
+    """
+    aep = wake_model.calculate_aep(population, wind_rose)
+    penalty = layout_penalty(population, min_distance, exclusion_zones,
+                             wake_model.pruning_threshold)
+    return aep - penalty_weight * penalty
+
+
+def grid_layout(n_turbines: int, farm_width: float, farm_height: float) -> np.ndarray:
+    """Regular grid layout with ``n_turbines`` turbines filling the farm."""
+    cols = int(np.ceil(np.sqrt(n_turbines * farm_width / farm_height)))
+    rows = int(np.ceil(n_turbines / cols))
+    xs = (np.arange(cols) + 0.5) * farm_width / cols
+    ys = (np.arange(rows) + 0.5) * farm_height / rows
+    grid = np.stack(np.meshgrid(xs, ys), axis=-1).reshape(-1, 2)
+    return grid[:n_turbines]
+
+
+# Per-process state for pool workers, set once by the pool initializer so
+# the wake model and wind rose are not pickled with every shard
+_WORKER_STATE = None
+
+
+def _init_worker(wake_model, wind_rose, min_distance, penalty_weight, exclusion_zones):
+    """Process pool initializer storing the read-only fitness context."""
+    global _WORKER_STATE
+    _WORKER_STATE = (wake_model, wind_rose, min_distance, penalty_weight, exclusion_zones)
+
+
+def _evaluate_shard(shard):
+    """Score one population shard inside a pool worker."""
+    return layout_fitness(shard, *_WORKER_STATE)
+
+
+class GeneticLayoutOptimizer:
+    """
+    Genetic algorithm for turbine layout optimization.
+
+    Uses tournament selection, per-turbine uniform crossover, Gaussian
+    mutation and elitism. All randomness comes from one generator seeded
+    with ``ml.random_state`` in the parent process, and pool workers only
+    evaluate fitness, so serial and parallel runs are identical.
+
+    When ``checkpoint_path`` is set, the full run state is written every
+    ``checkpoint_interval`` generations; ``optimize(resume=True)`` restores
+    it and continues bit-identically to an uninterrupted run. Checkpoints
+    carry a fingerprint of the wind rose and the settings that shape the
+    run, and resuming with a different one raises ``ValueError``.
+    """
+
+    def __init__(self, config: Optional[Dict] = None, ml_config: Optional[Dict] = None,
+                 wake_model: Optional[JensenWakeModel] = None):
+        """
+        Initialize the optimizer.
+
+        Args:
+            config: Wind farm configuration (``wind_farm`` section of config.yaml)
+            ml_config: Optimizer configuration (``ml`` section of config.yaml)
+            wake_model: Wake model for fitness evaluation
+        """
+        self.config = {**DEFAULT_FARM_CONFIG, **(config or {})}
+        self.ml_config = {**DEFAULT_ML_CONFIG, **(ml_config or {})}
+        self.wake_model = wake_model or JensenWakeModel(self.config)
+
+        self.bounds = np.array([self.config['farm_width'], self.config['farm_height']], dtype=float)
+        self.min_distance = float(self.config['min_turbine_distance'])
+        self.exclusion_zones = validate_exclusion_zones(self.config['exclusion_zones'])
+        self.population_size = int(self.ml_config['population_size'])
+        self.n_workers = max(1, int(self.ml_config['n_workers'] or 1))
+        self.cache = FitnessCache(self.ml_config['cache_size'],
+                                  self.ml_config['cache_quantization'])
+
+        self.surrogate = None
+        self._pool = None
+
+    def optimize(self, wind_rose: Dict[str, np.ndarray], n_turbines: Optional[int] = None,
+                 generations: Optional[int] = None, verbose: bool = False,
+                 resume: bool = False) -> Dict:
+        """
+        Run the genetic algorithm.
+
+        Args:
+            wind_rose: Binned wind rose used for AEP
+            n_turbines: Number of turbines (defaults to ``max_turbines``)
+            generations: Number of generations (defaults to ``ml.generations``)
+            verbose: Print progress every ten generations
+            resume: Continue from ``checkpoint_path`` if a checkpoint exists
+
+        Returns:
+            Dictionary with the best layout, its fitness/AEP, the per-generation
+            ``history``, fitness cache statistics and timing information
+        """
+        n_turbines = int(n_turbines or self.config['max_turbines'])
+        generations = int(self.ml_config['generations'] if generations is None else generations)
+        checkpoint_path = self.ml_config['checkpoint_path']
+        checkpoint_interval = max(1, int(self.ml_config['checkpoint_interval']))
+        rng = np.random.default_rng(self.ml_config['random_state'])
+        penalty_weight = self.wake_model.ideal_aep(1, wind_rose)
+        n_elite = min(int(self.ml_config['elite_size']), self.population_size)
+
+        # Deferred: src.data reaches this module through the batch runner
+        from ..data.frequency_table import dataset_fingerprint
+
+        start = time.perf_counter()
+        settings = self._run_settings(n_turbines)
+        fingerprint = dataset_fingerprint(
+            [wind_rose['directions'], wind_rose['speeds'], wind_rose['frequencies']], settings)
+        state = load_checkpoint(checkpoint_path) if resume and checkpoint_path else None
+        if state is not None:
+            self._check_resumable(state, settings, fingerprint, checkpoint_path)
+
+        try:
+            self._open_pool(wind_rose, penalty_weight)
+            if state is not None:
+                rng.bit_generator.state = state['rng_state']
+                population, fitness = state['population'], state['fitness']
+                history, stats = state['history'], state['stats']
+                stats.setdefault('screened_out', 0)
+                self.cache.load_state_dict(state['cache'])
+                self.surrogate = self._new_surrogate(wind_rose)
+                if self.surrogate is not None and state.get('surrogate'):
+                    self.surrogate.load_state_dict(state['surrogate'])
+                first_generation = state['generation'] + 1
+                if verbose:
+                    print(f"   Resuming from generation {state['generation']}")
+            else:
+                history = {'generation': [], 'best_fitness': [], 'mean_fitness': [],
+                           'std_fitness': []}
+                stats = {'evaluations': 0, 'evaluation_time_s': 0.0, 'screened_out': 0}
+                self.cache = FitnessCache(self.ml_config['cache_size'],
+                                          self.ml_config['cache_quantization'])
+                self.surrogate = self._new_surrogate(wind_rose)
+                population = self.initial_population(n_turbines, rng)
+                fitness = self._evaluate(population, wind_rose, penalty_weight, stats)
+                self._train_surrogate(population, fitness, penalty_weight)
+                self._record(history, 0, fitness)
+                first_generation = 1
+
+            for generation in range(first_generation, generations + 1):
+                order = np.argsort(-fitness, kind='stable')
+                elites = order[:n_elite]
+
+                n_children = self.population_size - n_elite
+                parents = self._tournament(fitness, 2 * n_children, rng)
+                children = self._crossover(population[parents[0::2]],
+                                           population[parents[1::2]], rng)
+                children = self._mutate(children, rng)
+
+                child_fitness = self._screened_evaluate(children, wind_rose, penalty_weight,
+                                                        stats, n_elite)
+                population = np.concatenate([population[elites], children])
+                fitness = np.concatenate([fitness[elites], child_fitness])
+                self._record(history, generation, fitness)
+
+                if checkpoint_path and (generation % checkpoint_interval == 0
+                                        or generation == generations):
+                    save_checkpoint({
+                        'generation': generation,
+                        'n_turbines': n_turbines,
+                        'fingerprint': fingerprint,
+                        'settings': settings,
+                        'population': population,
+                        'fitness': fitness,
+                        'best_positions': population[np.argmax(fitness)],
+                        'best_fitness': float(fitness.max()),
+                        'rng_state': rng.bit_generator.state,
+                        'history': history,
+                        'stats': stats,
+                        'cache': self.cache.state_dict(),
+                        'surrogate': (self.surrogate.state_dict()
+                                      if self.surrogate is not None else None),
+                    }, checkpoint_path)
+
+                if verbose and generation % 10 == 0:
+                    print(f"   Generation {generation:4d}: best {fitness.max():.1f} MWh/yr")
+        finally:
+            self._close_pool()
+
+        best = int(np.argmax(fitness))
+        best_positions = population[best]
+        seconds_per_evaluation = stats['evaluation_time_s'] / max(stats['evaluations'], 1)
+        return {
+            'best_positions': best_positions,
+            'best_fitness': float(fitness[best]),
+            'best_aep_mwh': float(self.wake_model.calculate_aep(best_positions, wind_rose)),
+            'history': history,
+            'n_turbines': n_turbines,
+            'n_workers': self.n_workers,
+            'evaluations': stats['evaluations'],
+            'evaluation_time_s': stats['evaluation_time_s'],
+            'cache': self.cache.stats(seconds_per_evaluation),
+            'surrogate': self._surrogate_stats(stats),
+            'runtime_s': time.perf_counter() - start,
+        }
+
+    def _run_settings(self, n_turbines: int) -> Dict:
+        """Every setting besides the wind rose that shapes the run."""
+        return {
+            'n_turbines': n_turbines,
+            'wind_farm': self.config,
+            'ml': {key: value for key, value in self.ml_config.items()
+                   if key not in RESUMABLE_ML_KEYS},
+            'wake_model': {'wake_decay': self.wake_model.wake_decay,
+                           'thrust_coefficient': self.wake_model.thrust_coefficient,
+                           'deficit_tolerance': self.wake_model.deficit_tolerance,
+                           'pruning_threshold': self.wake_model.pruning_threshold},
+        }
+
+    @staticmethod
+    def _check_resumable(state: Dict, settings: Dict, fingerprint: str, path):
+        """Refuse a checkpoint written for another wind rose or configuration."""
+        if state['fingerprint'] == fingerprint:
+            return
+        saved, changed = state['settings'], []
+        for section, values in settings.items():
+            if isinstance(values, dict):
+                changed += [f"{section}.{key}" for key in sorted(set(values) | set(saved[section]))
+                            if values.get(key) != saved[section].get(key)]
+            elif values != saved[section]:
+                changed.append(section)
+        reason = f"changed settings: {', '.join(changed)}" if changed else "the wind rose changed"
+        raise ValueError(f"Checkpoint {path} does not match this run ({reason}); "
+                         f"run without resume or delete the checkpoint")
+
+    def initial_population(self, n_turbines: int, rng: np.random.Generator) -> np.ndarray:
+        """
+        Random starting layouts of shape (population_size, n_turbines, 2).
+
+        With ``initial_population: poisson_disk`` the layouts satisfy the
+        spacing and exclusion constraints; requests denser than Poisson-disk
+        sampling can pack fall back, with a warning, to uniform layouts,
+        which the fitness penalties then drive apart and out of the zones.
+        """
+        method = self.ml_config['initial_population']
+        if method not in ('uniform', 'poisson_disk'):
+            raise ValueError(f"Unknown initial population method: {method}")
+        if method == 'poisson_disk':
+            try:
+                return PoissonDiskLayoutSampler(self.config).sample_population(
+                    self.population_size, n_turbines, rng)
+            except InfeasibleLayoutError as e:
+                warnings.warn(f"{e}; starting from uniform random layouts instead",
+                              RuntimeWarning, stacklevel=2)
+        return rng.uniform(0.0, 1.0, size=(self.population_size, n_turbines, 2)) * self.bounds
+
+    def to_optimization_data(self, result: Dict, wind_rose: Dict[str, np.ndarray],
+                             baselines: Optional[Dict[str, np.ndarray]] = None) -> Dict:
+        """
+        Package a GA result for the optimization plots and ``save_results``.
+
+        Args:
+            result: Output of :meth:`optimize`
+            wind_rose: Wind rose the result was optimized for
+            baselines: Optional extra layouts to compare against, by name
+
+        Returns:
+            Dictionary with ``scenarios``, ``comparison`` and ``history``
+        """
+        n_turbines = result['n_turbines']
+        layouts = {
+            'Random': np.random.default_rng(self.ml_config['random_state']).uniform(
+                0.0, 1.0, size=(n_turbines, 2)) * self.bounds,
+            'Grid': grid_layout(n_turbines, *self.bounds),
+            **(baselines or {}),
+            'Genetic Algorithm': result['best_positions'],
+        }
+
+        scenarios: List[Dict] = []
+        for name, positions in layouts.items():
+            aep = float(self.wake_model.calculate_aep(positions, wind_rose))
+            scenarios.append({
+                'name': name,
+                'turbine_positions': np.asarray(positions).tolist(),
+                'aep_mwh': aep,
+                'power_output_mw': aep / HOURS_PER_YEAR,
+                'efficiency': aep / self.wake_model.ideal_aep(len(positions), wind_rose),
+            })
+
+        return {
+            'scenarios': scenarios,
+            'comparison': {
+                'methods': [s['name'] for s in scenarios],
+                'power_outputs': [s['power_output_mw'] for s in scenarios],
+                'efficiencies': [s['efficiency'] for s in scenarios],
+            },
+            'history': result['history'],
+        }
+
+    def _evaluate(self, population, wind_rose, penalty_weight, stats) -> np.ndarray:
+        """Score a population, skipping cached layouts and sharding the rest."""
+        keys = self.cache.layout_keys(population)
+        fitness, missing = self.cache.lookup(keys)
+        if not missing.any():
+            return fitness
+
+        # Score each distinct uncached layout once
+        unique = {}
+        for i in np.flatnonzero(missing):
+            unique.setdefault(keys[i], i)
+        todo = np.fromiter(unique.values(), dtype=int)
+
+        start = time.perf_counter()
+        if self._pool is None:
+            scores = layout_fitness(population[todo], self.wake_model, wind_rose,
+                                    self.min_distance, penalty_weight, self.exclusion_zones)
+        else:
+            shards = np.array_split(population[todo], self.n_workers)
+            scores = np.concatenate(list(self._pool.map(_evaluate_shard, shards)))
+        stats['evaluations'] += len(todo)
+        stats['evaluation_time_s'] += time.perf_counter() - start
+
+        scored = dict(zip(unique.keys(), scores))
+        self.cache.store(scored.keys(), scored.values())
+        fitness[missing] = [scored[keys[i]] for i in np.flatnonzero(missing)]
+        return fitness
+
+    def _new_surrogate(self, wind_rose) -> Optional[SurrogateFitnessModel]:
+        """Fresh surrogate when screening is enabled, else None."""
+        if not self.ml_config['surrogate_screening']:
+            return None
+        return SurrogateFitnessModel(
+            wind_rose, {'model': self.ml_config['surrogate_model'],
+                        'warmup': self.ml_config['surrogate_warmup']},
+            self.config, self.wake_model.wake_decay)
+
+    def _train_surrogate(self, population, fitness, penalty_weight):
+        """Feed exact scores to the surrogate as AEP (penalty removed)."""
+        if self.surrogate is not None:
+            penalty = self._penalty(population)
+            self.surrogate.update(population, fitness + penalty_weight * penalty)
+
+    def _screened_evaluate(self, population, wind_rose, penalty_weight, stats,
+                           n_elite: int) -> np.ndarray:
+        """
+        Score offspring, using the surrogate to skip unpromising layouts.
+
+        Only the top ``surrogate_fraction`` by predicted fitness (at least
+        ``n_elite``) are scored exactly. The rest keep their prediction,
+        capped just below the worst exact score, so they can be selected
+        as parents but never displace an exactly scored layout as elite or
+        best.
+        """
+        if self.surrogate is None or not self.surrogate.ready:
+            fitness = self._evaluate(population, wind_rose, penalty_weight, stats)
+            self._train_surrogate(population, fitness, penalty_weight)
+            return fitness
+
+        penalty = self._penalty(population)
+        features = self.surrogate.features(population)
+        predicted = self.surrogate.predict(population, features) - penalty_weight * penalty
+        n_exact = int(np.ceil(self.ml_config['surrogate_fraction'] * len(population)))
+        n_exact = min(len(population), max(n_exact, n_elite, 1))
+        exact = np.argsort(-predicted, kind='stable')[:n_exact]
+
+        fitness = np.empty(len(population))
+        fitness[exact] = self._evaluate(population[exact], wind_rose, penalty_weight, stats)
+        self.surrogate.update(population[exact],
+                              fitness[exact] + penalty_weight * penalty[exact], features[exact])
+
+        skipped = np.ones(len(population), dtype=bool)
+        skipped[exact] = False
+        fitness[skipped] = np.minimum(predicted[skipped],
+                                      np.nextafter(fitness[exact].min(), -np.inf))
+        stats['screened_out'] += int(skipped.sum())
+        return fitness
+
+    def _penalty(self, population) -> np.ndarray:
+        """Spacing and exclusion zone violations of each layout."""
+        return layout_penalty(population, self.min_distance, self.exclusion_zones,
+                              self.wake_model.pruning_threshold)
+
+    def _surrogate_stats(self, stats) -> Optional[Dict]:
+        """Surrogate accuracy and the share of exact evaluations it saved."""
+        if self.surrogate is None:
+            return None
+        screened = stats.get('screened_out', 0)
+        return {
+            **self.surrogate.error_summary(),
+            'screened_out': screened,
+            'fraction_saved': screened / max(screened + stats['evaluations'], 1),
+        }
+
+    def _open_pool(self, wind_rose, penalty_weight):
+        """Start the worker pool when more than one worker is configured."""
+        if self.n_workers > 1:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.n_workers, initializer=_init_worker,
+                initargs=(self.wake_model, wind_rose, self.min_distance, penalty_weight,
+                          self.exclusion_zones))
+
+    def _close_pool(self):
+        """Shut down the worker pool if one is running."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def _tournament(self, fitness, n_parents: int, rng: np.random.Generator) -> np.ndarray:
+        """Vectorized tournament selection returning parent indices."""
+        size = int(self.ml_config['tournament_size'])
+        contenders = rng.integers(0, len(fitness), size=(n_parents, size))
+        winners = np.argmax(fitness[contenders], axis=1)
+        return contenders[np.arange(n_parents), winners]
+
+    def _crossover(self, parents_a, parents_b, rng: np.random.Generator) -> np.ndarray:
+        """Per-turbine uniform crossover applied with probability ``crossover_rate``."""
+        n_children, n_turbines, _ = parents_a.shape
+        swap = rng.random((n_children, n_turbines, 1)) < 0.5
+        crossed = rng.random((n_children, 1, 1)) < self.ml_config['crossover_rate']
+        return np.where(swap & crossed, parents_b, parents_a)
+
+    def _mutate(self, children, rng: np.random.Generator) -> np.ndarray:
+        """Gaussian displacement of each turbine with probability ``mutation_rate``."""
+        mutate = rng.random(children.shape[:2] + (1,)) < self.ml_config['mutation_rate']
+        step = rng.normal(0.0, self.ml_config['mutation_scale'], children.shape) * self.bounds
+        return np.clip(children + mutate * step, 0.0, self.bounds)
+
+    @staticmethod
+    def _record(history: Dict[str, list], generation: int, fitness: np.ndarray):
+        """Append per-generation statistics to the history."""
+        history['generation'].append(generation)
+        history['best_fitness'].append(float(fitness.max()))
+        history['mean_fitness'].append(float(fitness.mean()))
+        history['std_fitness'].append(float(fitness.std()))
@@ -0,0 +1,250 @@
+"""
+Direction-sector parallel AEP for single large layouts.
+
+AEP is a sum over wind direction sectors, and the wake deficits of a
+sector only depend on the layout and that sector's direction.
+:class:`SectorParallelAEP` splits the sectors of one layout over a
+process pool. The binned wind rose, the layout and the per-sector
+results live in ``multiprocessing.shared_memory`` blocks that workers
+attach once by name, so a task is a block name and a sector range and no
+array is pickled per evaluation. Every sector is evaluated on its own
+and the parent sums the per-sector AEP in sector order, which makes the
+result bit-identical for any worker count and completion order.
+"""
+
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Dict, Optional
+
+from .spatial_index import NeighbourIndex
+from .wake_models import JensenWakeModel
+
+
+def sector_aep(wake_model: JensenWakeModel, positions, directions, speeds, frequencies,
+               method: str = 'auto', index: Optional[NeighbourIndex] = None) -> np.ndarray:
+    """
+    AEP contribution of every direction sector for one layout.
+
+    Sectors are evaluated one at a time, so a sector's value does not
+    depend on which other sectors are evaluated in the same call.
+
+    Args:
+        wake_model: Wake model providing the deficits and the power curve
+        positions: Turbine positions of shape (N, 2)
+        directions: Sector directions in degrees, shape (D,)
+        speeds: Speed bin centres (m/s), shape (S,)
+        frequencies: Bin probabilities of shape (D, S)
+        method: 'exact', 'pruned' or 'auto', as in
+            :meth:`JensenWakeModel.calculate_aep`
+        index: Optional prebuilt :class:`NeighbourIndex` for the pruned path
+
+    Returns:
+        Array of shape (D,) with the AEP of each sector in MWh/year
+    """
+    if method not in ('auto', 'exact', 'pruned'):
+        raise ValueError(f"Unknown AEP method: {method}")
+
+    positions = np.asarray(positions, dtype=float)
+    frequencies = np.asarray(frequencies, dtype=float)
+    if method == 'auto':
+        method = 'pruned' if len(positions) >= wake_model.pruning_threshold else 'exact'
+    if method == 'pruned' and index is None:
+        index = NeighbourIndex(positions)
+
+    aep = np.empty(len(directions))
+    for d, direction in enumerate(directions):
+        if method == 'pruned':
+            deficits = wake_model.pruned_wake_deficits(positions, [direction], index)
+        else:
+            deficits = wake_model.wake_deficits(positions[None], [direction])[0]
+        aep[d] = wake_model._aep_from_deficits(deficits[None], speeds, frequencies[d:d + 1])[0]
+    return aep
+
+
+# Per-process state for pool workers: the attached shared-memory blocks
+# and the layout (with its neighbour index) of the current evaluation
+_WORKER_STATE = None
+
+
+def _init_worker(wake_model, wind_name, n_directions, n_speeds, result_name):
+    """Process pool initializer attaching the wind rose and result blocks."""
+    global _WORKER_STATE
+    wind = shared_memory.SharedMemory(name=wind_name)
+    result = shared_memory.SharedMemory(name=result_name)
+    directions, speeds, frequencies = _unpack_wind(wind, n_directions, n_speeds)
+    _WORKER_STATE = {
+        'wake_model': wake_model,
+        'blocks': [wind, result],
+        'directions': directions,
+        'speeds': speeds,
+        'frequencies': frequencies,
+        'result': np.ndarray((n_directions,), dtype=float, buffer=result.buf),
+        'layout_block': None,
+        'version': None,
+        'positions': None,
+        'index': None,
+    }
+
+
+def _evaluate_sectors(layout_name, n_turbines, version, method, start, stop):
+    """Write the AEP of sectors ``start:stop`` into the shared result block."""
+    state = _WORKER_STATE
+    if state['version'] != version:
+        block = state['layout_block']
+        if block is None or block.name != layout_name:
+            if block is not None:
+                block.close()
+            block = state['layout_block'] = shared_memory.SharedMemory(name=layout_name)
+        # A private copy, so the next layout can overwrite the block
+        state['positions'] = np.ndarray((n_turbines, 2), dtype=float, buffer=block.buf).copy()
+        state['index'] = None
+        state['version'] = version
+    if method == 'pruned' and state['index'] is None:
+        state['index'] = NeighbourIndex(state['positions'])
+
+    state['result'][start:stop] = sector_aep(
+        state['wake_model'], state['positions'], state['directions'][start:stop],
+        state['speeds'], state['frequencies'][start:stop], method, state['index'])
+
+
+def _unpack_wind(block, n_directions: int, n_speeds: int):
+    """Directions, speeds and frequencies viewed from one wind rose block."""
+    values = np.ndarray((n_directions + n_speeds + n_directions * n_speeds,),
+                        dtype=float, buffer=block.buf)
+    return (values[:n_directions], values[n_directions:n_directions + n_speeds],
+            values[n_directions + n_speeds:].reshape(n_directions, n_speeds))
+
+
+class SectorParallelAEP:
+    """
+    AEP of single layouts with the direction sectors split over processes.
+
+    Workers are started once with the wind rose in shared memory; each
+    :meth:`calculate_aep` copies the layout into a shared block and sends
+    every worker one contiguous sector range. With ``n_workers=1`` sectors
+    are evaluated in-process without shared memory, with the same result.
+    Use as a context manager, or call :meth:`close`, to stop the workers
+    and release the shared blocks.
+    """
+
+    def __init__(self, wind_rose: Dict[str, np.ndarray],
+                 wake_model: Optional[JensenWakeModel] = None,
+                 n_workers: Optional[int] = None, method: str = 'auto'):
+        """
+        Initialize the evaluator.
+
+        Args:
+            wind_rose: Binned wind rose (see :func:`bin_wind_rose`)
+            wake_model: Wake model (a default :class:`JensenWakeModel` if omitted)
+            n_workers: Worker processes (defaults to ``cpu_count``; capped at
+                the number of sectors carrying probability)
+            method: 'exact', 'pruned' or 'auto' (pruned from the wake model's
+                ``pruning_threshold`` turbines)
+        """
+        if method not in ('auto', 'exact', 'pruned'):
+            raise ValueError(f"Unknown AEP method: {method}")
+        self.wake_model = wake_model or JensenWakeModel()
+        self.method = method
+        self.directions, self.speeds, self.frequencies = self.wake_model._active_bins(wind_rose)
+        n_sectors = len(self.directions)
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        self.n_workers = max(1, min(int(n_workers), n_sectors))
+        self.sector_ranges = [(int(s[0]), int(s[-1]) + 1)
+                              for s in np.array_split(np.arange(n_sectors), self.n_workers)]
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._blocks: Dict[str, shared_memory.SharedMemory] = {}
+        self._result = None
+        self._layout = None
+        self._version = 0
+
+    def calculate_aep(self, positions) -> float:
+        """Calculate the AEP (MWh/year) of one layout of shape (N, 2)."""
+        return float(self.sector_aep(positions).sum())
+
+    def sector_aep(self, positions) -> np.ndarray:
+        """
+        Calculate the AEP of every active direction sector.
+
+        Args:
+            positions: Turbine positions of shape (N, 2)
+
+        Returns:
+            Array of shape (D,) in MWh/year, aligned with :attr:`directions`
+        """
+        positions = np.asarray(positions, dtype=float)
+        method = self._resolve_method(len(positions))
+        if self.n_workers == 1:
+            return sector_aep(self.wake_model, positions, self.directions, self.speeds,
+                              self.frequencies, method)
+
+        if self._executor is None:
+            self._start_workers()
+        layout_name = self._write_layout(positions)
+        self._version += 1
+        futures = [self._executor.submit(_evaluate_sectors, layout_name, len(positions),
+                                         self._version, method, start, stop)
+                   for start, stop in self.sector_ranges]
+        wait(futures)
+        for future in futures:
+            future.result()
+        return self._result.copy()
+
+    def close(self):
+        """Shut the workers down and release the shared-memory blocks."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        # Views must go before their blocks can be closed
+        self._result = self._layout = None
+        for block in self._blocks.values():
+            block.close()
+            block.unlink()
+        self._blocks = {}
+
+    def __enter__(self) -> 'SectorParallelAEP':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _resolve_method(self, n_turbines: int) -> str:
+        """Concrete wake evaluation path for a layout size."""
+        if self.method != 'auto':
+            return self.method
+        return 'pruned' if n_turbines >= self.wake_model.pruning_threshold else 'exact'
+
+    def _start_workers(self):
+        """Copy the active wind rose bins into shared memory and start the pool."""
+        n_directions, n_speeds = len(self.directions), len(self.speeds)
+        wind = self._create_block('wind', n_directions + n_speeds + n_directions * n_speeds)
+        directions, speeds, frequencies = _unpack_wind(wind, n_directions, n_speeds)
+        directions[:], speeds[:], frequencies[:] = self.directions, self.speeds, self.frequencies
+        del directions, speeds, frequencies
+        result = self._create_block('result', n_directions)
+        self._result = np.ndarray((n_directions,), dtype=float, buffer=result.buf)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.n_workers, initializer=_init_worker,
+            initargs=(self.wake_model, wind.name, n_directions, n_speeds, result.name))
+
+    def _write_layout(self, positions) -> str:
+        """Copy a layout into the shared layout block, growing it if needed."""
+        if self._layout is None or len(self._layout) < len(positions):
+            self._layout = None
+            if 'layout' in self._blocks:
+                old = self._blocks.pop('layout')
+                old.close()
+                old.unlink()
+            block = self._create_block('layout', 2 * len(positions))
+            self._layout = np.ndarray((len(positions), 2), dtype=float, buffer=block.buf)
+        self._layout[:len(positions)] = positions
+        return self._blocks['layout'].name
+
+    def _create_block(self, key: str, n_values: int) -> shared_memory.SharedMemory:
+        """Create and register a float64 shared-memory block."""
+        block = shared_memory.SharedMemory(create=True, size=8 * max(n_values, 1))
+        self._blocks[key] = block
+        return block
@@ -0,0 +1,271 @@
+"""
+Power calculations for the AI Wind Farm Optimizer.
+
+This module provides the vectorized turbine power curve and the binned
+wind-rose representation shared by the wake models and optimizers.
+"""
+
+import numpy as np
+from typing import Dict, Optional, Sequence
+
+
+AIR_DENSITY = 1.225  # kg/m³ at sea level, 15 °C
+POWER_CURVE_BLOCK_SIZE = 1 << 16  # samples per lookup block
+
+# Turbine defaults mirroring the wind_farm section of config.yaml
+DEFAULT_TURBINE_CONFIG = {
+    'turbine_diameter': 90,
+    'hub_height': 80,
+    'rated_power': 2000,
+    'cut_in_speed': 3.0,
+    'cut_out_speed': 25.0,
+    'rated_speed': 12.0,
+    'air_density': AIR_DENSITY,
+    'power_curve_file': None,
+}
+
+HOURS_PER_YEAR = 8760.0
+
+
+def power_curve(wind_speeds, cut_in_speed: float = 3.0, rated_speed: float = 12.0,
+                cut_out_speed: float = 25.0, rated_power: float = 2000.0) -> np.ndarray:
+    """
+    Evaluate a parametric cubic power curve element-wise.
+
+    Args:
+        wind_speeds: Array of hub-height wind speeds (m/s), any shape
+        cut_in_speed: Cut-in wind speed (m/s)
+        rated_speed: Rated wind speed (m/s)
+        cut_out_speed: Cut-out wind speed (m/s)
+        rated_power: Rated power (kW)
+
+    Returns:
+        Power output in kW with the same shape as ``wind_speeds``
+    """
+    u = np.asarray(wind_speeds, dtype=float)
+    ramp = (u ** 3 - cut_in_speed ** 3) / (rated_speed ** 3 - cut_in_speed ** 3)
+    power = rated_power * np.clip(ramp, 0.0, 1.0)
+    return np.where((u >= cut_in_speed) & (u < cut_out_speed), power, 0.0)
+
+
+class PowerCurve:
+    """
+    Turbine power curve evaluated by table lookup.
+
+    The curve, parametric or tabulated, is resampled once onto a uniform
+    speed grid. Evaluation is then a scaled index, two table gathers and a
+    linear interpolation on whole arrays, with no per-sample branching.
+    Air density is corrected with the IEC 61400-12 rule for
+    pitch-regulated turbines: the curve at density rho is the reference
+    curve at the speed ``u (rho / rho_ref)^(1/3)``. Speeds at or above
+    ``cut_out_speed``, negative speeds and NaN give zero power.
+    """
+
+    def __init__(self, speeds, power, cut_out_speed: Optional[float] = None,
+                 air_density: float = AIR_DENSITY, reference_density: float = AIR_DENSITY,
+                 resolution: float = 0.01):
+        """
+        Build the lookup table from a tabulated curve.
+
+        Args:
+            speeds: Increasing tabulated wind speeds (m/s) at reference density
+            power: Power (kW) at each tabulated speed; linearly interpolated
+                in between and held constant past the last speed
+            cut_out_speed: Speed from which the output is zero (defaults to
+                just above the last tabulated speed)
+            air_density: Site air density (kg/m³)
+            reference_density: Air density the curve is given for (kg/m³)
+            resolution: Spacing of the lookup grid (m/s)
+        """
+        speeds = np.asarray(speeds, dtype=float)
+        power = np.asarray(power, dtype=float)
+        if speeds.ndim != 1 or speeds.shape != power.shape or len(speeds) < 2:
+            raise ValueError("Power curve needs matching 1-D speed and power tables")
+        if np.any(np.diff(speeds) <= 0):
+            raise ValueError("Power curve speeds must be strictly increasing")
+
+        self.cut_out_speed = float(cut_out_speed if cut_out_speed is not None
+                                   else np.nextafter(speeds[-1], np.inf))
+        self.air_density = float(air_density)
+        self.reference_density = float(reference_density)
+        self.resolution = float(resolution)
+        self.density_factor = (self.air_density / self.reference_density) ** (1.0 / 3.0)
+        self.rated_power = float(power.max())
+
+        n_points = int(np.ceil(self.cut_out_speed / self.resolution)) + 1
+        grid = np.arange(n_points) * self.resolution
+        self._values = np.interp(grid * self.density_factor, speeds, power, left=0.0)
+        # Slope per grid cell; the last cell is flat so the clipped top
+        # index needs no special case
+        self._slopes = np.append(np.diff(self._values), 0.0)
+        self._max_index = float(n_points - 1)
+
+    @classmethod
+    def from_parametric(cls, cut_in_speed: float = 3.0, rated_speed: float = 12.0,
+                        cut_out_speed: float = 25.0, rated_power: float = 2000.0,
+                        **kwargs) -> 'PowerCurve':
+        """
+        Tabulate the cubic curve of :func:`power_curve`.
+
+        Args:
+            cut_in_speed: Cut-in wind speed (m/s)
+            rated_speed: Rated wind speed (m/s)
+            cut_out_speed: Cut-out wind speed (m/s)
+            rated_power: Rated power (kW)
+            **kwargs: ``air_density``, ``reference_density`` and ``resolution``
+
+        Returns:
+            Lookup-table power curve
+        """
+        resolution = kwargs.get('resolution', 0.01)
+        speeds = np.arange(int(np.ceil(cut_out_speed / resolution)) + 2) * resolution
+        power = power_curve(speeds, cut_in_speed, rated_speed, np.inf, rated_power)
+        return cls(speeds, power, cut_out_speed=cut_out_speed, **kwargs)
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict] = None, air_density: Optional[float] = None,
+                    resolution: float = 0.01) -> 'PowerCurve':
+        """
+        Build the curve described by the ``wind_farm`` section of config.yaml.
+
+        A ``power_curve_file`` (CSV with a header row and speed (m/s) and
+        power (kW) columns) takes precedence over the parametric
+        ``cut_in_speed`` / ``rated_speed`` / ``rated_power`` curve; in both
+        cases ``cut_out_speed`` applies.
+
+        Args:
+            config: Turbine parameters
+            air_density: Site air density override (kg/m³)
+            resolution: Spacing of the lookup grid (m/s)
+
+        Returns:
+            Lookup-table power curve
+        """
+        config = {**DEFAULT_TURBINE_CONFIG, **(config or {})}
+        kwargs = {'air_density': config['air_density'] if air_density is None else air_density,
+                  'resolution': resolution}
+        if config.get('power_curve_file'):
+            table = np.loadtxt(config['power_curve_file'], delimiter=',', skiprows=1,
+                               usecols=(0, 1), ndmin=2)
+            return cls(table[:, 0], table[:, 1], cut_out_speed=config['cut_out_speed'],
+                       **kwargs)
+        return cls.from_parametric(config['cut_in_speed'], config['rated_speed'],
+                                   config['cut_out_speed'], config['rated_power'], **kwargs)
+
+    def __call__(self, wind_speeds) -> np.ndarray:
+        """
+        Evaluate the power curve element-wise.
+
+        Args:
+            wind_speeds: Hub-height wind speeds (m/s), any shape
+
+        Returns:
+            Power output in kW with the same shape as ``wind_speeds``
+        """
+        u = np.asarray(wind_speeds, dtype=float)
+        flat = u.ravel()
+        power = np.empty(flat.shape)
+        # Blocks keep the temporaries cache-resident on large inputs
+        for start in range(0, flat.size, POWER_CURVE_BLOCK_SIZE):
+            stop = start + POWER_CURVE_BLOCK_SIZE
+            self._evaluate(flat[start:stop], power[start:stop])
+        return power.reshape(u.shape)
+
+    def _evaluate(self, u: np.ndarray, out: np.ndarray):
+        """Interpolate one block of speeds into ``out``."""
+        x = u * (1.0 / self.resolution)
+        np.clip(x, 0.0, self._max_index, out=x)
+        with np.errstate(invalid='ignore'):  # NaN speeds, zeroed below
+            index = x.astype(np.intp)
+        x -= index
+        np.take(self._slopes, index, out=out, mode='clip')
+        out *= x
+        out += self._values.take(index, mode='clip')
+        np.copyto(out, 0.0, where=~(u < self.cut_out_speed))
+
+    def capacity_factor(self, wind_speeds, weights=None) -> float:
+        """
+        Capacity factor over speed samples or a weighted speed table.
+
+        Args:
+            wind_speeds: Wind speeds (m/s)
+            weights: Optional probability or count of each speed
+
+        Returns:
+            Mean power divided by rated power
+        """
+        return float(np.average(self(wind_speeds), weights=weights) / self.rated_power)
+
+
+def bin_wind_rose(wind_speeds, wind_directions, direction_bins: int = 16,
+                  speed_bin_width: float = 1.0,
+                  max_speed: Optional[float] = None) -> Dict[str, np.ndarray]:
+    """
+    Bin a wind time series into a joint direction x speed frequency table.
+
+    Args:
+        wind_speeds: Wind speed samples (m/s)
+        wind_directions: Wind direction samples (degrees, meteorological)
+        direction_bins: Number of direction sectors
+        speed_bin_width: Width of each speed bin (m/s)
+        max_speed: Upper edge of the last speed bin (defaults to the data maximum)
+
+    Returns:
+        Dictionary with sector centres ``directions`` (D,), bin centres
+        ``speeds`` (S,) and ``frequencies`` (D, S) summing to one
+    """
+    wind_speeds = np.asarray(wind_speeds, dtype=float)
+    wind_directions = np.mod(np.asarray(wind_directions, dtype=float), 360.0)
+
+    if max_speed is None:
+        max_speed = max(float(wind_speeds.max()), speed_bin_width)
+    n_speed = int(np.ceil(max_speed / speed_bin_width))
+    sector_width = 360.0 / direction_bins
+
+    # Sectors are centred on their nominal direction (0° sector spans ±width/2)
+    dir_idx = np.floor((wind_directions + sector_width / 2) / sector_width).astype(int) % direction_bins
+    speed_idx = np.clip((wind_speeds / speed_bin_width).astype(int), 0, n_speed - 1)
+
+    counts = np.bincount(dir_idx * n_speed + speed_idx,
+                         minlength=direction_bins * n_speed).astype(float)
+    frequencies = counts.reshape(direction_bins, n_speed) / max(len(wind_speeds), 1)
+
+    return {
+        'directions': np.arange(direction_bins) * sector_width,
+        'speeds': (np.arange(n_speed) + 0.5) * speed_bin_width,
+        'frequencies': frequencies,
+    }
+
+
+def weibull_wind_rose(weibull_k, weibull_c, sector_frequencies: Sequence[float],
+                      speed_bin_width: float = 1.0,
+                      max_speed: float = 30.0) -> Dict[str, np.ndarray]:
+    """
+    Build a joint frequency table from per-sector Weibull parameters.
+
+    Args:
+        weibull_k: Weibull shape parameter, scalar or one per sector
+        weibull_c: Weibull scale parameter (m/s), scalar or one per sector
+        sector_frequencies: Probability of each direction sector
+        speed_bin_width: Width of each speed bin (m/s)
+        max_speed: Upper edge of the last speed bin (m/s)
+
+    Returns:
+        Dictionary in the same format as :func:`bin_wind_rose`
+    """
+    sector_frequencies = np.asarray(sector_frequencies, dtype=float)
+    sector_frequencies = sector_frequencies / sector_frequencies.sum()
+    direction_bins = len(sector_frequencies)
+
+    k = np.broadcast_to(np.asarray(weibull_k, dtype=float), (direction_bins,))[:, None]
+    c = np.broadcast_to(np.asarray(weibull_c, dtype=float), (direction_bins,))[:, None]
+
+    edges = np.arange(0.0, max_speed + speed_bin_width / 2, speed_bin_width)
+    cdf = 1.0 - np.exp(-(edges[None, :] / c) ** k)
+    speed_probs = np.diff(cdf, axis=1)
+
+    return {
+        'directions': np.arange(direction_bins) * 360.0 / direction_bins,
+        'speeds': 0.5 * (edges[:-1] + edges[1:]),
+        'frequencies': sector_frequencies[:, None] * speed_probs,
+    }
@@ -0,0 +1,227 @@
+"""
+Vectorized reinforcement-learning environment for turbine placement.
+
+:class:`VectorizedPlacementEnv` steps many farm-placement episodes at once
+with a Gym-style vector API (``reset`` / ``step`` returning observations,
+rewards, terminated and truncated flags and an info dict). An action picks
+a cell of the occupancy grid over the farm; the reward is the AEP gained
+by the placement. Each placement only computes the wake terms between the
+new turbine and the turbines already placed, so a step costs O(N) per
+environment instead of re-scoring the whole farm.
+"""
+
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+from .optimizer import DEFAULT_FARM_CONFIG
+from .power_calculations import HOURS_PER_YEAR
+from .wake_models import JensenWakeModel
+
+
+DEFAULT_RL_CONFIG = {
+    'cell_size': 50.0,  # metres per occupancy-grid cell
+    'n_turbines': None,  # turbines per episode, defaults to max_turbines
+    'max_episode_steps': None,  # defaults to twice n_turbines
+    'invalid_action_penalty': -1.0,  # reward for an occupied or too-close cell
+}
+
+
+class VectorizedPlacementEnv:
+    """
+    Batch of independent turbine placement episodes.
+
+    Observations are float32 occupancy grids of shape (n_envs, rows, cols).
+    Actions are flat cell indices ``row * cols + col``; cells that are
+    occupied or closer than ``min_turbine_distance`` to a placed turbine are
+    invalid (see ``info['action_mask']``). Rewards are the AEP gained by a
+    placement divided by the wake-free AEP of one turbine, so a turbine in
+    free stream earns 1. Finished episodes are reset automatically; their
+    final layout and AEP are reported in ``info``.
+
+    Per-turbine squared wake deficits and expected power are kept for every
+    direction sector and updated only where the new turbine changes them,
+    and the final AEP matches :meth:`JensenWakeModel.calculate_aep`.
+    """
+
+    def __init__(self, n_envs: int, wind_rose: Dict[str, np.ndarray],
+                 config: Optional[Dict] = None, rl_config: Optional[Dict] = None,
+                 wake_model: Optional[JensenWakeModel] = None):
+        """
+        Initialize the environments.
+
+        Args:
+            n_envs: Number of parallel episodes
+            wind_rose: Binned wind rose used for the rewards
+            config: Wind farm configuration (``wind_farm`` section of config.yaml)
+            rl_config: Environment settings (see ``DEFAULT_RL_CONFIG``)
+            wake_model: Wake model providing the single-wake deficits
+        """
+        self.config = {**DEFAULT_FARM_CONFIG, **(config or {})}
+        self.rl_config = {**DEFAULT_RL_CONFIG, **(rl_config or {})}
+        self.wake_model = wake_model or JensenWakeModel(self.config)
+        self.n_envs = int(n_envs)
+
+        self.n_turbines = int(self.rl_config['n_turbines'] or self.config['max_turbines'])
+        self.max_episode_steps = int(self.rl_config['max_episode_steps'] or 2 * self.n_turbines)
+        self.cell_size = float(self.rl_config['cell_size'])
+        self.cols = max(1, int(self.config['farm_width'] // self.cell_size))
+        self.rows = max(1, int(self.config['farm_height'] // self.cell_size))
+        self.n_actions = self.rows * self.cols
+        self.observation_shape = (self.rows, self.cols)
+
+        directions, speeds, frequencies = self.wake_model._active_bins(wind_rose)
+        theta = np.radians(directions)
+        self._sin, self._cos = np.sin(theta), np.cos(theta)
+        self._speeds = speeds
+        self._frequencies = frequencies
+        self._free_power = self._expected_power(np.zeros((1, len(directions))))[0]  # (D,)
+        self.reward_scale = 1.0 / max(self._free_power.sum(), 1e-12)
+
+        # Cells closer than the minimum distance to a turbine (incl. its own)
+        reach = int(np.ceil(self.config['min_turbine_distance'] / self.cell_size))
+        dr, dc = np.mgrid[-reach:reach + 1, -reach:reach + 1]
+        close = np.hypot(dr, dc) * self.cell_size < self.config['min_turbine_distance']
+        self._stencil = (dr[close], dc[close])
+
+        shape = (self.n_envs, len(directions), self.n_turbines)
+        self.positions = np.zeros((self.n_envs, self.n_turbines, 2))
+        self.counts = np.zeros(self.n_envs, dtype=np.int64)
+        self.steps = np.zeros(self.n_envs, dtype=np.int64)
+        self.sq_deficits = np.zeros(shape)
+        self.turbine_power = np.zeros(shape)
+        self.occupancy = np.zeros((self.n_envs, self.rows, self.cols), dtype=np.float32)
+        self.action_mask = np.ones((self.n_envs, self.n_actions), dtype=bool)
+        self.rng = np.random.default_rng()
+
+    def reset(self, seed: Optional[int] = None) -> Tuple[np.ndarray, Dict]:
+        """
+        Reset every environment to an empty farm.
+
+        Args:
+            seed: Seed for :meth:`sample_actions`
+
+        Returns:
+            Tuple of observations and an info dict with ``action_mask``
+        """
+        self.rng = np.random.default_rng(seed)
+        self._reset_envs(np.arange(self.n_envs))
+        return self.occupancy.copy(), {'action_mask': self.action_mask.copy()}
+
+    def step(self, actions) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, Dict]:
+        """
+        Place one turbine in every environment.
+
+        Args:
+            actions: Flat cell index per environment, shape (n_envs,)
+
+        Returns:
+            Tuple of observations (n_envs, rows, cols), rewards (n_envs,),
+            terminated and truncated flags (n_envs,), and an info dict with
+            ``aep_mwh``, ``action_mask`` and, for finished episodes,
+            ``final_aep_mwh`` and ``final_positions``
+        """
+        actions = np.asarray(actions, dtype=np.int64)
+        envs = np.arange(self.n_envs)
+        valid = ((actions >= 0) & (actions < self.n_actions)
+                 & self.action_mask[envs, np.clip(actions, 0, self.n_actions - 1)])
+
+        rewards = np.full(self.n_envs, float(self.rl_config['invalid_action_penalty']))
+        placed = envs[valid]
+        if placed.size:
+            rewards[placed] = self._place(placed, actions[placed]) * self.reward_scale
+        self.steps += 1
+
+        terminated = (self.counts >= self.n_turbines) | ~self.action_mask.any(axis=1)
+        truncated = ~terminated & (self.steps >= self.max_episode_steps)
+        aep = self.aep()
+
+        info = {'aep_mwh': aep}
+        done = np.flatnonzero(terminated | truncated)
+        if done.size:
+            info['final_aep_mwh'] = np.where(terminated | truncated, aep, np.nan)
+            info['final_positions'] = {int(e): self.positions[e, :self.counts[e]].copy()
+                                       for e in done}
+            self._reset_envs(done)
+        info['action_mask'] = self.action_mask.copy()
+        return self.occupancy.copy(), rewards, terminated, truncated, info
+
+    def aep(self) -> np.ndarray:
+        """Current AEP (MWh/year) of every environment."""
+        return self.turbine_power.sum(axis=(1, 2)) * HOURS_PER_YEAR / 1000.0
+
+    def sample_actions(self) -> np.ndarray:
+        """Uniformly random valid action per environment (random policy)."""
+        scores = np.where(self.action_mask, self.rng.random(self.action_mask.shape), -1.0)
+        return np.argmax(scores, axis=1)
+
+    def _reset_envs(self, envs: np.ndarray):
+        """Clear the state of the given environments."""
+        self.positions[envs] = 0.0
+        self.counts[envs] = 0
+        self.steps[envs] = 0
+        self.sq_deficits[envs] = 0.0
+        self.turbine_power[envs] = 0.0
+        self.occupancy[envs] = 0.0
+        self.action_mask[envs] = True
+
+    def _expected_power(self, sq_deficits) -> np.ndarray:
+        """Frequency-weighted power (kW) for squared deficits of shape (K, D)."""
+        effective = self._speeds[None, None, :] * (1.0 - np.sqrt(sq_deficits))[:, :, None]
+        power = self.wake_model.turbine_power(effective)  # (K, D, S)
+        return np.einsum('kds,ds->kd', power, self._frequencies)
+
+    def _sector_power(self, sq_deficits, sectors) -> np.ndarray:
+        """Frequency-weighted power (kW) of K turbines, each in its own sector."""
+        effective = self._speeds[None, :] * (1.0 - np.sqrt(sq_deficits))[:, None]
+        power = self.wake_model.turbine_power(effective)  # (K, S)
+        return np.einsum('ks,ks->k', power, self._frequencies[sectors])
+
+    def _place(self, envs: np.ndarray, actions: np.ndarray) -> np.ndarray:
+        """Add a turbine to each env in ``envs``; return the mean power gain (kW)."""
+        rows, cols = np.divmod(actions, self.cols)
+        new = np.column_stack([(cols + 0.5) * self.cell_size, (rows + 0.5) * self.cell_size])
+        slots = self.counts[envs]
+
+        # Offsets of every existing turbine i relative to the new turbine k,
+        # for each sector: shape (V, D, N); empty slots are masked out
+        existing = np.arange(self.n_turbines)[None, :] < slots[:, None]  # (V, N)
+        dx = (self.positions[envs, :, 0] - new[:, None, 0])[:, None, :]
+        dy = (self.positions[envs, :, 1] - new[:, None, 1])[:, None, :]
+        sin_t, cos_t = self._sin[None, :, None], self._cos[None, :, None]
+        downwind = -(dx * sin_t + dy * cos_t)
+        crosswind = np.abs(dx * cos_t - dy * sin_t)
+
+        on_existing = self.wake_model.deficit_from_offsets(downwind, crosswind)
+        on_new = self.wake_model.deficit_from_offsets(-downwind, crosswind)
+        on_existing *= existing[:, None, :]
+        on_new *= existing[:, None, :]
+
+        # Existing turbines: only (env, sector, turbine) terms the new wake touches
+        gain = np.zeros(len(envs))
+        v, d, i = np.nonzero(on_existing)
+        if v.size:
+            e = envs[v]
+            self.sq_deficits[e, d, i] += on_existing[v, d, i] ** 2
+            updated = self._sector_power(self.sq_deficits[e, d, i], d)
+            gain += np.bincount(v, updated - self.turbine_power[e, d, i], minlength=len(envs))
+            self.turbine_power[e, d, i] = updated
+
+        # The new turbine sees the wakes of every existing turbine
+        new_sq = np.einsum('vdn,vdn->vd', on_new, on_new)
+        new_power = self._expected_power(new_sq)
+        self.sq_deficits[envs, :, slots] = new_sq
+        self.turbine_power[envs, :, slots] = new_power
+        gain += new_power.sum(axis=1)
+
+        self.positions[envs, slots] = new
+        self.counts[envs] += 1
+        self.occupancy[envs, rows, cols] = 1.0
+
+        # Block cells within the minimum spacing of the new turbine
+        stencil_r = rows[:, None] + self._stencil[0][None, :]
+        stencil_c = cols[:, None] + self._stencil[1][None, :]
+        inside = ((stencil_r >= 0) & (stencil_r < self.rows)
+                  & (stencil_c >= 0) & (stencil_c < self.cols))
+        env_idx = np.broadcast_to(envs[:, None], stencil_r.shape)[inside]
+        self.action_mask[env_idx, (stencil_r * self.cols + stencil_c)[inside]] = False
+        return gain
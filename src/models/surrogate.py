@@ -0,0 +1,214 @@
+"""
+Surrogate fitness screening for the AI Wind Farm Optimizer.
+
+A cheap scikit-learn regressor learns layout AEP from geometric features,
+a histogram of pairwise turbine distances and per-sector counts of
+upwind turbines inside the wake cone, and is retrained online as exact
+wake/AEP scores arrive. The genetic algorithm uses it to pre-screen
+offspring so that only the most promising fraction is scored exactly.
+"""
+
+import numpy as np
+from typing import Dict, Optional
+
+from .power_calculations import DEFAULT_TURBINE_CONFIG
+from .spatial_index import NeighbourIndex
+
+
+DEFAULT_SURROGATE_CONFIG = {
+    'model': 'ridge',  # 'ridge' or 'gradient_boosting'
+    'alpha': 1.0,  # ridge regularization
+    'distance_bins': 16,
+    'max_distance_diameters': 10.0,  # range of distance and upwind features
+    'buffer_size': 5000,  # most recent exact scores kept for training
+    'warmup': 100,  # exact scores required before the surrogate is used
+}
+
+
+def layout_features(population, directions, sector_weights, rotor_diameter: float,
+                    wake_decay: float = 0.075, distance_bins: int = 16,
+                    max_distance: Optional[float] = None) -> np.ndarray:
+    """
+    Geometric features of a batch of layouts.
+
+    For every layout the features are the pairwise distance histogram
+    (``distance_bins`` bins up to ``max_distance``, per turbine), and for
+    every direction sector the number of upwind turbines inside the wake
+    cone and the same count weighted by the Jensen decay factor
+    ``(R / (R + k x))^2``, both per turbine. A final column holds the
+    sector-frequency weighted decay sum. Only pairs closer than
+    ``max_distance`` are visited, found with a KD-tree.
+
+    Args:
+        population: Turbine positions of shape (L, N, 2)
+        directions: Wind directions of the sectors (degrees), shape (D,)
+        sector_weights: Probability of each sector, shape (D,)
+        rotor_diameter: Rotor diameter (m)
+        wake_decay: Wake expansion coefficient k
+        distance_bins: Number of distance histogram bins
+        max_distance: Range of the features (m), 10 rotor diameters by default
+
+    Returns:
+        Feature matrix of shape (L, distance_bins + 2 D + 1)
+    """
+    population = np.asarray(population, dtype=float)
+    n_layouts, n_turbines, _ = population.shape
+    radius = rotor_diameter / 2.0
+    max_distance = max_distance or 10.0 * rotor_diameter
+    theta = np.radians(np.asarray(directions, dtype=float))[:, None]
+    n_sectors = theta.shape[0]
+
+    features = np.zeros((n_layouts, distance_bins + 2 * n_sectors + 1))
+    edges = np.linspace(0.0, max_distance, distance_bins + 1)
+    for l, layout in enumerate(population):
+        pairs = NeighbourIndex(layout).close_pairs(max_distance)
+        offsets = layout[pairs[:, 0]] - layout[pairs[:, 1]]
+        features[l, :distance_bins] = np.histogram(np.hypot(*offsets.T), bins=edges)[0]
+
+        # Signed along-wind offset of the first turbine of each pair from
+        # the second; either turbine can be the upwind one
+        along = -(offsets[:, 0] * np.sin(theta) + offsets[:, 1] * np.cos(theta))
+        across = np.abs(offsets[:, 0] * np.cos(theta) - offsets[:, 1] * np.sin(theta))
+        distance = np.abs(along)
+        in_wake = (distance > 0.0) & (across < 2 * radius + wake_decay * distance)
+        decay = np.where(in_wake, (radius / (radius + wake_decay * distance)) ** 2, 0.0)
+
+        features[l, distance_bins:distance_bins + n_sectors] = in_wake.sum(axis=1)
+        features[l, distance_bins + n_sectors:-1] = decay.sum(axis=1)
+
+    features[:, :-1] /= n_turbines
+    features[:, -1] = features[:, distance_bins + n_sectors:-1] @ sector_weights
+    return features
+
+
+class SurrogateFitnessModel:
+    """
+    Online AEP surrogate built on :func:`layout_features`.
+
+    Exact scores are appended to a bounded buffer and the regressor is
+    refit on it after every update. Before each refit, the incoming batch
+    is predicted with the current model, so the recorded errors are honest
+    out-of-sample (test-then-train) estimates.
+    """
+
+    def __init__(self, wind_rose: Dict[str, np.ndarray], config: Optional[Dict] = None,
+                 turbine_config: Optional[Dict] = None, wake_decay: float = 0.075):
+        """
+        Initialize the surrogate.
+
+        Args:
+            wind_rose: Binned wind rose the AEP is computed for
+            config: Surrogate settings (see ``DEFAULT_SURROGATE_CONFIG``)
+            turbine_config: Turbine parameters (``wind_farm`` section of config.yaml)
+            wake_decay: Wake expansion coefficient k of the exact wake model
+        """
+        self.config = {**DEFAULT_SURROGATE_CONFIG, **(config or {})}
+        if self.config['model'] not in ('ridge', 'gradient_boosting'):
+            raise ValueError(f"Unknown surrogate model: {self.config['model']}")
+        turbine_config = {**DEFAULT_TURBINE_CONFIG, **(turbine_config or {})}
+        self.rotor_diameter = float(turbine_config['turbine_diameter'])
+        self.wake_decay = wake_decay
+
+        frequencies = np.asarray(wind_rose['frequencies'], dtype=float)
+        self.directions = np.asarray(wind_rose['directions'], dtype=float)
+        self.sector_weights = frequencies.sum(axis=1) / max(frequencies.sum(), 1e-12)
+
+        self.model = None
+        self._features = []
+        self._targets = []
+        self.errors = []  # (predicted, exact) pairs from test-then-train updates
+
+    @property
+    def n_samples(self) -> int:
+        """Number of exact scores in the training buffer."""
+        return sum(len(t) for t in self._targets)
+
+    @property
+    def ready(self) -> bool:
+        """True once enough exact scores have been seen to screen with."""
+        return self.model is not None and self.n_samples >= self.config['warmup']
+
+    def features(self, population) -> np.ndarray:
+        """Feature matrix for a batch of layouts."""
+        return layout_features(population, self.directions, self.sector_weights,
+                               self.rotor_diameter, self.wake_decay,
+                               self.config['distance_bins'],
+                               self.config['max_distance_diameters'] * self.rotor_diameter)
+
+    def predict(self, population, features: Optional[np.ndarray] = None) -> np.ndarray:
+        """Predicted AEP (MWh/year) for a batch of layouts."""
+        if self.model is None:
+            raise RuntimeError("Surrogate has not been trained yet")
+        features = self.features(population) if features is None else features
+        return self.model.predict(features)
+
+    def update(self, population, aep, features: Optional[np.ndarray] = None) -> None:
+        """
+        Add exact scores and refit the surrogate.
+
+        Args:
+            population: Layouts of shape (L, N, 2) that were scored exactly
+            aep: Their exact AEP (MWh/year), shape (L,)
+            features: Precomputed features of ``population``
+        """
+        aep = np.asarray(aep, dtype=float)
+        if len(aep) == 0:
+            return
+        features = self.features(population) if features is None else features
+        if self.ready:
+            self.errors.extend(zip(self.predict(population, features), aep))
+
+        self._features.append(features)
+        self._targets.append(aep)
+        while self.n_samples - len(self._targets[0]) >= self.config['buffer_size']:
+            self._features.pop(0)
+            self._targets.pop(0)
+        if self.n_samples >= 2:
+            self.model = self._build_model().fit(np.concatenate(self._features),
+                                                 np.concatenate(self._targets))
+
+    def error_summary(self) -> Dict:
+        """
+        Out-of-sample surrogate accuracy over all updates so far.
+
+        Returns:
+            Dictionary with the number of predictions, mean absolute error
+            (MWh/year), mean absolute percentage error and Spearman rank
+            correlation between predicted and exact AEP
+        """
+        if not self.errors:
+            return {'n_predictions': 0, 'mae_mwh': np.nan, 'mape': np.nan,
+                    'rank_correlation': np.nan}
+        from scipy.stats import spearmanr
+
+        predicted, exact = np.array(self.errors).T
+        return {
+            'n_predictions': len(exact),
+            'mae_mwh': float(np.mean(np.abs(predicted - exact))),
+            'mape': float(np.mean(np.abs(predicted - exact) / np.abs(exact))),
+            'rank_correlation': float(spearmanr(predicted, exact)[0]) if len(exact) > 2
+            else np.nan,
+        }
+
+    def state_dict(self) -> Dict:
+        """Picklable training state, for GA checkpoints."""
+        return {'model': self.model, 'features': list(self._features),
+                'targets': list(self._targets), 'errors': list(self.errors)}
+
+    def load_state_dict(self, state: Dict):
+        """Restore the state written by :meth:`state_dict`."""
+        self.model = state['model']
+        self._features = list(state['features'])
+        self._targets = list(state['targets'])
+        self.errors = list(state['errors'])
+
+    def _build_model(self):
+        """Fresh scikit-learn regressor for the configured model type."""
+        from sklearn.pipeline import make_pipeline
+        from sklearn.preprocessing import StandardScaler
+
+        if self.config['model'] == 'gradient_boosting':
+            from sklearn.ensemble import HistGradientBoostingRegressor
+            return HistGradientBoostingRegressor(max_iter=200, random_state=0)
+        from sklearn.linear_model import Ridge
+        return make_pipeline(StandardScaler(), Ridge(alpha=self.config['alpha']))
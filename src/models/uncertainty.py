@@ -0,0 +1,351 @@
+"""
+Monte-Carlo AEP uncertainty (P50/P90) for the AI Wind Farm Optimizer.
+
+Financing needs exceedance energy numbers rather than one deterministic
+AEP. :class:`MonteCarloAEPAnalysis` samples the long-term Weibull shape
+and scale, a rotation of the wind rose and the wake expansion and thrust
+coefficients thousands of times. Each batch of samples is scored for a
+layout as one broadcast array operation, optionally across a process
+pool. AEP values are folded into a :class:`QuantileSketch` as they
+arrive, so memory stays bounded regardless of the sample count, and the
+result is an exceedance table (P50, P75, P90, ...) that the visualizers
+can plot.
+"""
+
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+from .power_calculations import HOURS_PER_YEAR
+from .wake_models import JensenWakeModel
+
+
+DEFAULT_UNCERTAINTY_CONFIG = {
+    'n_samples': 2000,
+    'batch_size': 64,  # samples scored together as one array operation
+    'weibull_k_std': 0.05,  # log-normal sigma of the long-term Weibull shape
+    'weibull_c_std': 0.05,  # log-normal sigma of the Weibull scale (mean speed)
+    'direction_shift_std': 5.0,  # degrees, normal sigma of a wind rose rotation
+    'wake_decay_std': 0.2,  # log-normal sigma of the wake expansion coefficient
+    'thrust_coefficient_std': 0.05,  # log-normal sigma of the thrust coefficient
+    'speed_bin_width': 1.0,  # m/s
+    'max_speed': 30.0,  # m/s
+    'relative_accuracy': 1e-4,  # quantile sketch accuracy
+    'exceedance_levels': [50, 75, 90, 95, 99],
+    'n_workers': 1,  # >1 scores batches over a process pool
+    'random_state': 42,
+}
+
+# Standard normal draws per sample: Weibull k, Weibull c, direction shift,
+# wake decay, thrust coefficient
+N_DRAWS = 5
+DRAW_BLOCK_SIZE = 1024  # samples per independently seeded block of draws
+
+
+class QuantileSketch:
+    """
+    Mergeable streaming quantile estimator with bounded relative error.
+
+    Positive values are counted in logarithmic bins of ratio
+    ``(1 + a) / (1 - a)``, so every quantile is returned within relative
+    accuracy ``a`` and memory grows only with the logarithm of the value
+    range, not with the number of values (the DDSketch construction).
+    Non-positive values are counted as zero. Mean and standard deviation
+    are tracked exactly with a mergeable Welford update.
+    """
+
+    def __init__(self, relative_accuracy: float = 1e-4):
+        """
+        Initialize an empty sketch.
+
+        Args:
+            relative_accuracy: Relative error bound of the quantiles
+        """
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        self.relative_accuracy = float(relative_accuracy)
+        self.gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = np.log(self.gamma)
+
+        self.count = 0
+        self.zero_count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = np.inf
+        self.maximum = -np.inf
+        self._offset = 0
+        self._counts = np.zeros(0, dtype=np.int64)
+
+    def update(self, values) -> 'QuantileSketch':
+        """Fold a batch of values into the sketch."""
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size == 0:
+            return self
+        batch = QuantileSketch(self.relative_accuracy)
+        batch.count = values.size
+        batch.mean = float(values.mean())
+        batch.m2 = float(((values - batch.mean) ** 2).sum())
+        batch.minimum = float(values.min())
+        batch.maximum = float(values.max())
+
+        positive = values[values > 0.0]
+        batch.zero_count = values.size - positive.size
+        if positive.size:
+            keys = np.ceil(np.log(positive) / self._log_gamma).astype(np.int64)
+            batch._offset = int(keys.min())
+            batch._counts = np.bincount(keys - batch._offset)
+        return self.merge(batch)
+
+    def merge(self, other: 'QuantileSketch') -> 'QuantileSketch':
+        """Combine another sketch with the same accuracy into this one in place."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        if other.count == 0:
+            return self
+
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta ** 2 * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+        self.zero_count += other.zero_count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+        if other._counts.size:
+            if not self._counts.size:
+                self._offset, self._counts = other._offset, other._counts.copy()
+            else:
+                low = min(self._offset, other._offset)
+                high = max(self._offset + self._counts.size, other._offset + other._counts.size)
+                counts = np.zeros(high - low, dtype=np.int64)
+                counts[self._offset - low:self._offset - low + self._counts.size] += self._counts
+                counts[other._offset - low:other._offset - low + other._counts.size] += other._counts
+                self._offset, self._counts = low, counts
+        return self
+
+    @property
+    def std(self) -> float:
+        """Population standard deviation of the values seen."""
+        return float(np.sqrt(self.m2 / self.count)) if self.count else np.nan
+
+    def quantile(self, q):
+        """
+        Estimate quantiles.
+
+        Args:
+            q: Quantile level(s) in [0, 1]
+
+        Returns:
+            Estimated value(s), within ``relative_accuracy`` of the exact
+            (lower) sample quantile
+        """
+        if self.count == 0:
+            raise ValueError("Sketch is empty")
+        q = np.asarray(q, dtype=float)
+        rank = np.floor(np.clip(q, 0.0, 1.0) * (self.count - 1))
+
+        # Bin representative values, preceded by the zero bucket
+        keys = self._offset + np.arange(self._counts.size)
+        values = np.concatenate([[0.0], 2.0 * self.gamma ** keys / (self.gamma + 1.0)])
+        cumulative = np.cumsum(np.concatenate([[self.zero_count], self._counts]))
+        estimate = values[np.searchsorted(cumulative, rank, side='right')]
+        estimate = np.clip(estimate, self.minimum, self.maximum)
+        return float(estimate) if estimate.ndim == 0 else estimate
+
+
+def exceedance_table(sketch: QuantileSketch, levels=(50, 75, 90, 95, 99),
+                     nominal_aep: Optional[float] = None) -> Dict:
+    """
+    Exceedance energy levels from a sketch of sampled AEP.
+
+    ``P90`` is the AEP exceeded with 90 % probability, i.e. the 10th
+    percentile of the samples.
+
+    Args:
+        sketch: Sketch of sampled AEP values (MWh/year)
+        levels: Exceedance probabilities (%) to report
+        nominal_aep: Deterministic AEP to include for reference
+
+    Returns:
+        Dictionary with the ``levels`` (%), their ``labels`` and
+        ``aep_mwh``, their ratio to P50, and a 1-99 % ``curve`` for plotting
+    """
+    levels = np.asarray(levels, dtype=float)
+    aep = np.atleast_1d(sketch.quantile(1.0 - levels / 100.0))
+    curve_levels = np.arange(1.0, 100.0)
+    table = {
+        'levels': levels.tolist(),
+        'labels': [f"P{level:g}" for level in levels],
+        'aep_mwh': aep.tolist(),
+        'ratio_to_p50': (aep / sketch.quantile(0.5)).tolist(),
+        'curve': {'exceedance': curve_levels.tolist(),
+                  'aep_mwh': np.atleast_1d(sketch.quantile(1.0 - curve_levels / 100.0)).tolist()},
+    }
+    if nominal_aep is not None:
+        table['nominal_aep_mwh'] = float(nominal_aep)
+    return table
+
+
+def _score_batch(analysis: 'MonteCarloAEPAnalysis', positions, draws) -> np.ndarray:
+    """Score one batch of samples (runs in the pool workers)."""
+    return analysis.sample_aep(positions, draws)
+
+
+class MonteCarloAEPAnalysis:
+    """
+    Monte-Carlo AEP exceedance analysis for a wind climate.
+
+    The wind climate is a set of direction sectors with long-term Weibull
+    parameters. Every sample perturbs the Weibull shape and scale, rotates
+    the wind rose and perturbs the wake expansion and thrust coefficients.
+    The standard normal draws behind the samples come from
+    ``random_state`` alone and are indexed by sample number, so the
+    results do not depend on the batch size or worker count, and two
+    layouts analysed with the same settings see the same samples (common
+    random numbers). The difference of their P90s is therefore far less
+    noisy than either P90.
+    """
+
+    def __init__(self, sector_frequencies, weibull_k, weibull_c, directions=None,
+                 config: Optional[Dict] = None, uncertainty_config: Optional[Dict] = None,
+                 wake_model: Optional[JensenWakeModel] = None):
+        """
+        Initialize the analysis.
+
+        Args:
+            sector_frequencies: Probability of each direction sector, shape (D,)
+            weibull_k: Weibull shape parameter, scalar or one per sector
+            weibull_c: Weibull scale parameter (m/s), scalar or one per sector
+            directions: Sector centres in degrees (evenly spaced from 0 by default)
+            config: Wind farm configuration (``wind_farm`` section of config.yaml)
+            uncertainty_config: Sampling settings (see ``DEFAULT_UNCERTAINTY_CONFIG``)
+            wake_model: Nominal wake model (built from ``config`` by default)
+        """
+        self.config = {**DEFAULT_UNCERTAINTY_CONFIG, **(uncertainty_config or {})}
+        self.wake_model = wake_model or JensenWakeModel(config)
+
+        sector_frequencies = np.asarray(sector_frequencies, dtype=float)
+        self.sector_frequencies = sector_frequencies / sector_frequencies.sum()
+        n_sectors = len(self.sector_frequencies)
+        self.directions = (np.arange(n_sectors) * 360.0 / n_sectors if directions is None
+                           else np.asarray(directions, dtype=float))
+        self.weibull_k = np.broadcast_to(np.asarray(weibull_k, dtype=float), (n_sectors,))
+        self.weibull_c = np.broadcast_to(np.asarray(weibull_c, dtype=float), (n_sectors,))
+
+        width = self.config['speed_bin_width']
+        self._edges = np.arange(0.0, self.config['max_speed'] + width / 2, width)
+        self._speeds = 0.5 * (self._edges[:-1] + self._edges[1:])
+
+    def draws(self, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """
+        Standard normal draws of samples ``start`` to ``stop``.
+
+        Draws are generated in fixed blocks of ``DRAW_BLOCK_SIZE`` samples,
+        each seeded from ``(random_state, block)``, so the same sample index
+        always gets the same draws whatever the batching.
+
+        Returns:
+            Array of shape (stop - start, N_DRAWS)
+        """
+        stop = self.config['n_samples'] if stop is None else stop
+        first, last = start // DRAW_BLOCK_SIZE, (stop - 1) // DRAW_BLOCK_SIZE
+        blocks = [np.random.default_rng([self.config['random_state'], block])
+                  .standard_normal((DRAW_BLOCK_SIZE, N_DRAWS))
+                  for block in range(first, last + 1)]
+        offset = start - first * DRAW_BLOCK_SIZE
+        return np.concatenate(blocks)[offset:offset + stop - start]
+
+    def sample_aep(self, positions, draws) -> np.ndarray:
+        """
+        AEP of one layout for a batch of samples, as one array operation.
+
+        Args:
+            positions: Turbine positions of shape (N, 2)
+            draws: Standard normal draws of shape (B, N_DRAWS); all zeros
+                gives the nominal AEP
+
+        Returns:
+            AEP in MWh/year per sample, shape (B,)
+        """
+        cfg = self.config
+        positions = np.asarray(positions, dtype=float)
+        draws = np.atleast_2d(np.asarray(draws, dtype=float))
+        z_k, z_c, z_dir, z_decay, z_ct = draws.T
+
+        # Sector x speed frequencies from the perturbed Weibull climate (B, D, S)
+        k = self.weibull_k[None, :, None] * np.exp(cfg['weibull_k_std'] * z_k)[:, None, None]
+        c = self.weibull_c[None, :, None] * np.exp(cfg['weibull_c_std'] * z_c)[:, None, None]
+        cdf = 1.0 - np.exp(-(self._edges[None, None, :] / c) ** k)
+        frequencies = self.sector_frequencies[None, :, None] * np.diff(cdf, axis=2)
+
+        # Wake deficits for the rotated rose and perturbed wake parameters (B, D, N, N)
+        model = self.wake_model
+        theta = np.radians(self.directions[None, :] + cfg['direction_shift_std'] * z_dir[:, None])
+        sin_t, cos_t = np.sin(theta)[:, :, None, None], np.cos(theta)[:, :, None, None]
+        dx = positions[None, None, :, None, 0] - positions[None, None, None, :, 0]
+        dy = positions[None, None, :, None, 1] - positions[None, None, None, :, 1]
+        decay = model.wake_decay * np.exp(cfg['wake_decay_std'] * z_decay)
+        thrust = np.minimum(model.thrust_coefficient
+                            * np.exp(cfg['thrust_coefficient_std'] * z_ct), 0.99)
+        deficits = model.deficit_from_offsets(
+            -(dx * sin_t + dy * cos_t), np.abs(dx * cos_t - dy * sin_t),
+            wake_decay=decay[:, None, None, None],
+            initial_deficit=(1.0 - np.sqrt(1.0 - thrust))[:, None, None, None])
+        combined = np.sqrt(np.einsum('bdij,bdij->bdi', deficits, deficits))
+
+        effective = self._speeds[None, None, :, None] * (1.0 - combined[:, :, None, :])
+        farm_power = model.turbine_power(effective).sum(axis=-1)  # (B, D, S)
+        return np.einsum('bds,bds->b', farm_power, frequencies) * HOURS_PER_YEAR / 1000.0
+
+    def run(self, positions, verbose: bool = False) -> Dict:
+        """
+        Run the Monte-Carlo analysis for one layout.
+
+        Args:
+            positions: Turbine positions of shape (N, 2)
+            verbose: Print progress per batch
+
+        Returns:
+            Dictionary with the nominal AEP, the sample mean and standard
+            deviation, and the exceedance table of :func:`exceedance_table`
+        """
+        positions = np.asarray(positions, dtype=float)
+        n_samples = int(self.config['n_samples'])
+        batch = self._batch_size(len(positions))
+        starts = list(range(0, n_samples, batch))
+        batches = (self.draws(start, min(start + batch, n_samples)) for start in starts)
+
+        sketch = QuantileSketch(self.config['relative_accuracy'])
+        n_workers = int(self.config['n_workers'])
+        if n_workers > 1:
+            # map() yields in submission order, so the sketch is deterministic
+            with ProcessPoolExecutor(max_workers=n_workers) as pool:
+                for i, aep in enumerate(pool.map(_score_batch, [self] * len(starts),
+                                                 [positions] * len(starts), batches)):
+                    sketch.update(aep)
+                    if verbose:
+                        print(f"   Monte-Carlo batch {i + 1}/{len(starts)}")
+        else:
+            for i, draws in enumerate(batches):
+                sketch.update(self.sample_aep(positions, draws))
+                if verbose:
+                    print(f"   Monte-Carlo batch {i + 1}/{len(starts)}")
+
+        nominal = float(self.sample_aep(positions, np.zeros((1, N_DRAWS)))[0])
+        return {
+            'n_samples': sketch.count,
+            'n_turbines': len(positions),
+            'nominal_aep_mwh': nominal,
+            'mean_aep_mwh': sketch.mean,
+            'std_aep_mwh': sketch.std,
+            'exceedance': exceedance_table(sketch, self.config['exceedance_levels'], nominal),
+        }
+
+    def _batch_size(self, n_turbines: int) -> int:
+        """Samples per batch, capped by the wake model's memory budget."""
+        # Roughly six (D, N, N) and two (D, S, N) float64 temporaries per sample
+        n_sectors, n_speeds = len(self.directions), len(self._speeds)
+        per_sample = 8 * (6 * n_sectors * n_turbines ** 2 + 2 * n_sectors * n_speeds * n_turbines)
+        budget = int(self.wake_model.max_chunk_mb * 2 ** 20 // per_sample)
+        return max(1, min(int(self.config['batch_size']), budget))
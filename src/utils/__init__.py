@@ -0,0 +1,17 @@
+"""
+Shared utilities for the AI Wind Farm Optimizer.
+"""
+
+from .array_store import MemmapArrayStore, save_columnar, load_columnar
+from .batch_runner import BatchRunner, load_manifest, deep_merge
+from .profiling import StageProfiler
+
+__all__ = [
+    'MemmapArrayStore',
+    'save_columnar',
+    'load_columnar',
+    'BatchRunner',
+    'load_manifest',
+    'deep_merge',
+    'StageProfiler',
+]
@@ -0,0 +1,210 @@
+"""
+Columnar and memory-mapped binary storage for the AI Wind Farm Optimizer.
+
+These complement the CSV/JSON paths of ``FileUtils``: wind time series are
+stored column-wise (one ``.npy`` per column, NPZ or Parquet), and layout
+populations or per-turbine results go to a memory-mapped float32 array
+store. Loaders return memory-mapped, zero-copy views where the format
+allows it.
+"""
+
+import importlib.util
+import json
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# pyarrow is only imported when a Parquet file is actually read or written
+PYARROW_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+
+COLUMNAR_FORMATS = ('npy', 'npz', 'parquet')
+COLUMNS_MANIFEST = 'columns.json'
+
+
+def _as_columns(data) -> Dict[str, np.ndarray]:
+    """Convert a DataFrame or mapping of arrays into a dict of 1-D arrays."""
+    if hasattr(data, 'columns') and hasattr(data, 'to_numpy'):
+        return {str(name): data[name].to_numpy() for name in data.columns}
+    return {str(name): np.asarray(values) for name, values in data.items()}
+
+
+def _fixed_width(name: str, values: np.ndarray) -> np.ndarray:
+    """String columns as fixed-width unicode arrays for the NumPy formats."""
+    if values.dtype != object:
+        return values
+    if all(isinstance(value, str) for value in values):
+        return values.astype(str)
+    raise ValueError(f"Column {name} has object dtype; npy/npz store numeric, "
+                     f"datetime and string columns only")
+
+
+def _zero_copy_type(pa, data_type) -> bool:
+    """Arrow types whose single-chunk arrays convert to NumPy without a copy."""
+    return (pa.types.is_integer(data_type) or pa.types.is_floating(data_type)
+            or pa.types.is_timestamp(data_type) or pa.types.is_duration(data_type))
+
+
+def _require_pyarrow():
+    """Import pyarrow, raising a helpful error when Parquet support is unavailable."""
+    if not PYARROW_AVAILABLE:
+        raise ImportError("Parquet storage requires pyarrow: pip install pyarrow")
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    return pa, pq
+
+
+def _infer_format(filepath: Path) -> str:
+    """Infer the columnar format from a path."""
+    if filepath.is_dir():
+        return 'npy'
+    suffix = filepath.suffix.lstrip('.').lower()
+    if suffix in COLUMNAR_FORMATS:
+        return suffix
+    raise ValueError(f"Cannot infer columnar format from {filepath}")
+
+
+def save_columnar(data, filepath, file_format: str = 'npy') -> Path:
+    """
+    Save tabular data (e.g. a wind time series) in a columnar binary format.
+
+    Args:
+        data: DataFrame or mapping of column name to 1-D array
+        filepath: Destination; a directory for 'npy', a file otherwise
+        file_format: 'npy' (one memory-mappable file per column),
+            'npz' (single uncompressed archive) or 'parquet'
+
+    Returns:
+        Path of the written file or directory
+
+    Raises:
+        ValueError: For object columns other than strings in 'npy'/'npz';
+            strings are stored as fixed-width unicode arrays
+    """
+    if file_format not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unsupported columnar format: {file_format}")
+
+    columns = _as_columns(data)
+    filepath = Path(filepath)
+
+    if file_format in ('npy', 'npz'):
+        columns = {name: _fixed_width(name, values) for name, values in columns.items()}
+
+    if file_format == 'npy':
+        filepath.mkdir(parents=True, exist_ok=True)
+        for name, values in columns.items():
+            np.save(filepath / f"{name}.npy", np.ascontiguousarray(values))
+        with open(filepath / COLUMNS_MANIFEST, 'w') as f:
+            json.dump({'columns': list(columns)}, f)
+    elif file_format == 'npz':
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        np.savez(filepath, **columns)
+    else:
+        pa, pq = _require_pyarrow()
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        table = pa.table(columns)
+        # A single row group keeps every column in one chunk, and plain
+        # uncompressed pages are read without a dictionary decode
+        pq.write_table(table, filepath, row_group_size=max(table.num_rows, 1),
+                       compression='none', use_dictionary=False)
+
+    return filepath
+
+
+def load_columnar(filepath, file_format: Optional[str] = None,
+                  columns: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+    """
+    Load data written by :func:`save_columnar`.
+
+    'npy' columns come back as read-only memory maps; NPZ archives are
+    read into memory. Parquet pages are decoded into Arrow buffers, and
+    numeric and timestamp columns without nulls are returned as NumPy views
+    of those buffers without a further copy; other columns (strings,
+    booleans, columns with nulls) are converted.
+
+    Args:
+        filepath: File or directory written by :func:`save_columnar`
+        file_format: Format override (inferred from the path by default)
+        columns: Optional subset of columns to load
+
+    Returns:
+        Mapping of column name to 1-D array
+    """
+    filepath = Path(filepath)
+    file_format = file_format or _infer_format(filepath)
+
+    if file_format == 'npy':
+        with open(filepath / COLUMNS_MANIFEST) as f:
+            names = json.load(f)['columns']
+        return {name: np.load(filepath / f"{name}.npy", mmap_mode='r')
+                for name in (columns or names)}
+
+    if file_format == 'npz':
+        with np.load(filepath) as archive:
+            return {name: archive[name] for name in (columns or archive.files)}
+
+    if file_format == 'parquet':
+        pa, pq = _require_pyarrow()
+        table = pq.read_table(filepath, columns=columns, memory_map=True)
+        result = {}
+        for name in table.column_names:
+            column = table.column(name)
+            if (column.num_chunks == 1 and column.null_count == 0
+                    and _zero_copy_type(pa, column.type)):
+                result[name] = column.chunk(0).to_numpy(zero_copy_only=True)
+            else:
+                result[name] = column.to_numpy()
+        return result
+
+    raise ValueError(f"Unsupported columnar format: {file_format}")
+
+
+class MemmapArrayStore:
+    """
+    Directory of memory-mapped ``.npy`` arrays.
+
+    Intended for layout populations of shape (L, N, 2) and per-turbine
+    results, stored as float32 by default. Arrays can be created up front
+    and filled incrementally, and are reopened as zero-copy memory maps.
+    """
+
+    def __init__(self, directory, dtype=np.float32):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory holding the arrays (created if missing)
+            dtype: Storage dtype for saved arrays
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.dtype = np.dtype(dtype)
+
+    def path(self, name: str) -> Path:
+        """File path of the array called ``name``."""
+        return self.directory / f"{name}.npy"
+
+    def create(self, name: str, shape: Tuple[int, ...]) -> np.memmap:
+        """Create a zero-filled writable memory-mapped array."""
+        return np.lib.format.open_memmap(self.path(name), mode='w+',
+                                         dtype=self.dtype, shape=tuple(shape))
+
+    def save(self, name: str, array) -> Path:
+        """Write an array, converting it to the store dtype."""
+        array = np.asarray(array)
+        target = self.create(name, array.shape)
+        target[...] = array
+        target.flush()
+        del target
+        return self.path(name)
+
+    def load(self, name: str, writable: bool = False) -> np.memmap:
+        """Open an array as a memory map (read-only unless ``writable``)."""
+        return np.load(self.path(name), mmap_mode='r+' if writable else 'r')
+
+    def names(self) -> List[str]:
+        """Names of the arrays in the store."""
+        return sorted(path.stem for path in self.directory.glob('*.npy'))
+
+    def __contains__(self, name: str) -> bool:
+        return self.path(name).exists()
@@ -0,0 +1,310 @@
+"""
+Batch scenario runner for the AI Wind Farm Optimizer.
+
+A manifest lists sites and scenarios (site, turbine count, config
+overrides). Each site's wind frequency table is built once in the parent
+and written to a memory-mapped array store; pool workers map those files
+read-only, so the tables are shared through the page cache instead of
+being pickled to every job. Failures, including a site that cannot be
+built or a worker that dies, are captured per scenario.
+"""
+
+import copy
+import json
+import os
+import time
+import traceback
+import numpy as np
+import yaml
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from ..data.frequency_table import WindFrequencyTable, load_or_build_frequency_table
+from ..data.wind_stream import generate_time_series_chunks
+from ..models.optimizer import GeneticLayoutOptimizer
+from .array_store import MemmapArrayStore
+
+
+def deep_merge(base: Dict, overrides: Optional[Dict]) -> Dict:
+    """Recursively merge ``overrides`` into a copy of ``base``."""
+    merged = copy.deepcopy(base)
+    for key, value in (overrides or {}).items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key] = deep_merge(merged[key], value)
+        else:
+            merged[key] = copy.deepcopy(value)
+    return merged
+
+
+def load_manifest(path) -> Dict:
+    """
+    Load a batch manifest (YAML or JSON).
+
+    Expected keys: ``sites`` (name -> ``path`` of a wind CSV, or synthetic
+    ``weibull_k``/``weibull_c``/``dominant_direction``/``n_points``),
+    ``scenarios`` (list of ``name``, ``site``, ``n_turbines`` and optional
+    ``overrides``) and optional ``defaults`` overrides for every scenario.
+    """
+    with open(path) as f:
+        manifest = yaml.safe_load(f)
+    if not manifest or 'scenarios' not in manifest:
+        raise ValueError(f"Manifest {path} has no scenarios")
+    manifest.setdefault('sites', {})
+    manifest.setdefault('defaults', {})
+    return manifest
+
+
+def build_site_table(site: Dict, config: Dict, cache_dir=None) -> WindFrequencyTable:
+    """Build the frequency table for one manifest site."""
+    direction_bins = config.get('wind_data', {}).get('direction_bins', 16)
+    if 'path' in site:
+        return load_or_build_frequency_table(site['path'], cache_dir=cache_dir,
+                                             direction_bins=direction_bins)
+
+    wind_config = config.get('wind_data', {})
+    chunks = generate_time_series_chunks(
+        int(site.get('n_points', wind_config.get('simulation_duration', 8760))),
+        weibull_k=site.get('weibull_k', wind_config.get('weibull_k', 2.0)),
+        weibull_c=site.get('weibull_c', wind_config.get('weibull_c', 8.0)),
+        dominant_direction=site.get('dominant_direction',
+                                    wind_config.get('dominant_direction', 270)),
+        random_state=site.get('random_state', config.get('ml', {}).get('random_state')),
+    )
+    return WindFrequencyTable.from_chunks(chunks, direction_bins=direction_bins)
+
+
+def run_scenario(scenario: Dict, config: Dict, table_dir: str,
+                 speed_resolution: float) -> Dict:
+    """
+    Run one scenario inside a worker process.
+
+    Args:
+        scenario: Scenario entry from the manifest
+        config: Fully merged configuration for the scenario
+        table_dir: Directory of the shared memory-mapped wind tables
+        speed_resolution: Speed bin width of the stored tables (m/s)
+
+    Returns:
+        Result row with status, metrics and timing; never raises
+    """
+    started = time.time()
+    result = {
+        'name': scenario.get('name'),
+        'site': scenario.get('site'),
+        'n_turbines': scenario.get('n_turbines'),
+        'status': 'ok',
+        'error': '',
+        'pid': os.getpid(),
+        'started_at': started,
+    }
+
+    try:
+        counts = MemmapArrayStore(table_dir, dtype=np.int64).load(scenario['site'])
+        wind_rose = WindFrequencyTable(counts, speed_resolution).to_wind_rose()
+
+        optimizer = GeneticLayoutOptimizer(config.get('wind_farm'), config.get('ml'))
+        ga_result = optimizer.optimize(wind_rose, n_turbines=scenario.get('n_turbines'))
+        ideal = optimizer.wake_model.ideal_aep(ga_result['n_turbines'], wind_rose)
+
+        result.update({
+            'n_turbines': ga_result['n_turbines'],
+            'best_aep_mwh': ga_result['best_aep_mwh'],
+            'efficiency': ga_result['best_aep_mwh'] / ideal,
+            'evaluations': ga_result['evaluations'],
+        })
+    except Exception as e:
+        result.update({'status': 'failed', 'error': f"{type(e).__name__}: {e}",
+                       'traceback': traceback.format_exc()})
+
+    result['finished_at'] = time.time()
+    result['runtime_s'] = result['finished_at'] - started
+    return result
+
+
+def _failed_row(scenario: Dict, error: Exception, trace: str = '') -> Dict:
+    """
+    Result row for a scenario that failed outside :func:`run_scenario`.
+
+    No worker ran it to completion, so its pid, start time and runtime are
+    unknown (None) and only the time the failure was recorded is set.
+    """
+    return {'name': scenario.get('name'), 'site': scenario.get('site'),
+            'n_turbines': scenario.get('n_turbines'), 'status': 'failed',
+            'error': f"{type(error).__name__}: {error}", 'pid': None,
+            'started_at': None, 'finished_at': time.time(), 'runtime_s': None,
+            'traceback': trace}
+
+
+class BatchRunner:
+    """
+    Fan manifest scenarios out over a process pool.
+    """
+
+    def __init__(self, base_config: Dict, output_dir='results/batch', n_workers: int = 1):
+        """
+        Initialize the runner.
+
+        Args:
+            base_config: Parsed config.yaml used as the base for every scenario
+            output_dir: Directory for the shared tables and reports
+            n_workers: Process pool size
+        """
+        self.base_config = base_config
+        self.output_dir = Path(output_dir)
+        self.n_workers = max(1, int(n_workers))
+
+    def run(self, manifest: Dict, verbose: bool = True) -> Dict:
+        """
+        Run every scenario in the manifest.
+
+        A site whose table cannot be built fails only the scenarios that
+        use it, and a worker that dies fails only the scenario it was
+        running. Scenario names must be unique, since they name the
+        checkpoint files and report rows.
+
+        Args:
+            manifest: Manifest from :func:`load_manifest`
+            verbose: Print one line per finished scenario
+
+        Returns:
+            Dictionary with the ``summary`` DataFrame, report paths,
+            wall time and throughput
+        """
+        start = time.perf_counter()
+        defaults = deep_merge(self.base_config, manifest.get('defaults'))
+
+        # Workers run their GA serially (parallelism is across scenarios)
+        # and checkpoint to their own file
+        jobs = []
+        for i, scenario in enumerate(manifest['scenarios']):
+            scenario = {'name': f"scenario_{i}", **scenario}
+            config = deep_merge(defaults, scenario.get('overrides'))
+            ml_config = config.setdefault('ml', {})
+            ml_config['n_workers'] = 1
+            ml_config['checkpoint_path'] = str(
+                self.output_dir / 'checkpoints' / f"{scenario['name']}.pkl")
+            jobs.append((scenario, config))
+        names = [scenario['name'] for scenario, _ in jobs]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate scenario names: {', '.join(map(str, duplicates))}")
+
+        rows: List[Dict] = []
+        tables: Dict = {}
+        runnable = []
+        for scenario, config in jobs:
+            try:
+                resolution = self._site_table(scenario.get('site'), manifest['sites'],
+                                              defaults, tables)
+            except Exception as e:
+                self._record(rows, _failed_row(scenario, e, traceback.format_exc()), verbose)
+                continue
+            runnable.append((scenario, config, resolution))
+
+        crashed = self._run_jobs(runnable, self.n_workers, rows, verbose)
+        # A dead worker breaks the pool and every unfinished future with it;
+        # rerun those scenarios one pool each so only the culprit fails
+        for job in crashed:
+            for scenario, _, _ in self._run_jobs([job], 1, rows, verbose):
+                self._record(rows, _failed_row(
+                    scenario, RuntimeError("worker process died")), verbose)
+
+        wall_time = time.perf_counter() - start
+        return self._write_reports(rows, names, wall_time)
+
+    def _run_jobs(self, jobs: List, n_workers: int, rows: List[Dict],
+                  verbose: bool) -> List:
+        """Run jobs on a fresh pool; return those lost to a broken pool."""
+        if not jobs:
+            return []
+        table_dir = str(self.output_dir / 'wind_tables')
+        broken = []
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            futures = {pool.submit(run_scenario, scenario, config, table_dir, resolution):
+                       (scenario, config, resolution)
+                       for scenario, config, resolution in jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    row = future.result()
+                except BrokenProcessPool:
+                    broken.append(job)
+                    continue
+                except Exception as e:
+                    row = _failed_row(job[0], e)
+                self._record(rows, row, verbose)
+        return broken
+
+    def _site_table(self, name, sites: Dict, config: Dict, tables: Dict) -> float:
+        """
+        Build a site's table once and store it as a memory-mapped array.
+
+        Outcomes are memoized in ``tables``, so a site that fails to build
+        is tried once and fails each of its scenarios with the same error.
+
+        Returns:
+            Speed bin width of the stored table (m/s)
+        """
+        if name not in tables:
+            try:
+                if name not in sites:
+                    raise ValueError(f"Unknown site: {name}")
+                cache_dir = config.get('paths', {}).get('cache')
+                table = build_site_table(sites[name], config, cache_dir)
+                MemmapArrayStore(self.output_dir / 'wind_tables',
+                                 dtype=np.int64).save(name, table.counts)
+                tables[name] = table.speed_resolution
+            except Exception as e:
+                tables[name] = e
+        if isinstance(tables[name], Exception):
+            raise tables[name]
+        return tables[name]
+
+    @staticmethod
+    def _record(rows: List[Dict], row: Dict, verbose: bool):
+        """Append a result row and optionally print it."""
+        rows.append(row)
+        if verbose:
+            mark = '✅' if row['status'] == 'ok' else '❌'
+            detail = (f"{row['best_aep_mwh']:.0f} MWh/yr in {row['runtime_s']:.1f} s"
+                      if row['status'] == 'ok' else row['error'])
+            print(f"   {mark} {row['name']}: {detail}")
+
+    def _write_reports(self, rows: List[Dict], order: List[str], wall_time: float) -> Dict:
+        """Write the summary table and per-job timing report."""
+        import pandas as pd  # deferred: workers never need pandas
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        summary = pd.DataFrame(rows)
+        summary['order'] = summary['name'].map({name: i for i, name in enumerate(order)})
+        summary = summary.sort_values('order').drop(columns=['order', 'traceback'],
+                                                     errors='ignore')
+        if 'pid' in summary:
+            summary['pid'] = summary['pid'].astype('Int64')  # stays integer next to gaps
+
+        summary_path = self.output_dir / 'batch_summary.csv'
+        timing_path = self.output_dir / 'batch_timing.json'
+        summary.to_csv(summary_path, index=False)
+
+        n_ok = int((summary['status'] == 'ok').sum())
+        jobs = summary[[c for c in ('name', 'status', 'pid', 'started_at', 'finished_at',
+                                    'runtime_s') if c in summary]]
+        # Unknown timings of failed scenarios are null, not the non-standard NaN
+        jobs = jobs.astype(object).where(jobs.notna(), None)
+        timing = {
+            'n_workers': self.n_workers,
+            'n_scenarios': len(rows),
+            'n_succeeded': n_ok,
+            'n_failed': len(rows) - n_ok,
+            'wall_time_s': wall_time,
+            'scenarios_per_hour': n_ok / wall_time * 3600.0 if wall_time > 0 else 0.0,
+            'jobs': jobs.to_dict('records'),
+        }
+        with open(timing_path, 'w') as f:
+            json.dump(timing, f, indent=2, allow_nan=False,
+                      default=lambda value: value.item() if hasattr(value, 'item') else str(value))
+
+        return {'summary': summary, 'summary_path': summary_path,
+                'timing_path': timing_path, **{k: v for k, v in timing.items() if k != 'jobs'}}
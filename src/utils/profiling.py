@@ -0,0 +1,306 @@
+"""
+Stage profiling for the AI Wind Farm Optimizer pipeline.
+
+:class:`StageProfiler` times named pipeline stages (wall and CPU time),
+tracks resident memory and, optionally, Python heap peaks via
+``tracemalloc`` and a cProfile dump per stage. The results go to a JSON
+timing report. When profiling is disabled, :meth:`StageProfiler.stage`
+returns a shared no-op context manager, so instrumented code costs one
+attribute lookup and call per stage.
+"""
+
+import cProfile
+import json
+import os
+import platform
+import re
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from pathlib import Path
+from typing import Dict, List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows has no getrusage
+    resource = None
+
+
+# Defaults mirroring the profiling section of config.yaml
+DEFAULT_PROFILING_CONFIG = {
+    'enabled': False,
+    'trace_memory': False,  # tracemalloc heap peaks; slows allocation-heavy stages
+    'cprofile': False,  # True for every top-level stage or a list of stage names
+    'output_dir': 'results/',
+}
+
+_DISABLED_STAGE = nullcontext()
+
+# tracemalloc.reset_peak() is new in Python 3.9
+_HAS_RESET_PEAK = hasattr(tracemalloc, 'reset_peak')
+
+
+def current_rss_mb() -> Optional[float]:
+    """Resident set size of this process in MB (None where unavailable)."""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / 2 ** 20
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process so far in MB (None where unavailable)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / 2 ** 20 if sys.platform == 'darwin' else peak / 2 ** 10
+
+
+class StageProfiler:
+    """
+    Wall time, CPU time and memory of named pipeline stages.
+
+    Stages nest; a stage opened inside another is recorded as
+    ``parent/child``. Each record holds ``wall_s``, ``cpu_s`` (process
+    time, so it includes every thread but not child processes), the RSS
+    after the stage and its change, the process peak RSS so far and,
+    with ``trace_memory``, the Python heap peak above the level at stage
+    entry. cProfile dumps are only taken for stages not nested inside
+    another profiled stage, since one interpreter runs one profiler.
+    """
+
+    def __init__(self, config: Optional[Dict] = None, enabled: Optional[bool] = None):
+        """
+        Initialize the profiler.
+
+        Args:
+            config: Profiling configuration (``profiling`` section of config.yaml)
+            enabled: Override of ``config['enabled']``
+        """
+        self.config = {**DEFAULT_PROFILING_CONFIG, **(config or {})}
+        if enabled is not None:
+            self.config['enabled'] = enabled
+        self.enabled = bool(self.config['enabled'])
+        self.records: List[Dict] = []
+        self.run_id = time.strftime('%Y%m%d_%H%M%S')
+        self._frames: List[Dict] = []
+        self._cprofile_active = False
+        self._started_tracing = False
+        self._heap_offset = 0
+
+    def stage(self, name: str):
+        """
+        Context manager measuring one stage.
+
+        Args:
+            name: Stage name
+
+        Returns:
+            Context manager (a no-op when profiling is disabled)
+        """
+        if not self.enabled:
+            return _DISABLED_STAGE
+        return self._measure(name)
+
+    def profile(self, name: Optional[str] = None):
+        """
+        Decorator measuring every call of a function as a stage.
+
+        Args:
+            name: Stage name (defaults to the function's qualified name)
+        """
+        def decorator(func):
+            label = name or func.__qualname__
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with self._measure(label):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def record(self, name: str, wall_s: float, cpu_s: Optional[float] = None, **extra):
+        """
+        Add a stage measured elsewhere (e.g. inside a worker process).
+
+        Args:
+            name: Stage name, nested under the currently open stage
+            wall_s: Wall time (s)
+            cpu_s: CPU time (s)
+            **extra: Additional fields for the record
+        """
+        if not self.enabled:
+            return
+        self.records.append({'stage': self._path(name), 'depth': len(self._frames),
+                             'wall_s': wall_s, 'cpu_s': cpu_s, **extra})
+
+    @contextmanager
+    def _measure(self, name: str):
+        """Measure the enclosed block and append its record."""
+        frame = {'path': self._path(name), 'depth': len(self._frames)}
+        cprofiler = self._start_cprofile(frame['path'])
+        if self.config['trace_memory']:
+            self._enter_tracing(frame)
+        self._frames.append(frame)
+        rss = current_rss_mb()
+        status = 'ok'
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        except BaseException:
+            status = 'error'
+            raise
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            self._frames.pop()
+            record = {'stage': frame['path'], 'depth': frame['depth'], 'status': status,
+                      'wall_s': wall, 'cpu_s': cpu}
+            end_rss = current_rss_mb()
+            if end_rss is not None and rss is not None:
+                record['rss_mb'] = end_rss
+                record['rss_delta_mb'] = end_rss - rss
+            record['peak_rss_mb'] = peak_rss_mb()
+            if 'heap_start' in frame:
+                record['heap_peak_mb'] = self._exit_tracing(frame)
+            if cprofiler is not None:
+                record['cprofile'] = self._dump_cprofile(cprofiler, frame['path'])
+            self.records.append(record)
+
+    def _path(self, name: str) -> str:
+        """Full stage name below the open stages."""
+        return '/'.join([frame['path'] for frame in self._frames[-1:]] + [name])
+
+    def _enter_tracing(self, frame: Dict):
+        """Start tracemalloc if needed and reset the peak for a new stage."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+            self._heap_offset = 0
+        current, peak = self._traced_memory()
+        if self._frames and 'heap_peak' in self._frames[-1]:
+            parent = self._frames[-1]
+            parent['heap_peak'] = max(parent['heap_peak'], peak)
+        if _HAS_RESET_PEAK:
+            tracemalloc.reset_peak()
+        else:
+            # Clearing the traces also resets the peak; blocks traced before
+            # are carried as an offset, and their frees go unseen, so peaks
+            # are upper bounds on Python 3.8
+            tracemalloc.clear_traces()
+            self._heap_offset = current
+        frame['heap_start'] = frame['heap_peak'] = current
+
+    def _traced_memory(self):
+        """Current and peak traced heap in bytes, including cleared traces."""
+        current, peak = tracemalloc.get_traced_memory()
+        return current + self._heap_offset, peak + self._heap_offset
+
+    def _exit_tracing(self, frame: Dict) -> float:
+        """Heap peak (MB) of a finished stage above its starting level."""
+        _, peak = self._traced_memory()
+        frame['heap_peak'] = max(frame['heap_peak'], peak)
+        if self._frames and 'heap_peak' in self._frames[-1]:
+            parent = self._frames[-1]
+            parent['heap_peak'] = max(parent['heap_peak'], frame['heap_peak'])
+        elif self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return (frame['heap_peak'] - frame['heap_start']) / 2 ** 20
+
+    def _start_cprofile(self, path: str) -> Optional[cProfile.Profile]:
+        """Start cProfile for a stage selected by the ``cprofile`` option."""
+        selected = self.config['cprofile']
+        if self._cprofile_active or not selected:
+            return None
+        if selected is True:
+            if self._frames:
+                return None
+        elif path not in selected and path.rsplit('/', 1)[-1] not in selected:
+            return None
+        cprofiler = cProfile.Profile()
+        cprofiler.enable()
+        self._cprofile_active = True
+        return cprofiler
+
+    def _dump_cprofile(self, cprofiler: cProfile.Profile, path: str) -> str:
+        """Stop a stage's cProfile and write its stats file."""
+        cprofiler.disable()
+        self._cprofile_active = False
+        directory = Path(self.config['output_dir']) / 'profiles'
+        directory.mkdir(parents=True, exist_ok=True)
+        filepath = directory / f"{self.run_id}_{re.sub(r'[^A-Za-z0-9_.-]+', '_', path)}.prof"
+        cprofiler.dump_stats(filepath)
+        return str(filepath)
+
+    def report(self) -> Dict:
+        """
+        Machine-readable timing report.
+
+        Returns:
+            Dictionary with run metadata, the total wall time of the
+            top-level stages, the process peak RSS and every stage record
+            in completion order
+        """
+        return {
+            'run_id': self.run_id,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'total_wall_s': sum(r['wall_s'] for r in self.records if r['depth'] == 0),
+            'peak_rss_mb': peak_rss_mb(),
+            'stages': self.records,
+        }
+
+    def save(self, directory=None, prefix: str = 'timing_report') -> Path:
+        """
+        Write the timing report as JSON.
+
+        Args:
+            directory: Output directory (defaults to ``output_dir``)
+            prefix: File name prefix; the run timestamp is appended
+
+        Returns:
+            Path of the written report
+        """
+        directory = Path(directory or self.config['output_dir'])
+        directory.mkdir(parents=True, exist_ok=True)
+        filepath = directory / f"{prefix}_{self.run_id}.json"
+        with open(filepath, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+        return filepath
+
+    def format_table(self) -> str:
+        """Human-readable stage table, nested stages indented under their parent."""
+        total = sum(r['wall_s'] for r in self.records if r['depth'] == 0) or 1.0
+        lines = [f"   {'Stage':<36} {'Wall s':>8} {'CPU s':>8} {'Share':>6} {'RSS MB':>8}"]
+        for record in self._start_order():
+            name = '  ' * record['depth'] + record['stage'].rsplit('/', 1)[-1]
+            cpu = record.get('cpu_s')
+            rss = record.get('rss_mb')
+            lines.append(f"   {name:<36} {record['wall_s']:8.3f} "
+                         f"{'' if cpu is None else f'{cpu:8.3f}':>8} "
+                         f"{record['wall_s'] / total:6.1%} "
+                         f"{'' if rss is None else f'{rss:8.1f}':>8}")
+        return '\n'.join(lines)
+
+    def _start_order(self) -> List[Dict]:
+        """Records ordered parent before children, siblings by completion."""
+        ordered: List[Dict] = []
+        pending: List[Dict] = []
+        for record in self.records:
+            # A record completes after its children, which are still pending
+            prefix = record['stage'] + '/'
+            group = [record] + [r for r in pending if r['stage'].startswith(prefix)]
+            pending = [r for r in pending if not r['stage'].startswith(prefix)]
+            if record['depth'] == 0:
+                ordered.extend(group)
+            else:
+                pending.extend(group)
+        return ordered + pending
@@ -0,0 +1,23 @@
+"""
+Visualization helpers for the AI Wind Farm Optimizer.
+
+Plotting libraries are imported inside the plotting functions, so
+importing this package stays cheap for headless jobs.
+"""
+
+from .decimation import decimate, lttb_indices, minmax_indices
+from .webgl_plots import create_decimated_wind_analysis, wind_rose_by_speed_class
+from .panels import FIGURES, build_figure, compute_panel_data
+from .render_pool import FigureRenderPool
+
+__all__ = [
+    'decimate',
+    'lttb_indices',
+    'minmax_indices',
+    'create_decimated_wind_analysis',
+    'wind_rose_by_speed_class',
+    'FIGURES',
+    'build_figure',
+    'compute_panel_data',
+    'FigureRenderPool',
+]
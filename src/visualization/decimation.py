@@ -0,0 +1,134 @@
+"""
+Point decimation for plotting long wind time series.
+
+A browser cannot usefully draw more points than it has horizontal pixels,
+so long series are reduced to a few thousand points before plotting.
+:func:`minmax_indices` keeps the extremes of every bucket (gusts and lulls
+survive), :func:`lttb_indices` implements Largest-Triangle-Three-Buckets,
+which keeps the visual shape, and :func:`decimate` chains the two
+(MinMaxLTTB): a cheap vectorized min/max pre-selection followed by LTTB on
+the much smaller candidate set.
+"""
+
+import numpy as np
+from typing import Tuple
+
+
+DECIMATION_METHODS = ('minmax', 'lttb', 'minmax_lttb')
+MINMAX_PRESELECT_RATIO = 4  # candidates per output point kept by the min/max pass
+
+
+def _as_float(x) -> np.ndarray:
+    """Numeric view of an x axis (datetime64 becomes int64 nanoseconds)."""
+    x = np.asarray(x)
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('datetime64[ns]').astype(np.int64)
+    return x.astype(float)
+
+
+def minmax_indices(y, n_out: int) -> np.ndarray:
+    """
+    Indices of the minimum and maximum of ``n_out // 2`` equal buckets.
+
+    Args:
+        y: Values to decimate, assumed ordered along x
+        n_out: Maximum number of indices to return
+
+    Returns:
+        Sorted indices including the first and last sample
+    """
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= n_out:
+        return np.arange(n)
+
+    n_buckets = max(1, (n_out - 2) // 2)
+    edges = np.linspace(1, n - 1, n_buckets + 1).astype(np.int64)
+    # Buckets differ in length by at most one sample: pad to a rectangle
+    # with NaN so argmin/argmax run as a single vectorized reduction
+    width = int(np.diff(edges).max())
+    offsets = edges[:-1, None] + np.arange(width)
+    valid = offsets < edges[1:, None]
+    block = np.where(valid, y[np.minimum(offsets, n - 1)], np.nan)
+
+    rows = np.arange(n_buckets)
+    lo = offsets[rows, np.nanargmin(block, axis=1)]
+    hi = offsets[rows, np.nanargmax(block, axis=1)]
+    return np.unique(np.concatenate([[0], lo, hi, [n - 1]]))
+
+
+def lttb_indices(x, y, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets selection.
+
+    The first and last points are always kept. For every bucket in
+    between, the point forming the largest triangle with the previously
+    selected point and the mean of the next bucket is kept.
+
+    Args:
+        x: Monotonic x values (numbers or datetime64)
+        y: Values to decimate
+        n_out: Number of indices to return (at least 3)
+
+    Returns:
+        Sorted indices into ``x``/``y``
+    """
+    x, y = _as_float(x), np.asarray(y, dtype=float)
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    # Mean point of each bucket, with the last sample as the final "bucket"
+    counts = np.diff(edges).astype(float)
+    mean_x = np.append(np.add.reduceat(x[:-1], edges[:-1])[:len(counts)] / counts, x[-1])
+    mean_y = np.append(np.add.reduceat(y[:-1], edges[:-1])[:len(counts)] / counts, y[-1])
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    previous = 0
+    for i in range(n_out - 2):
+        start, stop = edges[i], edges[i + 1]
+        ax, ay = x[previous], y[previous]
+        cx, cy = mean_x[i + 1], mean_y[i + 1]
+        # Twice the triangle area; the constant factor does not change argmax
+        area = np.abs((ax - cx) * (y[start:stop] - ay) - (ax - x[start:stop]) * (cy - ay))
+        previous = start + int(np.argmax(area))
+        selected[i + 1] = previous
+    return selected
+
+
+def decimate(x, y, max_points: int = 5000,
+             method: str = 'minmax_lttb') -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a series to at most ``max_points`` points for plotting.
+
+    Non-finite samples are dropped first.
+
+    Args:
+        x: Monotonic x values (numbers or datetime64)
+        y: Values to decimate
+        max_points: Maximum number of points to keep
+        method: 'minmax', 'lttb' or 'minmax_lttb'
+
+    Returns:
+        Tuple of decimated (x, y) arrays
+    """
+    if method not in DECIMATION_METHODS:
+        raise ValueError(f"Unknown decimation method: {method}")
+
+    x, y = np.asarray(x), np.asarray(y, dtype=float)
+    finite = np.isfinite(y)
+    if not finite.all():
+        x, y = x[finite], y[finite]
+    if len(y) <= max_points:
+        return x, y
+
+    if method == 'minmax':
+        idx = minmax_indices(y, max_points)
+    elif method == 'lttb':
+        idx = lttb_indices(x, y, max_points)
+    else:
+        idx = minmax_indices(y, MINMAX_PRESELECT_RATIO * max_points)
+        idx = idx[lttb_indices(x[idx], y[idx], max_points)]
+    return x[idx], y[idx]
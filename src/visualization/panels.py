@@ -0,0 +1,266 @@
+"""
+Static (matplotlib) figures drawn from pre-aggregated panel data.
+
+:func:`compute_panel_data` reduces the raw wind record and the
+optimization results once into small arrays (decimated time series,
+histograms, wind rose, layout, comparison, GA history, AEP exceedance).
+Every figure, including the summary dashboard, is drawn from that
+dictionary, so the dashboard reuses the panels of the individual figures
+instead of recomputing them, and the data shipped to render workers stays
+small.
+"""
+
+import warnings
+import numpy as np
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Dict, Optional
+
+from ..data.frequency_table import WindFrequencyTable
+from ..data.wind_stream import iter_wind_arrays
+from .decimation import decimate
+from .webgl_plots import wind_rose_by_speed_class
+
+
+def compute_panel_data(wind_speeds, wind_directions, turbine_positions=None,
+                       optimization_data: Optional[Dict] = None,
+                       wind_table: Optional[WindFrequencyTable] = None,
+                       max_points: int = 5000, direction_bins: int = 16,
+                       exceedance: Optional[Dict] = None) -> Dict:
+    """
+    Aggregate everything the static figures need.
+
+    Args:
+        wind_speeds: Wind speed samples (m/s)
+        wind_directions: Wind direction samples (degrees)
+        turbine_positions: Turbine positions of shape (N, 2) (m)
+        optimization_data: Output of ``GeneticLayoutOptimizer.to_optimization_data``
+        wind_table: Pre-built frequency table (built from the samples when omitted)
+        max_points: Maximum number of points in the time-series panel
+        direction_bins: Number of direction sectors when building the table
+        exceedance: Exceedance table from ``MonteCarloAEPAnalysis.run``
+
+    Returns:
+        Dictionary of panel arrays, cheap to pickle
+    """
+    wind_speeds = np.asarray(wind_speeds, dtype=float)
+    if wind_table is None:
+        wind_table = WindFrequencyTable.from_chunks(
+            iter_wind_arrays(wind_speeds, wind_directions), direction_bins=direction_bins)
+
+    # Speed histogram on a 0.5 m/s grid, trimmed to the occupied range
+    table_summary = wind_table.summary()
+    histogram = wind_table.to_wind_rose(speed_bin_width=0.5)
+    speed_frequencies = histogram['frequencies'].sum(axis=0)
+
+    time_x, time_y = decimate(np.arange(len(wind_speeds)), wind_speeds, max_points=max_points)
+    panels = {
+        'n_samples': len(wind_speeds),
+        'time_series': {'x': time_x, 'y': time_y},
+        'speed_distribution': {
+            'centres': histogram['speeds'],
+            'width': histogram['speeds'][1] - histogram['speeds'][0]
+            if len(histogram['speeds']) > 1 else 0.5,
+            'frequencies': speed_frequencies,
+            'weibull': table_summary['weibull_parameters'],
+            'mean': table_summary['wind_speed_analysis']['mean'],
+        },
+        'direction_distribution': {
+            'directions': wind_table.directions,
+            'frequencies': wind_table.sector_frequencies(),
+        },
+        'wind_rose': wind_rose_by_speed_class(wind_table),
+    }
+
+    if turbine_positions is not None:
+        panels['layout'] = np.asarray(turbine_positions, dtype=float)
+    if optimization_data is not None:
+        panels['comparison'] = optimization_data.get('comparison')
+        panels['history'] = optimization_data.get('history')
+    if exceedance is not None:
+        panels['exceedance'] = exceedance
+    return panels
+
+
+def draw_time_series(ax, panels: Dict, config: Dict):
+    """Decimated wind speed time series."""
+    series = panels['time_series']
+    ax.plot(series['x'], series['y'], lw=0.6, color=config.get('colors', {}).get('primary'))
+    ax.set_xlabel('Sample')
+    ax.set_ylabel('Wind Speed (m/s)')
+    ax.set_title(f"Wind Speed ({len(series['y']):,} of {panels['n_samples']:,} samples)")
+
+
+def draw_speed_distribution(ax, panels: Dict, config: Dict):
+    """Speed histogram with the fitted Weibull density."""
+    dist = panels['speed_distribution']
+    ax.bar(dist['centres'], dist['frequencies'] / dist['width'], width=dist['width'],
+           alpha=0.7, color=config.get('colors', {}).get('primary'), label='Observed')
+
+    k, c = dist['weibull']['k'], dist['weibull']['c']
+    if np.isfinite(k) and np.isfinite(c):
+        u = np.linspace(0.0, dist['centres'][-1] + dist['width'], 200)
+        pdf = (k / c) * (u / c) ** (k - 1) * np.exp(-(u / c) ** k)
+        ax.plot(u, pdf, color=config.get('colors', {}).get('warning'),
+                label=f"Weibull k={k:.2f}, c={c:.2f}")
+    ax.axvline(dist['mean'], ls='--', color='gray', label=f"Mean {dist['mean']:.2f} m/s")
+    ax.set_xlabel('Wind Speed (m/s)')
+    ax.set_ylabel('Probability Density')
+    ax.set_title('Wind Speed Distribution')
+    ax.legend(fontsize='small')
+
+
+def draw_direction_distribution(ax, panels: Dict, config: Dict):
+    """Frequency of each direction sector."""
+    dist = panels['direction_distribution']
+    width = 360.0 / len(dist['directions'])
+    ax.bar(dist['directions'], dist['frequencies'] * 100.0, width=width * 0.9,
+           color=config.get('colors', {}).get('secondary'))
+    ax.set_xlabel('Wind Direction (°)')
+    ax.set_ylabel('Frequency (%)')
+    ax.set_title('Wind Direction Distribution')
+
+
+def draw_wind_rose(ax, panels: Dict, config: Dict):
+    """Stacked wind rose by speed class (``ax`` must be polar)."""
+    rose = panels['wind_rose']
+    theta = np.radians(rose['directions'])
+    width = 2 * np.pi / len(theta)
+    bottom = np.zeros(len(theta))
+    for label, frequencies in zip(rose['labels'], rose['frequencies']):
+        ax.bar(theta, frequencies, width=width * 0.95, bottom=bottom, label=label)
+        bottom += frequencies
+    ax.set_theta_zero_location('N')
+    ax.set_theta_direction(-1)
+    ax.set_title('Wind Rose (%)')
+    ax.legend(fontsize='x-small', loc='upper left', bbox_to_anchor=(1.05, 1.0))
+
+
+def draw_layout(ax, panels: Dict, config: Dict):
+    """Turbine positions."""
+    positions = panels['layout']
+    ax.scatter(positions[:, 0], positions[:, 1], s=60, marker='^',
+               color=config.get('colors', {}).get('success'), edgecolor='black')
+    for i, (x, y) in enumerate(positions):
+        ax.annotate(str(i + 1), (x, y), textcoords='offset points', xytext=(4, 4),
+                    fontsize='x-small')
+    ax.set_aspect('equal')
+    ax.set_xlabel('X Position (m)')
+    ax.set_ylabel('Y Position (m)')
+    ax.set_title(f"Turbine Layout ({len(positions)} turbines)")
+
+
+def draw_comparison(ax, panels: Dict, config: Dict):
+    """Farm power output of each layout method."""
+    comparison = panels['comparison']
+    bars = ax.bar(comparison['methods'], comparison['power_outputs'],
+                  color=config.get('colors', {}).get('info'))
+    for bar, efficiency in zip(bars, comparison.get('efficiencies', [])):
+        ax.annotate(f"{efficiency:.1%}", (bar.get_x() + bar.get_width() / 2, bar.get_height()),
+                    ha='center', va='bottom', fontsize='small')
+    ax.set_ylabel('Mean Power Output (MW)')
+    ax.set_title('Performance Comparison')
+    ax.tick_params(axis='x', labelrotation=15)
+
+
+def draw_history(ax, panels: Dict, config: Dict):
+    """Best and mean GA fitness per generation."""
+    history = panels['history']
+    generations = np.asarray(history['generation'])
+    mean = np.asarray(history['mean_fitness'])
+    std = np.asarray(history['std_fitness'])
+    ax.plot(generations, history['best_fitness'], label='Best',
+            color=config.get('colors', {}).get('success'))
+    ax.plot(generations, mean, label='Mean', color=config.get('colors', {}).get('primary'))
+    ax.fill_between(generations, mean - std, mean + std, alpha=0.2,
+                    color=config.get('colors', {}).get('primary'))
+    ax.set_xlabel('Generation')
+    ax.set_ylabel('Fitness (MWh/yr)')
+    ax.set_title('Optimization Progress')
+    ax.legend(fontsize='small')
+
+
+def draw_exceedance(ax, panels: Dict, config: Dict):
+    """AEP exceedance curve with the P50/P90 style levels marked."""
+    table = panels['exceedance']
+    colors = config.get('colors', {})
+    curve = table['curve']
+    ax.plot(curve['exceedance'], curve['aep_mwh'], color=colors.get('primary'))
+    ax.scatter(table['levels'], table['aep_mwh'], zorder=3, color=colors.get('warning'))
+    for label, level, aep in zip(table['labels'], table['levels'], table['aep_mwh']):
+        ax.annotate(f"{label}\n{aep:,.0f}", (level, aep), textcoords='offset points',
+                    xytext=(4, 4), fontsize='small')
+    if 'nominal_aep_mwh' in table:
+        ax.axhline(table['nominal_aep_mwh'], ls='--', color='gray', label='Deterministic')
+        ax.legend(fontsize='small')
+    ax.set_xlabel('Probability of Exceedance (%)')
+    ax.set_ylabel('AEP (MWh/yr)')
+    ax.set_title('AEP Exceedance')
+
+
+# Figure name -> grid shape and panels (drawer, polar axes?) in row-major order
+FIGURES = {
+    'wind_data_analysis': ((2, 2), [(draw_time_series, False), (draw_speed_distribution, False),
+                                    (draw_direction_distribution, False),
+                                    (draw_wind_rose, True)]),
+    'turbine_layout': ((1, 1), [(draw_layout, False)]),
+    'performance_comparison': ((1, 1), [(draw_comparison, False)]),
+    'wind_rose': ((1, 1), [(draw_wind_rose, True)]),
+    'optimization_results': ((1, 2), [(draw_history, False), (draw_comparison, False)]),
+    'aep_exceedance': ((1, 1), [(draw_exceedance, False)]),
+    'dashboard': ((2, 3), [(draw_time_series, False), (draw_speed_distribution, False),
+                           (draw_wind_rose, True), (draw_layout, False),
+                           (draw_comparison, False), (draw_history, False)]),
+}
+
+
+def build_figure(name: str, panels: Dict, config: Optional[Dict] = None, title: str = None):
+    """
+    Draw one of :data:`FIGURES` from panel data.
+
+    Args:
+        name: Figure name
+        panels: Output of :func:`compute_panel_data`
+        config: Visualization config (``figure_size``, ``colors``, ``style``)
+        title: Optional figure title
+
+    Returns:
+        Matplotlib figure
+    """
+    import matplotlib.pyplot as plt
+
+    if name not in FIGURES:
+        raise ValueError(f"Unknown figure: {name}")
+    config = config or {}
+    (rows, cols), layout = FIGURES[name]
+    width, height = config.get('figure_size', [12, 8])
+
+    with _style_context(config.get('style')):
+        fig = plt.figure(figsize=(width * max(1.0, cols / 2), height * max(1.0, rows / 2)))
+        for i, (draw, polar) in enumerate(layout):
+            ax = fig.add_subplot(rows, cols, i + 1, projection='polar' if polar else None)
+            draw(ax, panels, config)
+
+        if title:
+            fig.suptitle(title, fontsize='x-large')
+        fig.tight_layout()
+    return fig
+
+
+def _style_context(style: Optional[str]):
+    """
+    Matplotlib style context for the configured ``style``.
+
+    Style names differ between matplotlib releases (``seaborn-v0_8`` is
+    ``seaborn`` before 3.6), so an unavailable style warns and leaves the
+    defaults in place instead of failing the figure.
+    """
+    import matplotlib.pyplot as plt
+
+    if not style:
+        return nullcontext()
+    if style not in plt.style.available and not Path(style).is_file():
+        warnings.warn(f"Unknown matplotlib style: {style}; using the defaults",
+                      RuntimeWarning, stacklevel=3)
+        return nullcontext()
+    return plt.style.context(style)
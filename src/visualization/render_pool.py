@@ -0,0 +1,213 @@
+"""
+Parallel, non-blocking figure rendering and export.
+
+Rasterizing and PNG-encoding figures at print DPI dominates the demo's
+wall clock and is independent per figure. :class:`FigureRenderPool`
+renders figures in worker processes on the Agg backend. Figures can be
+submitted either as a :func:`~.panels.build_figure` job (only the small
+panel data is pickled) or, for figures already built in the parent,
+through :meth:`FigureRenderPool.save_async`, which pickles the figure and
+lets a worker do the drawing and encoding while the parent carries on.
+"""
+
+import os
+import pickle
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .panels import build_figure
+
+
+def _init_render_worker():
+    """Select the non-interactive backend in each worker."""
+    import matplotlib
+    matplotlib.use('Agg')
+
+
+def _save_figure(fig, filepath, dpi: int) -> str:
+    """Write a figure to disk and release it."""
+    import matplotlib.pyplot as plt
+
+    filepath = Path(filepath)
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(filepath, dpi=dpi, bbox_inches='tight')
+    plt.close(fig)
+    return str(filepath)
+
+
+def _timed_call(func, args, kwargs):
+    """Run a job, returning its result with the wall and CPU time it took."""
+    wall, cpu = time.perf_counter(), time.process_time()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - wall, time.process_time() - cpu
+
+
+def render_figure(name: str, panels: Dict, config: Dict, filepath, title: str = None) -> str:
+    """Build one panel figure and save it (runs inside a worker)."""
+    fig = build_figure(name, panels, config, title=title)
+    return _save_figure(fig, filepath, config.get('dpi', 300))
+
+
+def save_pickled_figure(payload: bytes, filepath, dpi: int) -> str:
+    """Unpickle a figure built elsewhere and save it (runs inside a worker)."""
+    return _save_figure(pickle.loads(payload), filepath, dpi)
+
+
+class FigureRenderPool:
+    """
+    Process pool that renders and saves figures in the background.
+
+    With ``n_workers=0`` every job runs synchronously in the calling
+    process, which keeps the same interface for debugging and for
+    single-core machines. With ``timed=True`` the wall and CPU time each
+    figure took inside its worker is collected in :attr:`timings`.
+    """
+
+    def __init__(self, config: Optional[Dict] = None, n_workers: Optional[int] = None,
+                 timed: bool = False):
+        """
+        Initialize the pool.
+
+        Args:
+            config: Visualization config (``dpi``, ``figure_size``, ``colors``,
+                ``style``)
+            n_workers: Worker processes (defaults to ``min(4, cpu_count)``;
+                0 renders in-process)
+            timed: Measure each figure job (see :attr:`timings`)
+        """
+        self.config = config or {}
+        self.timed = timed
+        self.timings: Dict[str, Dict[str, float]] = {}
+        self.dpi = self.config.get('dpi', 300)
+        if n_workers is None:
+            n_workers = min(4, os.cpu_count() or 1)
+        self.n_workers = max(0, int(n_workers))
+        self._executor = (ProcessPoolExecutor(max_workers=self.n_workers,
+                                              initializer=_init_render_worker)
+                          if self.n_workers > 0 else None)
+        self._futures: List[Future] = []
+        # Executor futures, which timed jobs wrap, so they can be cancelled
+        self._pending: List[Future] = []
+
+    def submit(self, func, *args, **kwargs) -> Future:
+        """Run a picklable top-level function in the pool and track its future."""
+        return self._submit(func, args, kwargs)
+
+    def _submit(self, func, args, kwargs, label: Optional[str] = None) -> Future:
+        """Queue a job, timing it under ``label`` when the pool is timed."""
+        if label is not None and self.timed:
+            future = self._timed_future(self._start(_timed_call, (func, args, kwargs), {}), label)
+        else:
+            future = self._start(func, args, kwargs)
+        self._futures.append(future)
+        return future
+
+    def _start(self, func, args, kwargs) -> Future:
+        """Start a job in a worker, or run it now without workers."""
+        if self._executor is not None:
+            future = self._executor.submit(func, *args, **kwargs)
+            self._pending.append(future)
+        else:
+            future = Future()
+            try:
+                future.set_result(func(*args, **kwargs))
+            except Exception as e:
+                future.set_exception(e)
+        return future
+
+    def _timed_future(self, timed: Future, label: str) -> Future:
+        """Future of a timed job's result that records its timing on completion."""
+        future = Future()
+
+        def unpack(done: Future):
+            try:
+                result, wall, cpu = done.result()
+            except BaseException as e:
+                future.set_exception(e)
+                return
+            self.timings[label] = {'wall_s': wall, 'cpu_s': cpu}
+            future.set_result(result)
+
+        timed.add_done_callback(unpack)
+        return future
+
+    def render(self, name: str, panels: Dict, filepath, title: str = None) -> Future:
+        """
+        Queue a panel figure (see :data:`~.panels.FIGURES`).
+
+        Args:
+            name: Figure name
+            panels: Output of :func:`~.panels.compute_panel_data`
+            filepath: Output image path
+            title: Optional figure title
+
+        Returns:
+            Future resolving to the saved path
+        """
+        return self._submit(render_figure, (name, panels, self.config, filepath, title), {},
+                            label=name)
+
+    def save_async(self, fig, filepath, dpi: Optional[int] = None) -> Future:
+        """
+        Queue an already built matplotlib figure for drawing and encoding.
+
+        The figure is pickled and closed in the calling process, so it must
+        not be modified afterwards.
+
+        Args:
+            fig: Matplotlib figure
+            filepath: Output image path
+            dpi: Resolution override (defaults to the config ``dpi``)
+
+        Returns:
+            Future resolving to the saved path
+        """
+        import matplotlib.pyplot as plt
+
+        dpi = dpi or self.dpi
+        label = Path(filepath).stem
+        if self._executor is None:
+            return self._submit(_save_figure, (fig, filepath, dpi), {}, label=label)
+        payload = pickle.dumps(fig)
+        plt.close(fig)
+        return self._submit(save_pickled_figure, (payload, filepath, dpi), {}, label=label)
+
+    def wait(self) -> List[str]:
+        """
+        Block until every queued job has finished.
+
+        Returns:
+            Saved paths in submission order
+
+        Raises:
+            The first job exception, after all jobs have finished
+        """
+        futures, self._futures = self._futures, []
+        self._pending = []
+        wait(futures)
+        return [future.result() for future in futures]
+
+    def close(self):
+        """Wait for outstanding jobs and shut the workers down."""
+        try:
+            self.wait()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def __enter__(self) -> 'FigureRenderPool':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        elif self._executor is not None:
+            # Drop queued jobs (shutdown(cancel_futures=True) needs Python 3.9)
+            for future in self._pending:
+                future.cancel()
+            self._pending = []
+            self._executor.shutdown()
+            self._executor = None
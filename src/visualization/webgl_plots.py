@@ -0,0 +1,123 @@
+"""
+Size-bounded interactive wind analysis for long records.
+
+Instead of writing every sample into the HTML, the time-series panel is
+decimated (:mod:`.decimation`) and drawn with WebGL (``Scattergl``), while
+the wind rose and speed histogram are pre-aggregated from a
+:class:`~src.data.frequency_table.WindFrequencyTable`. The figure size is
+therefore set by ``max_points`` and the binning, not by the record length.
+Plotly is imported on first use.
+"""
+
+import numpy as np
+from typing import Dict, Optional, Sequence
+
+from ..data.frequency_table import WindFrequencyTable
+from ..data.wind_stream import iter_wind_arrays
+from .decimation import decimate
+
+
+DEFAULT_SPEED_CLASSES = (0.0, 3.0, 6.0, 9.0, 12.0, 15.0)
+
+
+def wind_rose_by_speed_class(table: WindFrequencyTable,
+                             speed_classes: Sequence[float] = DEFAULT_SPEED_CLASSES) -> Dict:
+    """
+    Aggregate a frequency table into per-sector frequencies by speed class.
+
+    Args:
+        table: Joint direction x speed frequency table
+        speed_classes: Lower edges of the speed classes (m/s); the last
+            class is open-ended
+
+    Returns:
+        Dictionary with ``directions``, class ``labels`` and ``frequencies``
+        of shape (n_classes, direction_bins) in percent
+    """
+    edges = np.asarray(speed_classes, dtype=float)
+    class_idx = np.clip(np.searchsorted(edges, table.speed_centres, side='right') - 1,
+                        0, len(edges) - 1)
+    membership = class_idx[:, None] == np.arange(len(edges))
+    frequencies = (table.frequencies @ membership).T * 100.0
+
+    labels = [f"{lo:g}-{hi:g} m/s" for lo, hi in zip(edges[:-1], edges[1:])]
+    labels.append(f">{edges[-1]:g} m/s")
+    return {'directions': table.directions, 'labels': labels, 'frequencies': frequencies}
+
+
+def create_decimated_wind_analysis(wind_speeds, wind_directions, timestamps=None,
+                                   wind_table: Optional[WindFrequencyTable] = None,
+                                   max_points: int = 5000, method: str = 'minmax_lttb',
+                                   direction_bins: int = 16,
+                                   config: Optional[Dict] = None,
+                                   title: str = "Interactive Wind Analysis"):
+    """
+    Build an interactive wind analysis figure whose size does not grow with the record.
+
+    Args:
+        wind_speeds: Wind speed samples (m/s)
+        wind_directions: Wind direction samples (degrees)
+        timestamps: Optional sample times (defaults to the sample index)
+        wind_table: Pre-built frequency table for the aggregated panels;
+            built from the samples when omitted
+        max_points: Maximum number of points in the time-series trace
+        method: Decimation method, see :func:`~.decimation.decimate`
+        direction_bins: Number of direction sectors when building the table
+        config: Visualization config (uses the ``plotly`` section)
+        title: Figure title
+
+    Returns:
+        Plotly figure
+    """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    plotly_config = (config or {}).get('plotly', {})
+    colors = (config or {}).get('colors', {})
+    wind_speeds = np.asarray(wind_speeds, dtype=float)
+    if timestamps is None:
+        timestamps = np.arange(len(wind_speeds))
+    if wind_table is None:
+        wind_table = WindFrequencyTable.from_chunks(
+            iter_wind_arrays(wind_speeds, wind_directions), direction_bins=direction_bins)
+
+    fig = make_subplots(
+        rows=2, cols=2,
+        specs=[[{'colspan': 2}, None], [{}, {'type': 'polar'}]],
+        subplot_titles=(f"Wind Speed ({min(max_points, len(wind_speeds)):,} of "
+                        f"{len(wind_speeds):,} samples shown)",
+                        "Wind Speed Distribution", "Wind Rose"),
+        vertical_spacing=0.12,
+    )
+
+    x, y = decimate(timestamps, wind_speeds, max_points=max_points, method=method)
+    fig.add_trace(go.Scattergl(x=x, y=y, mode='lines', name='Wind speed',
+                               line=dict(width=1, color=colors.get('primary', '#1f77b4'))),
+                  row=1, col=1)
+
+    histogram = wind_table.speed_histogram()
+    occupied = np.flatnonzero(histogram)
+    n_keep = occupied[-1] + 1 if occupied.size else 1
+    fig.add_trace(go.Bar(x=wind_table.speed_centres[:n_keep],
+                         y=histogram[:n_keep] / max(wind_table.n_samples, 1) * 100.0,
+                         width=wind_table.speed_resolution, name='Speed distribution',
+                         marker_color=colors.get('secondary', '#ff7f0e'), showlegend=False),
+                  row=2, col=1)
+
+    rose = wind_rose_by_speed_class(wind_table)
+    for label, frequencies in zip(rose['labels'], rose['frequencies']):
+        fig.add_trace(go.Barpolar(r=frequencies, theta=rose['directions'], name=label),
+                      row=2, col=2)
+
+    fig.update_xaxes(title_text='Time', row=1, col=1)
+    fig.update_yaxes(title_text='Wind Speed (m/s)', row=1, col=1)
+    fig.update_xaxes(title_text='Wind Speed (m/s)', row=2, col=1)
+    fig.update_yaxes(title_text='Frequency (%)', row=2, col=1)
+    fig.update_layout(
+        title=title,
+        template=plotly_config.get('template', 'plotly_white'),
+        showlegend=plotly_config.get('show_legend', True),
+        height=plotly_config.get('height', 600) * 1.5,
+        polar=dict(angularaxis=dict(direction='clockwise', rotation=90)),
+    )
+    return fig
@@ -12,6 +12,24 @@ from pathlib import Path
 # Add src to path
 sys.path.append(str(Path(__file__).parent / 'src'))
 
+def seeded_wind_rose(seed=42, n_samples=2000, direction_std=40.0, direction_bins=16):
+    """
+    Binned wind rose of a seeded Weibull (k=2, c=8 m/s) wind record.
+    
+    Directions scatter normally around 270 degrees by ``direction_std``,
+    or uniformly when it is None.
+    """
+    import numpy as np
+    from src.models.power_calculations import bin_wind_rose
+    
+    rng = np.random.default_rng(seed)
+    speeds = 8.0 * rng.weibull(2.0, n_samples)
+    if direction_std is None:
+        directions = rng.uniform(0, 360, n_samples)
+    else:
+        directions = rng.normal(270, direction_std, n_samples)
+    return bin_wind_rose(speeds, directions, direction_bins=direction_bins)
+
 def test_imports():
     """Test that all modules can be imported."""
     print("🧪 Testing imports...")
@@ -81,6 +99,1195 @@ def test_visualization():
         print(f"❌ Visualization error: {e}")
         return False
 
+def test_wake_model():
+    """Test the batched Jensen wake/AEP engine against single-layout evaluation."""
+    print("\n🌬️  Testing wake model...")
+    
+    try:
+        import numpy as np
+        from src.models.wake_models import JensenWakeModel
+        
+        wind_rose = seeded_wind_rose(direction_std=None)
+        rng = np.random.default_rng(42)
+        layouts = rng.uniform(0, 2000, size=(5, 12, 2))
+        
+        model = JensenWakeModel()
+        batched = model.calculate_aep(layouts, wind_rose)
+        looped = np.array([model.calculate_aep(layout, wind_rose) for layout in layouts])
+        
+        # Two turbines in a row: downstream deficit follows the Jensen formula
+        pair = np.array([[[0.0, 0.0], [500.0, 0.0]]])
+        deficit = model.wake_deficits(pair, [270.0])[0, 0, 1]
+        expected = model.initial_deficit * (45.0 / (45.0 + 0.075 * 500.0)) ** 2
+        
+        if not np.allclose(batched, looped) or not np.isclose(deficit, expected):
+            print("❌ Wake model results inconsistent")
+            return False
+        if np.any(batched > model.ideal_aep(12, wind_rose)):
+            print("❌ Waked AEP exceeds ideal AEP")
+            return False
+        
+        print(f"✅ Batched AEP matches per-layout evaluation ({batched.mean():.0f} MWh/yr)")
+        return True
+    except Exception as e:
+        print(f"❌ Wake model error: {e}")
+        return False
+
+def test_spatial_index():
+    """Test neighbour-index pruning against the exact all-pairs path."""
+    print("\n🗺️  Testing spatial index...")
+    
+    try:
+        import numpy as np
+        from src.models.spatial_index import NeighbourIndex
+        from src.models.wake_models import JensenWakeModel
+        
+        wind_rose = seeded_wind_rose(seed=7, direction_std=None)
+        rng = np.random.default_rng(7)
+        layout = rng.uniform(0, 6000, size=(200, 2))
+        
+        model = JensenWakeModel()
+        exact = model.calculate_aep(layout, wind_rose, method='exact')
+        pruned = model.calculate_aep(layout, wind_rose, method='pruned')
+        
+        distances = np.linalg.norm(layout[:, None] - layout[None], axis=-1)
+        brute_pairs = np.argwhere(np.triu(distances < 300, k=1))
+        index_pairs = NeighbourIndex(layout).close_pairs(300)
+        
+        if abs(pruned - exact) / exact > 1e-3:
+            print(f"❌ Pruned AEP differs from exact: {pruned:.1f} vs {exact:.1f}")
+            return False
+        if sorted(map(tuple, brute_pairs)) != sorted(map(tuple, index_pairs)):
+            print("❌ Spacing pairs differ from brute force")
+            return False
+        
+        print(f"✅ Pruned AEP within {abs(pruned - exact) / exact:.1e} of exact, "
+              f"{len(index_pairs)} spacing violations found")
+        return True
+    except Exception as e:
+        print(f"❌ Spatial index error: {e}")
+        return False
+
+def test_genetic_optimizer():
+    """Test that the GA improves fitness and parallel runs match serial runs."""
+    print("\n🧬 Testing genetic optimizer...")
+    
+    try:
+        import numpy as np
+        from src.models.optimizer import GeneticLayoutOptimizer
+        
+        wind_rose = seeded_wind_rose()
+        ml_config = {'population_size': 20, 'generations': 8, 'random_state': 42}
+        
+        serial = GeneticLayoutOptimizer(ml_config=ml_config).optimize(wind_rose, n_turbines=10)
+        parallel = GeneticLayoutOptimizer(
+            ml_config={**ml_config, 'n_workers': 2}).optimize(wind_rose, n_turbines=10)
+        
+        history = serial['history']
+        if history['best_fitness'][-1] < history['best_fitness'][0]:
+            print("❌ Best fitness decreased over generations")
+            return False
+        if not np.array_equal(serial['best_positions'], parallel['best_positions']):
+            print("❌ Parallel run differs from serial run")
+            return False
+        
+        print(f"✅ GA improved best fitness {history['best_fitness'][0]:.0f} -> "
+              f"{history['best_fitness'][-1]:.0f} MWh/yr, parallel matches serial")
+        return True
+    except Exception as e:
+        print(f"❌ Genetic optimizer error: {e}")
+        return False
+
+def test_checkpoint_resume():
+    """Test that a resumed GA run matches an uninterrupted one."""
+    print("\n💾 Testing checkpoint/resume...")
+    
+    try:
+        import tempfile
+        import numpy as np
+        from src.models.optimizer import GeneticLayoutOptimizer
+        
+        wind_rose = seeded_wind_rose()
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            ml_config = {'population_size': 20, 'generations': 10, 'checkpoint_interval': 3,
+                         'checkpoint_path': str(Path(tmp_dir) / 'ga.pkl')}
+            full = GeneticLayoutOptimizer(ml_config=ml_config).optimize(
+                wind_rose, n_turbines=10)
+            
+            # Simulate a job killed after generation 6, then resumed
+            Path(ml_config['checkpoint_path']).unlink()
+            GeneticLayoutOptimizer(ml_config=ml_config).optimize(
+                wind_rose, n_turbines=10, generations=6)
+            resumed = GeneticLayoutOptimizer(ml_config=ml_config).optimize(
+                wind_rose, n_turbines=10, resume=True)
+            
+            # A changed config or wind rose must not reuse the checkpoint
+            stale = []
+            for change, changed_config, changed_rose in (
+                    ('config', {**ml_config, 'population_size': 30}, wind_rose),
+                    ('wind rose', ml_config,
+                     {**wind_rose, 'frequencies': wind_rose['frequencies'][::-1]})):
+                try:
+                    GeneticLayoutOptimizer(ml_config=changed_config).optimize(
+                        changed_rose, n_turbines=10, resume=True)
+                    stale.append(change)
+                except ValueError:
+                    pass
+        
+        if stale:
+            print(f"❌ Checkpoint resumed after a change of the {' and '.join(stale)}")
+            return False
+        if resumed['history'] != full['history']:
+            print("❌ Resumed run history differs from uninterrupted run")
+            return False
+        if not np.array_equal(resumed['best_positions'], full['best_positions']):
+            print("❌ Resumed run best layout differs from uninterrupted run")
+            return False
+        
+        print(f"✅ Resumed run matches uninterrupted run "
+              f"(cache hit rate {full['cache']['hit_rate']:.1%})")
+        return True
+    except Exception as e:
+        print(f"❌ Checkpoint/resume error: {e}")
+        return False
+
+def test_streaming_wind_stats():
+    """Test that chunked, merged wind statistics match a single pass."""
+    print("\n🌊 Testing streaming wind statistics...")
+    
+    try:
+        import numpy as np
+        from src.data.wind_stream import (StreamingWindStats, generate_time_series_chunks,
+                                          iter_wind_arrays)
+        
+        speeds, directions = next(generate_time_series_chunks(50000, 50000, random_state=42))
+        
+        whole = StreamingWindStats().update(speeds, directions)
+        left, right = StreamingWindStats(), StreamingWindStats()
+        for i, (chunk_speeds, chunk_directions) in enumerate(
+                iter_wind_arrays(speeds, directions, chunk_size=7000)):
+            (left if i % 2 else right).update(chunk_speeds, chunk_directions)
+        merged = left.merge(right).summary()
+        
+        if not np.isclose(merged['wind_speed_analysis']['mean'], speeds.mean()):
+            print("❌ Streaming mean differs from numpy")
+            return False
+        if not np.isclose(merged['wind_speed_analysis']['std'], speeds.std()):
+            print("❌ Streaming std differs from numpy")
+            return False
+        if merged['weibull_parameters'] != whole.summary()['weibull_parameters']:
+            print("❌ Merged Weibull fit differs from single pass")
+            return False
+        if abs(merged['weibull_parameters']['k'] - 2.0) > 0.05:
+            print("❌ Weibull shape fit is off")
+            return False
+        
+        # Constant (single-bin) and near-constant records still get a finite fit
+        from src.data.frequency_table import WindFrequencyTable
+        from src.data.wind_stream import summarize_wind_stream
+        for calm in (np.full(1000, 7.3), 7.3 + np.random.default_rng(0).normal(0, 0.05, 1000)):
+            fits = [summarize_wind_stream(iter_wind_arrays(calm, directions[:1000]))
+                    ['weibull_parameters'],
+                    WindFrequencyTable.from_chunks([(calm, directions[:1000])])
+                    .summary()['weibull_parameters']]
+            if not all(np.isfinite(fit['k']) and abs(fit['c'] - 7.3) < 0.1 for fit in fits):
+                print(f"❌ Near-constant record fit is degenerate: {fits}")
+                return False
+        
+        print(f"✅ Merged chunk statistics match single pass "
+              f"(k={merged['weibull_parameters']['k']:.3f})")
+        return True
+    except Exception as e:
+        print(f"❌ Streaming statistics error: {e}")
+        return False
+
+def test_frequency_table():
+    """Test the cached joint frequency table against raw-sample statistics."""
+    print("\n🧮 Testing frequency table cache...")
+    
+    try:
+        import tempfile
+        import numpy as np
+        from src.data.frequency_table import load_or_build_frequency_table
+        from src.data.wind_stream import generate_time_series_chunks, summarize_wind_stream
+        
+        speeds, directions = next(generate_time_series_chunks(50000, 50000, random_state=42))
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            built = load_or_build_frequency_table((speeds, directions), cache_dir=tmp_dir)
+            cached = load_or_build_frequency_table((speeds, directions), cache_dir=tmp_dir)
+            n_files = len(list(Path(tmp_dir).glob('*.npz')))
+        
+        table_summary = cached.summary()
+        raw_summary = summarize_wind_stream([(speeds, directions)])
+        wind_rose = cached.to_wind_rose()
+        
+        if n_files != 1 or not np.array_equal(built.counts, cached.counts):
+            print("❌ Cached table differs from built table")
+            return False
+        if abs(table_summary['wind_speed_analysis']['mean'] - speeds.mean()) > 0.01:
+            print("❌ Table mean differs from raw mean")
+            return False
+        if abs(table_summary['capacity_factor'] - raw_summary['capacity_factor']) > 1e-3:
+            print("❌ Table capacity factor differs from raw samples")
+            return False
+        if not np.isclose(wind_rose['frequencies'].sum(), 1.0):
+            print("❌ Wind rose frequencies do not sum to one")
+            return False
+        
+        # The configured site air density applies to both summaries
+        thin_air = {'air_density': 1.0}
+        thin_table = cached.summary(thin_air)
+        thin_raw = summarize_wind_stream([(speeds, directions)], thin_air)
+        if not (thin_table['capacity_factor'] < table_summary['capacity_factor']
+                and thin_raw['capacity_factor'] < raw_summary['capacity_factor']):
+            print("❌ Capacity factor ignores the configured air density")
+            return False
+        if not np.isclose(thin_table['power_density_w_m2'],
+                          table_summary['power_density_w_m2'] / 1.225):
+            print("❌ Power density ignores the configured air density")
+            return False
+        
+        print(f"✅ Frequency table cached and consistent "
+              f"(CF {table_summary['capacity_factor']:.3f})")
+        return True
+    except Exception as e:
+        print(f"❌ Frequency table error: {e}")
+        return False
+
+def test_array_store():
+    """Test columnar and memory-mapped storage round trips."""
+    print("\n🗄️  Testing array store...")
+    
+    try:
+        import tempfile
+        import numpy as np
+        from src.utils.array_store import (PYARROW_AVAILABLE, MemmapArrayStore,
+                                           load_columnar, save_columnar)
+        
+        rng = np.random.default_rng(42)
+        columns = {'wind_speed': rng.weibull(2.0, 1000) * 8.0,
+                   'wind_direction': rng.uniform(0, 360, 1000)}
+        population = rng.uniform(0, 2000, size=(20, 12, 2))
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_dir = Path(tmp_dir)
+            targets = [('npy', tmp_dir / 'wind'), ('npz', tmp_dir / 'wind.npz')]
+            if PYARROW_AVAILABLE:
+                targets.append(('parquet', tmp_dir / 'wind.parquet'))
+            
+            for file_format, path in targets:
+                loaded = load_columnar(save_columnar(columns, path, file_format))
+                if not all(np.array_equal(loaded[k], v) for k, v in columns.items()):
+                    print(f"❌ {file_format} round trip changed the data")
+                    return False
+            
+            if not isinstance(load_columnar(tmp_dir / 'wind')['wind_speed'], np.memmap):
+                print("❌ NPY columns are not memory-mapped")
+                return False
+            
+            sites = {'wind_speed': columns['wind_speed'][:3],
+                     'site': np.array(['north', 'south', 'east'], dtype=object)}
+            for file_format, path in targets:
+                target = path.with_name('sites' + path.suffix)
+                loaded = load_columnar(save_columnar(sites, target, file_format))
+                if list(loaded['site']) != list(sites['site']):
+                    print(f"❌ {file_format} round trip changed the string column")
+                    return False
+            
+            store = MemmapArrayStore(tmp_dir / 'store')
+            store.save('population', population)
+            stored = store.load('population')
+            stored_ok = stored.dtype == np.float32 and np.allclose(stored, population, atol=1e-3)
+            del loaded, stored  # release memory maps before cleanup (Windows)
+            if not stored_ok:
+                print("❌ Memmap store round trip failed")
+                return False
+        
+        print(f"✅ Columnar round trips passed ({', '.join(f for f, _ in targets)} + memmap)")
+        return True
+    except Exception as e:
+        print(f"❌ Array store error: {e}")
+        return False
+
+def test_batch_runner():
+    """Test the batch runner with a failing scenario in the manifest."""
+    print("\n📦 Testing batch runner...")
+    
+    try:
+        import json
+        import tempfile
+        from src.utils.batch_runner import BatchRunner
+        
+        class KillsWorker:
+            """Terminates the worker process that unpickles it."""
+            def __reduce__(self):
+                return os._exit, (1,)
+        
+        manifest = {
+            'defaults': {'ml': {'population_size': 8, 'generations': 2}},
+            'sites': {'site_a': {'weibull_k': 2.0, 'weibull_c': 8.0, 'n_points': 2000},
+                      'site_bad': {'path': 'does/not/exist.csv'}},
+            'scenarios': [
+                {'name': 'ok_small', 'site': 'site_a', 'n_turbines': 5},
+                {'name': 'missing_site', 'site': 'site_b', 'n_turbines': 5},
+                {'name': 'bad_site', 'site': 'site_bad', 'n_turbines': 5},
+                {'name': 'crash', 'site': 'site_a', 'n_turbines': 5, 'payload': KillsWorker()},
+                {'name': 'ok_wide', 'site': 'site_a', 'n_turbines': 8,
+                 'overrides': {'wind_farm': {'farm_width': 3000}}},
+            ],
+        }
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            runner = BatchRunner({}, output_dir=tmp_dir, n_workers=2)
+            report = runner.run(manifest, verbose=False)
+            summary_written = report['summary_path'].exists() and report['timing_path'].exists()
+            try:
+                # Standard JSON only: failed scenarios must not write NaN
+                def reject(token):
+                    raise ValueError(f"non-standard JSON token {token}")
+                json.loads(report['timing_path'].read_text(), parse_constant=reject)
+                timing_error = None
+            except ValueError as e:
+                timing_error = e
+            try:
+                runner.run({'scenarios': [{'site': 'site_a'}, {'name': 'scenario_0'}]},
+                           verbose=False)
+                duplicates_rejected = False
+            except ValueError:
+                duplicates_rejected = True
+        
+        statuses = dict(zip(report['summary']['name'], report['summary']['status']))
+        expected = {'ok_small': 'ok', 'missing_site': 'failed', 'bad_site': 'failed',
+                    'crash': 'failed', 'ok_wide': 'ok'}
+        if statuses != expected:
+            print(f"❌ Unexpected scenario statuses: {statuses}")
+            return False
+        if not summary_written:
+            print("❌ Batch reports were not written")
+            return False
+        if timing_error is not None:
+            print(f"❌ Batch timing report is not valid JSON: {timing_error}")
+            return False
+        if not duplicates_rejected:
+            print("❌ Duplicate scenario names were accepted")
+            return False
+        
+        print(f"✅ Batch ran {report['n_succeeded']}/{report['n_scenarios']} scenarios, "
+              f"bad site and dead worker isolated")
+        return True
+    except Exception as e:
+        print(f"❌ Batch runner error: {e}")
+        return False
+
+def test_import_time():
+    """Test that the compute packages start fast without the plotting stack."""
+    print("\n⏱️  Testing import time...")
+    
+    try:
+        import subprocess
+        import json
+        
+        # A fresh interpreter so modules already imported by other tests don't count
+        probe = (
+            "import json, sys, time\n"
+            "start = time.perf_counter()\n"
+            "import src.models, src.data, src.utils\n"
+            "elapsed = time.perf_counter() - start\n"
+            "heavy = [m for m in ('matplotlib', 'seaborn', 'plotly', 'pandas', 'pyarrow')"
+            " if m in sys.modules]\n"
+            "print(json.dumps({'elapsed': elapsed, 'heavy': heavy}))\n"
+        )
+        output = subprocess.run([sys.executable, '-c', probe], capture_output=True,
+                                text=True, check=True, cwd=Path(__file__).parent)
+        report = json.loads(output.stdout.strip().splitlines()[-1])
+        
+        budget_s = 3.0
+        if report['heavy']:
+            print(f"❌ Heavy modules loaded at import: {report['heavy']}")
+            return False
+        if report['elapsed'] >= budget_s:
+            print(f"❌ Import took {report['elapsed']:.2f} s (budget {budget_s} s)")
+            return False
+        
+        print(f"✅ Compute packages imported in {report['elapsed']:.2f} s without plotting/pandas")
+        return True
+    except Exception as e:
+        print(f"❌ Import time error: {e}")
+        return False
+
+def test_decimated_plots():
+    """Test min/max-preserving decimation and the bounded interactive figure."""
+    print("\n📉 Testing decimated interactive plots...")
+    
+    try:
+        import numpy as np
+        from src.visualization.decimation import decimate
+        from src.visualization.webgl_plots import create_decimated_wind_analysis
+        
+        rng = np.random.default_rng(42)
+        n = 200_000
+        speeds = 8.0 * rng.weibull(2.0, n)
+        directions = rng.uniform(0, 360, n)
+        
+        for method in ('minmax', 'lttb', 'minmax_lttb'):
+            x, y = decimate(np.arange(n), speeds, max_points=2000, method=method)
+            if len(y) > 2000:
+                print(f"❌ {method} kept {len(y)} points")
+                return False
+            if not np.all(np.diff(x) > 0) or x[0] != 0 or x[-1] != n - 1:
+                print(f"❌ {method} broke the time order or dropped the end points")
+                return False
+        
+        # The min/max pass must keep the extremes (gusts and lulls)
+        _, y = decimate(np.arange(n), speeds, max_points=2000, method='minmax')
+        if y.max() != speeds.max() or y.min() != speeds.min():
+            print("❌ Min/max decimation lost the extremes")
+            return False
+        
+        sizes = []
+        for length in (20_000, n):
+            fig = create_decimated_wind_analysis(speeds[:length], directions[:length],
+                                                 max_points=2000)
+            if fig.data[0].type != 'scattergl':
+                print(f"❌ Time series drawn as {fig.data[0].type}, not scattergl")
+                return False
+            sizes.append(len(fig.to_json()))
+        if sizes[1] >= 1.5 * sizes[0]:
+            print(f"❌ Figure size grows with the record: {sizes}")
+            return False
+        
+        print(f"✅ Decimated figure: {sizes[0] / 1024:.0f} KB at 20k samples, "
+              f"{sizes[1] / 1024:.0f} KB at {n // 1000}k samples")
+        return True
+    except Exception as e:
+        print(f"❌ Decimated plot error: {e}")
+        return False
+
+def test_render_pool():
+    """Test panel figures rendered through the worker pool and async save queue."""
+    print("\n🖼️  Testing render pool...")
+    
+    try:
+        import tempfile
+        import warnings
+        import numpy as np
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        from src.visualization.panels import FIGURES, build_figure, compute_panel_data
+        from src.visualization.render_pool import FigureRenderPool
+        from src.models.uncertainty import QuantileSketch, exceedance_table
+        
+        rng = np.random.default_rng(42)
+        wind_speeds = 8.0 * rng.weibull(2.0, 20_000)
+        wind_directions = rng.uniform(0, 360, 20_000)
+        optimization_data = {
+            'comparison': {'methods': ['Grid', 'GA'], 'power_outputs': [20.0, 22.0],
+                           'efficiencies': [0.9, 0.95]},
+            'history': {'generation': [0, 1, 2], 'best_fitness': [1.0, 2.0, 3.0],
+                        'mean_fitness': [0.5, 1.5, 2.5], 'std_fitness': [0.1, 0.1, 0.1]},
+        }
+        exceedance = exceedance_table(QuantileSketch().update(rng.normal(5e4, 3e3, 500)))
+        panels = compute_panel_data(wind_speeds, wind_directions,
+                                    rng.uniform(0, 1000, (8, 2)), optimization_data,
+                                    exceedance=exceedance)
+        if len(panels['time_series']['y']) > 5000:
+            print(f"❌ Panel time series kept {len(panels['time_series']['y'])} points")
+            return False
+        
+        config = {'dpi': 40, 'figure_size': [6, 4]}
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with FigureRenderPool(config, n_workers=1) as pool:
+                for name in FIGURES:
+                    pool.render(name, panels, Path(tmp_dir) / f"{name}.png")
+                fig, ax = plt.subplots()
+                ax.plot([0, 1], [0, 1])
+                pool.save_async(fig, Path(tmp_dir) / 'async.png')
+                paths = pool.wait()
+            
+            if len(paths) != len(FIGURES) + 1 or not all(Path(p).stat().st_size > 0
+                                                         for p in paths):
+                print(f"❌ Pool saved {len(paths)} of {len(FIGURES) + 1} figures")
+                return False
+            
+            # An exception inside the block drops the queued jobs
+            try:
+                with FigureRenderPool(config, n_workers=1) as pool:
+                    for i in range(4):
+                        pool.render('wind_rose', panels, Path(tmp_dir) / f"queued_{i}.png")
+                    raise KeyboardInterrupt
+            except KeyboardInterrupt:
+                pass
+            if pool._executor is not None:
+                print("❌ Pool workers still running after an exception")
+                return False
+            
+            # Errors surface from wait() instead of being lost in a worker
+            pool = FigureRenderPool(config, n_workers=0)
+            pool.render('no_such_figure', panels, Path(tmp_dir) / 'bad.png')
+            try:
+                pool.close()
+                print("❌ Unknown figure did not raise")
+                return False
+            except ValueError:
+                pass
+        
+        # The configured matplotlib style applies; unknown styles warn
+        name = next(iter(FIGURES))
+        styled = build_figure(name, panels, {**config, 'style': 'ggplot'})
+        facecolor = matplotlib.colors.to_hex(styled.axes[0].get_facecolor())
+        plt.close(styled)
+        if facecolor != matplotlib.colors.to_hex(plt.style.library['ggplot']['axes.facecolor']):
+            print("❌ Figure ignored the configured style")
+            return False
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            plt.close(build_figure(name, panels, {**config, 'style': 'no-such-style'}))
+        if not caught:
+            print("❌ Unknown style did not warn")
+            return False
+        
+        print(f"✅ Rendered {len(paths)} figures through the pool")
+        return True
+    except Exception as e:
+        print(f"❌ Render pool error: {e}")
+        return False
+
+def test_gradient_optimizer():
+    """Test analytic AEP gradients and gradient-based layout refinement."""
+    print("\n📐 Testing gradient optimizer...")
+    
+    try:
+        import numpy as np
+        from src.models.gradient_optimizer import (GaussianWakeModel, GradientLayoutOptimizer,
+                                                   spacing_constraints)
+        from src.models.optimizer import grid_layout
+        from src.models.power_calculations import weibull_wind_rose
+        
+        sectors = np.ones(16)
+        sectors[12] = 4.0
+        wind_rose = weibull_wind_rose(2.0, 8.0, sectors / sectors.sum())
+        rng = np.random.default_rng(42)
+        positions = rng.uniform(0, 2000, size=(8, 2))
+        
+        # Analytic gradients against central differences
+        model = GaussianWakeModel()
+        _, gradient = model.aep_and_gradient(positions, wind_rose)
+        step = 1e-3
+        numeric = np.zeros_like(positions)
+        for i in range(len(positions)):
+            for c in range(2):
+                offset = np.zeros_like(positions)
+                offset[i, c] = step
+                numeric[i, c] = (model.aep(positions + offset, wind_rose)
+                                 - model.aep(positions - offset, wind_rose)) / (2 * step)
+        if not np.allclose(gradient, numeric, rtol=1e-4, atol=1e-5):
+            print("❌ AEP gradient differs from central differences")
+            return False
+        
+        values, jacobian = spacing_constraints(positions, 300.0)
+        flat = positions.ravel()
+        numeric_jacobian = np.column_stack([
+            (spacing_constraints((flat + step * e).reshape(-1, 2), 300.0)[0]
+             - spacing_constraints((flat - step * e).reshape(-1, 2), 300.0)[0]) / (2 * step)
+            for e in np.eye(flat.size)])
+        if not np.allclose(jacobian, numeric_jacobian, atol=1e-8):
+            print("❌ Spacing constraint Jacobian differs from central differences")
+            return False
+        
+        # Refinement improves a grid layout and keeps the spacing constraint
+        start = grid_layout(16, 2000, 2000)
+        for method in ('SLSQP', 'L-BFGS-B'):
+            refiner = GradientLayoutOptimizer(gradient_config={'method': method})
+            # Every smooth-model AEP goes through aep_and_gradient
+            calls = []
+            evaluate = refiner.smooth_model.aep_and_gradient
+            refiner.smooth_model.aep_and_gradient = (
+                lambda *args, **kwargs: calls.append(1) or evaluate(*args, **kwargs))
+            result = refiner.optimize(wind_rose, start)
+            best = result['best_positions']
+            if result['evaluations'] != len(calls):
+                print(f"❌ {method} reported {result['evaluations']} evaluations "
+                      f"but ran {len(calls)}")
+                return False
+            if not result['accepted'] or result['best_aep_mwh'] <= result['initial_aep_mwh']:
+                print(f"❌ {method} did not improve the grid layout: {result['message']}")
+                return False
+            if spacing_constraints(best, 300.0)[0].min() < -1e-4:
+                print(f"❌ {method} layout violates the turbine spacing")
+                return False
+            if not np.all((best >= 0) & (best <= 2000)):
+                print(f"❌ {method} layout leaves the farm")
+                return False
+        
+        print(f"✅ Refined grid layout {result['initial_aep_mwh']:.0f} -> "
+              f"{result['best_aep_mwh']:.0f} MWh/yr in {result['evaluations']} evaluations")
+        return True
+    except Exception as e:
+        print(f"❌ Gradient optimizer error: {e}")
+        return False
+
+def test_surrogate_screening():
+    """Test surrogate features, online training and GA pre-screening."""
+    print("\n🔮 Testing surrogate screening...")
+    
+    try:
+        import numpy as np
+        from src.models.optimizer import GeneticLayoutOptimizer, layout_fitness
+        from src.models.surrogate import SurrogateFitnessModel
+        
+        wind_rose = seeded_wind_rose(n_samples=5000, direction_std=45.0)
+        rng = np.random.default_rng(42)
+        
+        surrogate = SurrogateFitnessModel(wind_rose, {'warmup': 10})
+        layouts = rng.uniform(0, 2000, size=(30, 20, 2))
+        features = surrogate.features(layouts)
+        expected_shape = (30, 16 + 2 * len(wind_rose['directions']) + 1)
+        if features.shape != expected_shape or not np.all(np.isfinite(features)):
+            print(f"❌ Surrogate features have shape {features.shape}, expected "
+                  f"{expected_shape}, or are not finite")
+            return False
+        
+        optimizer = GeneticLayoutOptimizer(
+            {'farm_width': 2000, 'farm_height': 2000},
+            {'population_size': 20, 'generations': 8, 'surrogate_screening': True,
+             'surrogate_warmup': 40, 'surrogate_fraction': 0.25})
+        result = optimizer.optimize(wind_rose, n_turbines=15)
+        stats = result['surrogate']
+        
+        if stats['screened_out'] == 0 or not 0 < stats['fraction_saved'] < 1:
+            print(f"❌ Screening saved {stats['fraction_saved']:.0%} of exact evaluations")
+            return False
+        if stats['n_predictions'] == 0 or not np.isfinite(stats['mae_mwh']):
+            print("❌ Surrogate made no finite predictions")
+            return False
+        # The reported best must be an exact score, never a prediction
+        exact = layout_fitness(result['best_positions'][None], optimizer.wake_model, wind_rose,
+                               optimizer.min_distance,
+                               optimizer.wake_model.ideal_aep(1, wind_rose))[0]
+        if not np.isclose(result['best_fitness'], exact):
+            print(f"❌ Best fitness {result['best_fitness']:.1f} is not the exact {exact:.1f}")
+            return False
+        
+        print(f"✅ Screening saved {stats['fraction_saved']:.0%} of exact evaluations "
+              f"(surrogate MAPE {stats['mape']:.2%})")
+        return True
+    except Exception as e:
+        print(f"❌ Surrogate screening error: {e}")
+        return False
+
+def test_rl_environment():
+    """Test the vectorized placement environment against full AEP scoring."""
+    print("\n🎮 Testing RL environment...")
+    
+    try:
+        import numpy as np
+        from src.models.power_calculations import HOURS_PER_YEAR
+        from src.models.rl_environment import VectorizedPlacementEnv
+        
+        wind_rose = seeded_wind_rose(seed=3, direction_std=45.0)
+        env = VectorizedPlacementEnv(4, wind_rose, rl_config={'n_turbines': 8})
+        obs, info = env.reset(seed=0)
+        if obs.shape != (4,) + env.observation_shape or not info['action_mask'].all():
+            print(f"❌ Reset returned observations of shape {obs.shape} or a masked action")
+            return False
+        
+        returns = np.zeros(4)
+        for step in range(8):
+            actions = env.sample_actions()
+            if step == 2:
+                actions[0] = -1  # invalid action
+            obs, rewards, terminated, truncated, info = env.step(actions)
+            returns += rewards
+            if step == 2 and rewards[0] != -1.0:
+                print(f"❌ Invalid action rewarded {rewards[0]} instead of the penalty")
+                return False
+        if not terminated[1:].all() or terminated[0]:
+            print(f"❌ Unexpected episode ends: {terminated}")
+            return False
+        
+        for e, positions in info['final_positions'].items():
+            exact = env.wake_model.calculate_aep(positions, wind_rose)
+            reward_aep = returns[e] / env.reward_scale * HOURS_PER_YEAR / 1000.0
+            if not np.isclose(info['final_aep_mwh'][e], exact, rtol=1e-9):
+                print(f"❌ Env {e} final AEP differs from full scoring")
+                return False
+            if not np.isclose(reward_aep, exact, rtol=1e-9):
+                print(f"❌ Env {e} rewards do not sum to its AEP")
+                return False
+            distances = np.hypot(*(positions[:, None] - positions[None]).reshape(-1, 2).T)
+            if distances[np.eye(8).ravel() == 0].min() < env.config['min_turbine_distance']:
+                print(f"❌ Env {e} placed turbines closer than the minimum distance")
+                return False
+        if env.counts[1:].sum() != 0 or env.counts[0] != 7:
+            print(f"❌ Unexpected turbine counts after the episodes: {env.counts}")
+            return False
+        
+        print(f"✅ RL env rewards match full AEP scoring "
+              f"({info['final_aep_mwh'][1]:.0f} MWh/yr for 8 turbines)")
+        return True
+    except Exception as e:
+        print(f"❌ RL environment error: {e}")
+        return False
+
+def test_incremental_aep():
+    """Test incremental delta-AEP moves against full re-evaluation."""
+    print("\n🔁 Testing incremental AEP evaluator...")
+    
+    try:
+        import numpy as np
+        from src.models.incremental_aep import IncrementalAEPEvaluator
+        
+        wind_rose = seeded_wind_rose(seed=5, direction_std=45.0)
+        rng = np.random.default_rng(5)
+        evaluator = IncrementalAEPEvaluator(rng.uniform(0, 1500, (12, 2)), wind_rose)
+        model = evaluator.wake_model
+        
+        for step in range(150):
+            before = evaluator.aep
+            kind = rng.choice(['move', 'add', 'remove'], p=[0.6, 0.2, 0.2])
+            if kind == 'move':
+                delta = evaluator.move(rng.integers(evaluator.n_turbines),
+                                       rng.uniform(0, 1500, 2))
+            elif kind == 'add':
+                delta = evaluator.add(rng.uniform(0, 1500, 2))
+            else:
+                delta = evaluator.remove(rng.integers(evaluator.n_turbines))
+            
+            if step % 3 == 0:
+                evaluator.rollback()
+                if evaluator.aep != before:
+                    print(f"❌ Rollback of a {kind} changed the AEP")
+                    return False
+                continue
+            evaluator.commit()
+            exact = model.calculate_aep(evaluator.positions, wind_rose, method='exact')
+            if not np.isclose(evaluator.aep, exact, rtol=1e-8):
+                print(f"❌ Incremental AEP {evaluator.aep:.3f} differs from exact {exact:.3f} "
+                      f"after a {kind}")
+                return False
+            if not np.isclose(before + delta, exact, rtol=1e-8):
+                print(f"❌ Delta AEP of a {kind} is off by {before + delta - exact:.3f} MWh/yr")
+                return False
+        
+        print(f"✅ Incremental AEP matches full re-evaluation "
+              f"({evaluator.n_turbines} turbines, {evaluator.aep:.0f} MWh/yr)")
+        return True
+    except Exception as e:
+        print(f"❌ Incremental AEP error: {e}")
+        return False
+
+def test_power_curve_lookup():
+    """Test the lookup-table power curve against the parametric curve."""
+    print("\n📈 Testing lookup-table power curve...")
+    
+    try:
+        import tempfile
+        import numpy as np
+        from src.models.power_calculations import PowerCurve, power_curve
+        
+        speeds = np.random.default_rng(0).uniform(-1.0, 30.0, 200000)
+        speeds[:4] = [np.nan, 3.0, 12.0, 25.0]
+        curve = PowerCurve.from_config()
+        power = curve(speeds)
+        if np.abs(power - power_curve(speeds)).max() >= 0.01:
+            print(f"❌ Lookup curve off by {np.abs(power - power_curve(speeds)).max():.3f} kW")
+            return False
+        if power[0] != 0.0 or power[3] != 0.0:
+            print("❌ Lookup curve produces power for NaN or cut-out speeds")
+            return False
+        
+        # Air density: the curve at rho is the reference curve at u (rho/rho0)^(1/3)
+        thin = PowerCurve.from_config({'air_density': 1.0})
+        factor = (1.0 / 1.225) ** (1.0 / 3.0)
+        inside = speeds[4:][(speeds[4:] > 0) & (speeds[4:] < 24.0)]
+        if np.abs(thin(inside) - power_curve(inside * factor)).max() >= 0.5:
+            print("❌ Air density correction differs from the scaled reference curve")
+            return False
+        
+        # Tabulated curve from a CSV file
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'power_curve.csv'
+            table = np.arange(3.0, 25.5, 0.5)
+            np.savetxt(path, np.column_stack([table, power_curve(table, cut_out_speed=np.inf)]),
+                       delimiter=',', header='speed,power', comments='')
+            tabulated = PowerCurve.from_config({'power_curve_file': str(path)})
+        if not np.allclose(tabulated(table[:-1]), power_curve(table[:-1])):
+            print("❌ Tabulated curve differs from its CSV points")
+            return False
+        if tabulated.rated_power != 2000.0:
+            print(f"❌ Tabulated rated power is {tabulated.rated_power} kW")
+            return False
+        
+        cf = curve.capacity_factor(8.0 * np.random.default_rng(1).weibull(2.0, 100000))
+        if not 0.2 < cf < 0.5:
+            print(f"❌ Implausible capacity factor {cf:.3f}")
+            return False
+        
+        print(f"✅ Lookup power curve matches parametric curve (capacity factor {cf:.3f})")
+        return True
+    except Exception as e:
+        print(f"❌ Power curve lookup error: {e}")
+        return False
+
+def test_aep_uncertainty():
+    """Test the Monte-Carlo P50/P90 engine and its quantile sketch."""
+    print("\n🎲 Testing Monte-Carlo AEP uncertainty...")
+    
+    try:
+        import numpy as np
+        from src.models.power_calculations import weibull_wind_rose
+        from src.models.uncertainty import MonteCarloAEPAnalysis, QuantileSketch
+        from src.models.wake_models import JensenWakeModel
+        
+        # Streaming sketch vs exact quantiles
+        values = np.random.default_rng(0).normal(1e5, 5e3, 20000)
+        sketch = QuantileSketch(1e-4)
+        for chunk in np.array_split(values, 13):
+            sketch.update(chunk)
+        levels = [0.01, 0.1, 0.5, 0.9, 0.99]
+        exact = np.quantile(values, levels, method='lower')
+        if np.any(np.abs(sketch.quantile(levels) / exact - 1) > 1e-4):
+            print("❌ Sketch quantiles outside the 1e-4 relative accuracy")
+            return False
+        if not np.isclose(sketch.mean, values.mean()) or not np.isclose(sketch.std, values.std()):
+            print("❌ Sketch mean or standard deviation is wrong")
+            return False
+        
+        sectors = np.array([1, 1, 2, 3, 5, 8, 5, 3, 2, 1, 1, 1], dtype=float)
+        layout = np.random.default_rng(1).uniform(0, 1500, (8, 2))
+        settings = {'n_samples': 300, 'batch_size': 64}
+        analysis = MonteCarloAEPAnalysis(sectors, 2.0, 8.0, uncertainty_config=settings)
+        result = analysis.run(layout)
+        
+        # Zero draws reproduce the deterministic Weibull-rose AEP
+        deterministic = JensenWakeModel().calculate_aep(
+            layout, weibull_wind_rose(2.0, 8.0, sectors))
+        if not np.isclose(result['nominal_aep_mwh'], deterministic, rtol=1e-9):
+            print(f"❌ Nominal AEP {result['nominal_aep_mwh']:.1f} differs from "
+                  f"the deterministic {deterministic:.1f}")
+            return False
+        
+        # Per-sample draws: results do not depend on the batching
+        rebatched = MonteCarloAEPAnalysis(sectors, 2.0, 8.0,
+                                          uncertainty_config={**settings, 'batch_size': 7})
+        if rebatched.run(layout)['exceedance'] != result['exceedance']:
+            print("❌ Exceedance levels depend on the batch size")
+            return False
+        
+        table = result['exceedance']
+        if table['labels'][:3] != ['P50', 'P75', 'P90'] or np.any(np.diff(table['aep_mwh']) > 0):
+            print(f"❌ Exceedance table not ordered P50 > P75 > P90: {table['labels']}")
+            return False
+        if len(table['curve']['aep_mwh']) != 99:
+            print(f"❌ Exceedance curve has {len(table['curve']['aep_mwh'])} points")
+            return False
+        
+        p50, p90 = table['aep_mwh'][0], table['aep_mwh'][2]
+        print(f"✅ P50 {p50:.0f} / P90 {p90:.0f} MWh/yr from {result['n_samples']} samples")
+        return True
+    except Exception as e:
+        print(f"❌ AEP uncertainty error: {e}")
+        return False
+
+def test_wind_atlas():
+    """Test interpolated and bulk queries of the memory-mapped wind atlas."""
+    print("\n🗺️  Testing memory-mapped wind atlas...")
+    
+    try:
+        import tempfile
+        import numpy as np
+        from src.data.wind_atlas import WindAtlas
+        from src.models.power_calculations import weibull_wind_rose
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            # 10 x 7 grid split over several 4-cell tiles
+            rng = np.random.default_rng(0)
+            k = rng.uniform(1.5, 3.0, (10, 7, 8))
+            c = rng.uniform(5.0, 10.0, (10, 7, 8))
+            freq = rng.uniform(0.5, 2.0, (10, 7, 8))
+            atlas = WindAtlas.create(tmp, (10, 7), origin=(100.0, 200.0),
+                                     spacing=(50.0, 25.0), n_sectors=8, tile_size=4)
+            atlas.write(0, 0, k[:6], c[:6], freq[:6])
+            atlas.write(6, 0, k[6:], c[6:], freq[6:])
+            atlas.flush()
+            del atlas
+            
+            atlas = WindAtlas(tmp)
+            if not all(isinstance(a, np.memmap) for a in atlas._fields.values()):
+                print("❌ Atlas fields are not memory-mapped")
+                return False
+            
+            # Cell centres are exact, midpoints average the neighbours
+            centre = atlas.query(100.0 + 3 * 50.0, 200.0 + 5 * 25.0)
+            mid = atlas.query(100.0 + 3.5 * 50.0, 200.0 + 5 * 25.0)
+            if (not np.allclose(centre['weibull_c'][0], c[5, 3], rtol=1e-6)
+                    or not np.allclose(centre['sector_frequencies'][0],
+                                       freq[5, 3] / freq[5, 3].sum(), rtol=1e-6)):
+                print("❌ Cell-centre query differs from the stored climate")
+                return False
+            if not np.allclose(mid['weibull_k'][0], (k[5, 3] + k[5, 4]) / 2, rtol=1e-6):
+                print("❌ Midpoint query does not average the neighbouring cells")
+                return False
+            if not np.all(np.isnan(atlas.query(0.0, 0.0)['weibull_k'])):
+                print("❌ Query outside the atlas returned values")
+                return False
+            
+            # Bulk roses equal single-site roses and the Weibull rose builder
+            x = rng.uniform(100.0, 400.0, 50)
+            y = rng.uniform(200.0, 425.0, 50)
+            roses = atlas.wind_roses(x, y)
+            single = atlas.wind_rose(x[7], y[7])
+            climate = atlas.query(x[7], y[7])
+            reference = weibull_wind_rose(climate['weibull_k'][0], climate['weibull_c'][0],
+                                          climate['sector_frequencies'][0])
+            if roses['frequencies'].shape != (50, 8, 30):
+                print(f"❌ Bulk roses have shape {roses['frequencies'].shape}")
+                return False
+            if (not np.allclose(single['frequencies'], roses['frequencies'][7])
+                    or not np.allclose(reference['frequencies'], single['frequencies'])):
+                print("❌ Bulk, single-site and Weibull roses disagree")
+                return False
+            if not np.allclose(roses['frequencies'].sum(axis=(1, 2)), 1.0, atol=1e-3):
+                print("❌ Wind rose frequencies do not sum to one")
+                return False
+            
+            cf = atlas.capacity_factors(x, y)
+            speeds, _ = atlas.sample_time_series(x[0], y[0], 1000, random_state=0)
+            del atlas
+            if not np.all((cf > 0) & (cf < 1)) or len(speeds) != 1000:
+                print("❌ Capacity factors outside (0, 1) or wrong time series length")
+                return False
+        
+        print(f"✅ Wind atlas queries consistent (mean capacity factor {cf.mean():.3f})")
+        return True
+    except Exception as e:
+        print(f"❌ Wind atlas error: {e}")
+        return False
+
+def test_stage_profiler():
+    """Test stage timing, the JSON report and timed figure rendering."""
+    print("\n⏱️  Testing stage profiler...")
+    
+    try:
+        import json
+        import tempfile
+        import time
+        import tracemalloc
+        import numpy as np
+        import matplotlib
+        matplotlib.use('Agg')
+        import matplotlib.pyplot as plt
+        from src.utils import profiling
+        from src.utils.profiling import StageProfiler
+        from src.visualization.render_pool import FigureRenderPool
+        
+        # Disabled profiling records nothing and shares one no-op context
+        disabled = StageProfiler()
+        with disabled.stage('a'):
+            pass
+        if disabled.records or disabled.stage('a') is not disabled.stage('b'):
+            print("❌ Disabled profiler recorded stages")
+            return False
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            profiler = StageProfiler({'trace_memory': True, 'cprofile': ['outer'],
+                                      'output_dir': tmp}, enabled=True)
+            
+            @profiler.profile('decorated')
+            def allocate():
+                return np.ones(2_000_000).sum()
+            
+            with profiler.stage('outer'):
+                with profiler.stage('inner'):
+                    time.sleep(0.02)
+                allocate()
+                with FigureRenderPool({'dpi': 20}, n_workers=0, timed=True) as pool:
+                    fig, ax = plt.subplots()
+                    ax.plot([0, 1], [0, 1])
+                    pool.save_async(fig, Path(tmp) / 'figure.png')
+                for name, timing in pool.timings.items():
+                    profiler.record(name, **timing)
+            try:
+                with profiler.stage('failing'):
+                    raise KeyError('boom')
+            except KeyError:
+                pass
+            
+            stages = {r['stage']: r for r in profiler.records}
+            if set(stages) != {'outer/inner', 'outer/decorated', 'outer/figure',
+                               'outer', 'failing'}:
+                print(f"❌ Unexpected stages recorded: {sorted(stages)}")
+                return False
+            if not (stages['outer']['wall_s'] >= stages['outer/inner']['wall_s'] >= 0.02):
+                print("❌ Stage wall times are not nested")
+                return False
+            if not (stages['outer']['heap_peak_mb'] >= stages['outer/decorated']['heap_peak_mb']
+                    > 10):
+                print("❌ Heap peaks miss the 16 MB allocation or are not nested")
+                return False
+            if stages['failing']['status'] != 'error':
+                print("❌ Failing stage not marked as an error")
+                return False
+            if not Path(stages['outer']['cprofile']).exists():
+                print("❌ cProfile dump of the selected stage missing")
+                return False
+            
+            report = json.loads(profiler.save().read_text())
+            table = profiler.format_table().splitlines()
+            if len(report['stages']) != 5 or report['total_wall_s'] <= 0.02:
+                print(f"❌ Timing report has {len(report['stages'])} stages")
+                return False
+            if table[1].split()[0] != 'outer' or table[2].split()[0] != 'inner':
+                print("❌ Stage table is not in nesting order")
+                return False
+        
+        # Without tracemalloc.reset_peak (Python 3.8) peaks come from cleared traces
+        profiling._HAS_RESET_PEAK = False
+        try:
+            fallback = StageProfiler({'trace_memory': True}, enabled=True)
+            with fallback.stage('outer'):
+                with fallback.stage('inner'):
+                    np.ones(2_000_000).sum()
+            peaks = {r['stage']: r['heap_peak_mb'] for r in fallback.records}
+        finally:
+            profiling._HAS_RESET_PEAK = hasattr(tracemalloc, 'reset_peak')
+        if not 10 < peaks['outer/inner'] <= peaks['outer']:
+            print(f"❌ Heap peaks without reset_peak are wrong: {peaks}")
+            return False
+        
+        print(f"✅ Profiled {len(stages)} stages ({report['total_wall_s']:.3f} s total)")
+        return True
+    except Exception as e:
+        print(f"❌ Stage profiler error: {e}")
+        return False
+
+def test_layout_sampling():
+    """Test batched Poisson-disk layouts and exclusion zones in the optimizers."""
+    print("\n🎯 Testing Poisson-disk layout sampler...")
+    
+    try:
+        import warnings
+        import numpy as np
+        from scipy.spatial.distance import pdist
+        from src.models.layout_sampling import (PoissonDiskLayoutSampler, exclusion_distance,
+                                                points_in_polygons)
+        from src.models.optimizer import GeneticLayoutOptimizer, exclusion_penalty
+        from src.models.gradient_optimizer import GradientLayoutOptimizer
+        
+        zone = [[500.0, 500.0], [1500.0, 600.0], [1200.0, 1400.0]]
+        config = {'farm_width': 2000, 'farm_height': 2000, 'min_turbine_distance': 300,
+                  'exclusion_zones': [zone]}
+        rng = np.random.default_rng(0)
+        population = PoissonDiskLayoutSampler(config).sample_population(20, 25, rng)
+        closest = min(pdist(layout).min() for layout in population)
+        
+        if population.shape != (20, 25, 2) or not np.all((population >= 0) & (population <= 2000)):
+            print(f"❌ Population has shape {population.shape} or leaves the farm")
+            return False
+        if closest < 300 - 1e-6:
+            print(f"❌ Sampled turbines only {closest:.1f} m apart")
+            return False
+        if points_in_polygons(population, [zone]).any():
+            print("❌ Sampled turbines inside the exclusion zone")
+            return False
+        
+        # Too dense warns and falls back to uniform; malformed zones are errors
+        ga = GeneticLayoutOptimizer(config, {'population_size': 10})
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            dense = ga.initial_population(200, rng)
+        if dense.shape != (10, 200, 2) or not caught:
+            print("❌ Infeasible density did not fall back with a warning")
+            return False
+        try:
+            PoissonDiskLayoutSampler({'exclusion_zones': [[[0, 0], [1, 1]]]})
+            print("❌ A two-vertex exclusion zone was accepted")
+            return False
+        except ValueError:
+            pass
+        
+        # The GA penalizes turbines in the zone; refinement moves them out
+        # (turbines on the boundary are feasible)
+        grid = np.linspace(100.0, 1900.0, 4)
+        start = np.array([[x, y] for x in grid for y in grid])
+        inside = int((exclusion_distance(start, [zone]) < 0).sum())
+        penalty = exclusion_penalty(start[None], [zone], 300.0)[0]
+        if inside == 0 or penalty < inside:
+            print(f"❌ {inside} turbines in the zone only penalized by {penalty:.2f}")
+            return False
+        if exclusion_penalty(start[None] + 2000.0, [zone], 300.0)[0] != 0:
+            print("❌ Turbines outside the zone were penalized")
+            return False
+        wind_rose = seeded_wind_rose()
+        refined = GradientLayoutOptimizer(config, {'max_iterations': 30}).optimize(
+            wind_rose, start)
+        depth = -exclusion_distance(refined['best_positions'], [zone]).min()
+        if depth > 1e-3:
+            print(f"❌ Refined layout has a turbine {depth:.1f} m inside the exclusion zone")
+            return False
+        
+        print(f"✅ Poisson-disk layouts valid (closest pair {closest:.0f} m), "
+              f"exclusion zone penalized and refined out")
+        return True
+    except Exception as e:
+        print(f"❌ Layout sampling error: {e}")
+        return False
+
+def test_parallel_aep():
+    """Test sector-parallel AEP over shared memory."""
+    print("\n🧭 Testing sector-parallel AEP...")
+    
+    try:
+        import numpy as np
+        from multiprocessing import shared_memory
+        from src.models.parallel_aep import SectorParallelAEP
+        from src.models.power_calculations import weibull_wind_rose
+        from src.models.wake_models import JensenWakeModel
+        
+        rng = np.random.default_rng(0)
+        rose = weibull_wind_rose(rng.uniform(1.8, 2.4, 12), rng.uniform(7.0, 9.0, 12),
+                                 rng.uniform(0.5, 2.0, 12))
+        model = JensenWakeModel(pruning_threshold=100)
+        small = rng.uniform(0.0, 2000.0, (30, 2))
+        large = rng.uniform(0.0, 6000.0, (150, 2))
+        
+        with SectorParallelAEP(rose, model, n_workers=1) as serial:
+            expected = [serial.calculate_aep(small), serial.calculate_aep(large)]
+            sectors = serial.sector_aep(large)
+        if sectors.shape != (12,):
+            print(f"❌ Sector AEP has shape {sectors.shape}")
+            return False
+        if (not np.isclose(expected[0], model.calculate_aep(small, rose), rtol=1e-12)
+                or not np.isclose(expected[1], model.calculate_aep(large, rose), rtol=1e-12)):
+            print("❌ Sector sums differ from JensenWakeModel.calculate_aep")
+            return False
+        
+        # Bit-identical for any worker count, also after the layout block grows
+        for n_workers in (2, 5):
+            with SectorParallelAEP(rose, model, n_workers=n_workers) as parallel:
+                results = [parallel.calculate_aep(small), parallel.calculate_aep(large)]
+                names = [block.name for block in parallel._blocks.values()]
+            if results != expected:
+                print(f"❌ {n_workers} workers: {results} != {expected}")
+                return False
+            for name in names:
+                try:
+                    shared_memory.SharedMemory(name=name).close()
+                    print(f"❌ Shared block {name} not released")
+                    return False
+                except FileNotFoundError:
+                    pass
+        
+        print(f"✅ Sector-parallel AEP identical on 1, 2 and 5 workers "
+              f"({expected[1]:,.0f} MWh/yr)")
+        return True
+    except Exception as e:
+        print(f"❌ Sector-parallel AEP error: {e}")
+        return False
+
 def main():
     """Run all tests."""
     print("🚀 AI Wind Farm Optimizer Prototype - Test Suite")
@@ -90,7 +1297,28 @@ def main():
         test_imports,
         test_config_loader,
         test_data_generation,
-        test_visualization
+        test_visualization,
+        test_wake_model,
+        test_spatial_index,
+        test_genetic_optimizer,
+        test_checkpoint_resume,
+        test_streaming_wind_stats,
+        test_frequency_table,
+        test_array_store,
+        test_batch_runner,
+        test_import_time,
+        test_decimated_plots,
+        test_render_pool,
+        test_gradient_optimizer,
+        test_surrogate_screening,
+        test_rl_environment,
+        test_incremental_aep,
+        test_power_curve_lookup,
+        test_aep_uncertainty,
+        test_wind_atlas,
+        test_stage_profiler,
+        test_layout_sampling,
+        test_parallel_aep
     ]
     
     passed = 0